@@ -1,9 +1,8 @@
-import re
 import logging
-import numpy as np
-import pandas as pd
-import os
-from utils.nlp_utils import calculate_similarity, preprocess_text, remove_stopwords, lemmatize_text
+from utils.nlp_utils import (calculate_doc_similarity, preprocess_text, remove_stopwords, lemmatize_text,
+                             load_nlp, TextVector, NLP_LOCK)
+from utils.lexical_utils import LexicalScorer
+from utils.near_duplicates import NearDuplicateIndex
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -12,7 +11,10 @@ logger = logging.getLogger(__name__)
 class SkillsAnalyzer:
     """Class to analyze and score resumes based on job requirements."""
     
-    def __init__(self, job_description=None, required_skills=None, preferred_skills=None):
+    SIMILARITY_BACKENDS = ('spacy', 'lexical')
+    
+    def __init__(self, job_description=None, required_skills=None, preferred_skills=None, similarity_backend='spacy',
+                 skill_taxonomy=None):
         """
         Initialize SkillsAnalyzer.
         
@@ -20,11 +22,29 @@ class SkillsAnalyzer:
             job_description (str, optional): Job description text. Defaults to None.
             required_skills (list, optional): List of required skills. Defaults to None.
             preferred_skills (list, optional): List of preferred skills. Defaults to None.
+            similarity_backend (str, optional): 'spacy' for semantic similarity or 'lexical'
+                for sparse TF-IDF/BM25 scoring. Defaults to 'spacy'.
+            skill_taxonomy (SkillTaxonomy, optional): Hierarchical taxonomy giving partial credit
+                for related and more specific skills. Defaults to None (exact matches only).
         """
         self.job_description = job_description
         self.required_skills = required_skills if required_skills else []
         self.preferred_skills = preferred_skills if preferred_skills else []
         
+        self.similarity_backend = None
+        self.set_similarity_backend(similarity_backend)
+        self.lexical_scorer = None
+        
+        # Processed job description vector, computed once per job description
+        self._job_vector = None
+        
+        # Taxonomy credit rows per skill list, gathered once and reused for every candidate
+        self.skill_taxonomy = skill_taxonomy
+        self._requirement_matrices = {}
+        
+        # Hard requirements checked before any NLP work
+        self.knockout_rules = []
+        
         # Weights for scoring
         self.weights = {
             'required_skills': 0.4,
@@ -41,6 +61,8 @@ class SkillsAnalyzer:
             job_description (str): Job description text
         """
         self.job_description = job_description
+        self.lexical_scorer = None
+        self._job_vector = None
     
     def set_required_skills(self, required_skills):
         """
@@ -60,6 +82,180 @@ class SkillsAnalyzer:
         """
         self.preferred_skills = preferred_skills
     
+    def set_skill_taxonomy(self, skill_taxonomy):
+        """
+        Set the taxonomy used for partial skill credit.
+        
+        Args:
+            skill_taxonomy (SkillTaxonomy): Loaded taxonomy, or None for exact matches only
+        """
+        self.skill_taxonomy = skill_taxonomy
+        self._requirement_matrices = {}
+    
+    def set_similarity_backend(self, similarity_backend):
+        """
+        Set the backend used for experience and education relevance.
+        
+        Args:
+            similarity_backend (str): 'spacy' or 'lexical'
+        """
+        if similarity_backend not in self.SIMILARITY_BACKENDS:
+            raise ValueError(f"Unsupported similarity backend: {similarity_backend}")
+        self.similarity_backend = similarity_backend
+    
+    def add_knockout_rule(self, rule_type, value):
+        """
+        Add a knock-out rule evaluated right after skill extraction.
+        
+        Args:
+            rule_type (str): 'required_skill' (value: skill or list of skills that must all be present),
+                'min_required_matched' (value: minimum number of required skills matched) or
+                'min_required_percent' (value: minimum percentage of required skills matched).
+                Rules count exact matches only (a taxonomy alias of the skill counts as exact),
+                so partial taxonomy credit never changes them
+            value: Rule parameter as described above
+        """
+        if rule_type not in ('required_skill', 'min_required_matched', 'min_required_percent'):
+            raise ValueError(f"Unsupported knock-out rule: {rule_type}")
+        
+        if rule_type == 'required_skill' and isinstance(value, str):
+            value = [value]
+        
+        self.knockout_rules.append({'type': rule_type, 'value': value})
+    
+    def clear_knockout_rules(self):
+        """Remove all knock-out rules."""
+        self.knockout_rules = []
+    
+    def check_knockout_rules(self, candidate_skills, skills_match=None):
+        """
+        Evaluate the knock-out rules against a candidate's extracted skills.
+        
+        Args:
+            candidate_skills (list): List of candidate skills
+            skills_match (dict, optional): Precomputed result of calculate_skills_match. Defaults to None.
+            
+        Returns:
+            str: Reason for the knock-out, or None if the candidate passes all rules
+        """
+        if not self.knockout_rules:
+            return None
+        
+        if skills_match is None:
+            skills_match = self.calculate_skills_match(candidate_skills)
+        
+        candidate_skills_lower = set(skill.lower() for skill in candidate_skills or [])
+        
+        for rule in self.knockout_rules:
+            if rule['type'] == 'required_skill':
+                missing = [skill for skill in rule['value'] if skill.lower() not in candidate_skills_lower]
+                if missing:
+                    return f"Missing mandatory skills: {', '.join(missing)}"
+            elif rule['type'] == 'min_required_matched':
+                matched = len(skills_match['matched_required'])
+                if matched < rule['value']:
+                    return f"Matched {matched} required skills, at least {rule['value']} needed"
+            elif rule['type'] == 'min_required_percent':
+                percent = skills_match.get('required_match_percent', 0)
+                if percent < rule['value']:
+                    return f"Matched {percent}% of required skills, at least {rule['value']}% needed"
+        
+        return None
+    
+    def fit_lexical_model(self, resumes, method='tfidf'):
+        """
+        Fit the sparse lexical model on the candidate corpus.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            method (str, optional): 'tfidf' or 'bm25'. Defaults to 'tfidf'.
+            
+        Returns:
+            LexicalScorer: The fitted scorer
+        """
+        self.lexical_scorer = LexicalScorer(method=method).fit(self._lexical_corpus(resumes))
+        return self.lexical_scorer
+    
+    def _lexical_corpus(self, resumes):
+        """Collect the job description and every resume's experience and education texts."""
+        corpus = [self.job_description] if self.job_description else []
+        for resume in resumes:
+            corpus.append(self._join_section(resume.get('experience', [])))
+            corpus.append(self._join_section(resume.get('education', [])))
+        return corpus
+    
+    def _join_section(self, section):
+        """Join a resume section given as a list of entries into one string."""
+        if isinstance(section, list):
+            return ' '.join(section)
+        return section or ""
+    
+    def _calculate_lexical_score(self, text):
+        """
+        Calculate lexical relevance of a single text against the job description.
+        
+        Without a model from fit_lexical_model, a model is fitted on the job description
+        and this text for this call only, so terms outside the job description still
+        count against the text.
+        
+        Args:
+            text (str): Resume section text
+            
+        Returns:
+            float: Relevance score between 0 and 100
+        """
+        scorer = self.lexical_scorer
+        if scorer is None:
+            try:
+                scorer = LexicalScorer().fit([self.job_description, text])
+            except ValueError:
+                # Neither text has a single scorable term
+                return 0
+        similarity = scorer.score(self.job_description, [text])[0]
+        return round(float(similarity) * 100, 2)
+    
+    def score_resumes_lexical(self, resumes):
+        """
+        Score experience and education of many resumes with one sparse matrix product.
+        
+        Without a model from fit_lexical_model, a model is fitted on this pool for this
+        call only and not stored, so a shared analyzer never keeps one pool's statistics.
+        Term weights then depend on the pool: scores are comparable within one call, and
+        fit_lexical_model gives a fixed model when they must be comparable across calls.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            
+        Returns:
+            list: List of (experience_score, education_score) tuples, one per resume
+        """
+        if not resumes:
+            return []
+        
+        if not self.job_description:
+            return [(0, 0) for _ in resumes]
+        
+        scorer = self.lexical_scorer
+        if scorer is None:
+            try:
+                scorer = LexicalScorer().fit(self._lexical_corpus(resumes))
+            except ValueError:
+                # Neither the job description nor any section has a single scorable term
+                return [(0, 0) for _ in resumes]
+        
+        # Experience texts first, education texts second, all scored in one product
+        experience_texts = [self._join_section(r.get('experience', [])) for r in resumes]
+        education_texts = [self._join_section(r.get('education', [])) for r in resumes]
+        similarities = scorer.score(self.job_description, experience_texts + education_texts)
+        
+        scores = []
+        for i, (exp_text, edu_text) in enumerate(zip(experience_texts, education_texts)):
+            experience_score = round(float(similarities[i]) * 100, 2) if exp_text else 0
+            education_score = round(float(similarities[len(resumes) + i]) * 100, 2) if edu_text else 0
+            scores.append((experience_score, education_score))
+        
+        return scores
+    
     def calculate_skills_match(self, candidate_skills):
         """
         Calculate the skills match score.
@@ -68,27 +264,45 @@ class SkillsAnalyzer:
             candidate_skills (list): List of candidate skills
             
         Returns:
-            dict: Dictionary containing skills match information
+            dict: Dictionary containing skills match information. The match percents count
+                exact matches only, as knock-out rules do; the credit percents and the score
+                include partial taxonomy credit.
         """
         if not candidate_skills:
-            return {'score': 0, 'matched_required': [], 'matched_preferred': []}
+            return {
+                'score': 0,
+                'matched_required': [],
+                'matched_preferred': [],
+                'partial_required': {},
+                'partial_preferred': {},
+                'required_match_percent': 0,
+                'preferred_match_percent': 0,
+                'required_credit_percent': 0,
+                'preferred_credit_percent': 0
+            }
         
         # Convert lists to lowercase for case-insensitive matching
         candidate_skills_lower = [skill.lower() for skill in candidate_skills]
         required_skills_lower = [skill.lower() for skill in self.required_skills]
         preferred_skills_lower = [skill.lower() for skill in self.preferred_skills]
         
+        # Credit per listed skill: 1 for exact matches, below 1 for related or more specific skills
+        required_credit = self._skill_credits(required_skills_lower, candidate_skills_lower)
+        preferred_credit = self._skill_credits(preferred_skills_lower, candidate_skills_lower)
+        
         # Find matched skills
-        matched_required = [skill for skill in required_skills_lower if skill in candidate_skills_lower]
-        matched_preferred = [skill for skill in preferred_skills_lower if skill in candidate_skills_lower]
+        matched_required = [skill for skill, credit in zip(required_skills_lower, required_credit) if credit == 1.0]
+        matched_preferred = [skill for skill, credit in zip(preferred_skills_lower, preferred_credit) if credit == 1.0]
         
-        # Calculate match percentages
+        # Calculate match percentages of exact matches, and of the credit including partial matches
         required_match = len(matched_required) / len(required_skills_lower) if required_skills_lower else 0
         preferred_match = len(matched_preferred) / len(preferred_skills_lower) if preferred_skills_lower else 0
+        required_credit_match = sum(required_credit) / len(required_skills_lower) if required_skills_lower else 0
+        preferred_credit_match = sum(preferred_credit) / len(preferred_skills_lower) if preferred_skills_lower else 0
         
         # Calculate weighted score
-        score = (required_match * self.weights['required_skills'] + 
-                preferred_match * self.weights['preferred_skills'])
+        score = (required_credit_match * self.weights['required_skills'] + 
+                preferred_credit_match * self.weights['preferred_skills'])
         
         # Normalize to percentage
         score = score / (self.weights['required_skills'] + self.weights['preferred_skills']) * 100
@@ -97,16 +311,69 @@ class SkillsAnalyzer:
             'score': round(score, 2),
             'matched_required': matched_required,
             'matched_preferred': matched_preferred,
+            'partial_required': self._partial_matches(required_skills_lower, required_credit),
+            'partial_preferred': self._partial_matches(preferred_skills_lower, preferred_credit),
             'required_match_percent': round(required_match * 100, 2),
-            'preferred_match_percent': round(preferred_match * 100, 2)
+            'preferred_match_percent': round(preferred_match * 100, 2),
+            'required_credit_percent': round(required_credit_match * 100, 2),
+            'preferred_credit_percent': round(preferred_credit_match * 100, 2)
         }
     
-    def calculate_experience_score(self, experience_text):
+    def _skill_credits(self, skills, candidate_skills):
+        """
+        Credit a candidate earns toward each skill of a list.
+        
+        With a taxonomy, each listed skill gets the best credit of any held skill, from a
+        max-aggregating product of the list's precomputed credit rows with the candidate's
+        skill bitset. Only an exact match, by name or by an alias of the same taxonomy
+        skill, earns 1; partial credit stays below 1.
+        
+        Args:
+            skills (list): Lowercase required or preferred skills
+            candidate_skills (list): Lowercase candidate skills
+            
+        Returns:
+            list: Credit between 0 and 1 per skill
+        """
+        credits = [1.0 if skill in candidate_skills else 0.0 for skill in skills]
+        if self.skill_taxonomy is None or not skills:
+            return credits
+        
+        matrix = self._requirement_matrix(skills)
+        partial = self.skill_taxonomy.max_credits([candidate_skills], matrix).toarray().ravel()
+        return [max(credit, float(value)) for credit, value in zip(credits, partial)]
+    
+    def _requirement_matrix(self, skills):
+        """Get the taxonomy credit rows of a lowercase skill list in CSC form, gathering them on first use."""
+        key = tuple(skills)
+        matrix = self._requirement_matrices.get(key)
+        if matrix is None:
+            matrix = self._requirement_matrices[key] = self.skill_taxonomy.requirement_matrix(skills).tocsc()
+        return matrix
+    
+    def prepare_skill_credits(self):
+        """
+        Gather the taxonomy credit rows of the required and preferred skills now instead of on first use.
+        
+        Returns:
+            list: The requirement matrices, empty without a taxonomy
+        """
+        if self.skill_taxonomy is None:
+            return []
+        return [self._requirement_matrix([skill.lower() for skill in skills])
+                for skills in (self.required_skills, self.preferred_skills) if skills]
+    
+    def _partial_matches(self, skills, credits):
+        """Map the listed skills with partial credit through the taxonomy to their rounded credit."""
+        return {skill: round(credit, 2) for skill, credit in zip(skills, credits) if 0 < credit < 1}
+    
+    def calculate_experience_score(self, experience_text, backend=None):
         """
         Calculate experience relevance score.
         
         Args:
             experience_text (str): Experience text from resume
+            backend (str, optional): Similarity backend overriding the analyzer default. Defaults to None.
             
         Returns:
             float: Experience score
@@ -114,10 +381,8 @@ class SkillsAnalyzer:
         if not experience_text or not self.job_description:
             return 0
         
-        # Preprocess texts
-        job_desc = preprocess_text(self.job_description)
-        job_desc = remove_stopwords(job_desc)
-        job_desc = lemmatize_text(job_desc)
+        if (backend or self.similarity_backend) == 'lexical':
+            return self._calculate_lexical_score(self._join_section(experience_text))
         
         if isinstance(experience_text, list):
             experience_text = ' '.join(experience_text)
@@ -126,17 +391,18 @@ class SkillsAnalyzer:
         exp_text = remove_stopwords(exp_text)
         exp_text = lemmatize_text(exp_text)
         
-        # Calculate similarity
-        similarity = calculate_similarity(job_desc, exp_text)
+        # Calculate similarity against the cached job description vector
+        similarity = self._calculate_job_similarity(exp_text)
         
         return round(similarity * 100, 2)
     
-    def calculate_education_score(self, education_text):
+    def calculate_education_score(self, education_text, backend=None):
         """
         Calculate education relevance score.
         
         Args:
             education_text (str): Education text from resume
+            backend (str, optional): Similarity backend overriding the analyzer default. Defaults to None.
             
         Returns:
             float: Education score
@@ -144,10 +410,8 @@ class SkillsAnalyzer:
         if not education_text or not self.job_description:
             return 0
         
-        # Preprocess texts
-        job_desc = preprocess_text(self.job_description)
-        job_desc = remove_stopwords(job_desc)
-        job_desc = lemmatize_text(job_desc)
+        if (backend or self.similarity_backend) == 'lexical':
+            return self._calculate_lexical_score(self._join_section(education_text))
         
         if isinstance(education_text, list):
             education_text = ' '.join(education_text)
@@ -156,11 +420,48 @@ class SkillsAnalyzer:
         edu_text = remove_stopwords(edu_text)
         edu_text = lemmatize_text(edu_text)
         
-        # Calculate similarity
-        similarity = calculate_similarity(job_desc, edu_text)
+        # Calculate similarity against the cached job description vector
+        similarity = self._calculate_job_similarity(edu_text)
         
         return round(similarity * 100, 2)
     
+    def get_job_vector(self):
+        """
+        Get the vector of the preprocessed job description, computing it on first use.
+        
+        Returns:
+            TextVector: Job description vector, or None without a job description or spaCy model
+        """
+        nlp = load_nlp() if self._job_vector is None and self.job_description else None
+        if nlp:
+            job_desc = preprocess_text(self.job_description)
+            job_desc = remove_stopwords(job_desc)
+            job_desc = lemmatize_text(job_desc)
+            with NLP_LOCK:
+                self._job_vector = TextVector.from_doc(nlp(job_desc))
+        
+        return self._job_vector
+    
+    def _calculate_job_similarity(self, text):
+        """
+        Calculate semantic similarity between preprocessed text and the job description.
+        
+        Args:
+            text (str): Preprocessed resume section text
+            
+        Returns:
+            float: Similarity score between 0 and 1
+        """
+        nlp = load_nlp()
+        if not nlp:
+            logger.error("spaCy model not loaded. Cannot calculate similarity.")
+            return 0.0
+        
+        job_vector = self.get_job_vector()
+        with NLP_LOCK:
+            doc = nlp(text)
+        return calculate_doc_similarity(job_vector, doc)
+    
     def analyze_resume(self, resume_data):
         """
         Analyze resume data and calculate scores.
@@ -175,12 +476,21 @@ class SkillsAnalyzer:
             logger.error("No resume data provided for analysis")
             return None
         
+        # The lexical backend scores a resume as a pool of one, exactly as analyze_resumes does
+        if self.similarity_backend == 'lexical':
+            return self._prefilter_resumes([resume_data])[0]
+        
         # Extract skills
         candidate_skills = resume_data.get('skills', [])
         
         # Calculate skills match
         skills_match = self.calculate_skills_match(candidate_skills)
         
+        # Knock-out rules short-circuit before any similarity computation
+        knockout_reason = self.check_knockout_rules(candidate_skills, skills_match)
+        if knockout_reason:
+            return self._build_result(resume_data, skills_match, 0, 0, knockout_reason)
+        
         # Calculate experience score
         experience_text = resume_data.get('experience', [])
         experience_score = self.calculate_experience_score(experience_text)
@@ -189,6 +499,342 @@ class SkillsAnalyzer:
         education_text = resume_data.get('education', [])
         education_score = self.calculate_education_score(education_text)
         
+        return self._build_result(resume_data, skills_match, experience_score, education_score)
+    
+    def analyze_resumes(self, resumes, near_duplicates=None):
+        """
+        Analyze many resumes, batching relevance scoring when the lexical backend is selected.
+        
+        With near-duplicate detection, only one representative per cluster of near-identical
+        resumes gets relevance scores; the other members reuse them and are scored on their
+        own skills (see _duplicate_result).
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            near_duplicates (NearDuplicateIndex or bool, optional): Index to cluster resumes with,
+                keyed by content hash or file name, or True for a fresh index. Defaults to None.
+            
+        Returns:
+            list: List of analysis result dictionaries
+        """
+        resumes = [resume for resume in resumes if resume]
+        if near_duplicates is None or near_duplicates is False:
+            return self._analyze_unique_resumes(resumes)
+        
+        representative_of = self._group_near_duplicates(resumes, near_duplicates)
+        unique_positions = sorted(set(representative_of))
+        unique_results = self._analyze_unique_resumes([resumes[i] for i in unique_positions])
+        results_by_position = dict(zip(unique_positions, unique_results))
+        
+        results = []
+        for i, resume_data in enumerate(resumes):
+            result = results_by_position[representative_of[i]]
+            if representative_of[i] == i:
+                result['duplicate_of'] = None
+            else:
+                result = self._duplicate_result(result, resume_data, resumes[representative_of[i]])
+            results.append(result)
+        
+        logger.info(f"Scored {len(unique_positions)} of {len(resumes)} resumes after near-duplicate clustering")
+        return results
+    
+    def _analyze_unique_resumes(self, resumes):
+        """
+        Analyze resumes one by one, or as one lexical batch.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            
+        Returns:
+            list: List of analysis result dictionaries
+        """
+        if self.similarity_backend != 'lexical':
+            return [self.analyze_resume(resume) for resume in resumes]
+        
+        return self._prefilter_resumes(resumes)
+    
+    def _group_near_duplicates(self, resumes, near_duplicates):
+        """
+        Map each resume to the first resume of this batch in its near-duplicate cluster.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            near_duplicates (NearDuplicateIndex or bool): Index to cluster with, or True for a fresh index
+            
+        Returns:
+            list: Position of the representative resume for each resume
+        """
+        if near_duplicates is True:
+            near_duplicates = NearDuplicateIndex()
+            doc_ids = list(range(len(resumes)))
+        else:
+            doc_ids = [resume.get('content_hash') or resume.get('filename') for resume in resumes]
+        
+        # Resumes already indexed on upload are not hashed again
+        for doc_id, resume_data in zip(doc_ids, resumes):
+            if doc_id not in near_duplicates:
+                near_duplicates.insert(doc_id, resume_data.get('full_text', ''))
+        
+        # The cluster's representative may be outside this batch, so pick the first member present
+        first_position = {}
+        representative_of = []
+        for i, doc_id in enumerate(doc_ids):
+            cluster = near_duplicates.representative(doc_id)
+            representative_of.append(first_position.setdefault(cluster, i))
+        return representative_of
+    
+    def _duplicate_result(self, result, resume_data, representative_data, backend=None):
+        """
+        Score a near-duplicate resume, reusing its representative's relevance scores.
+        
+        The duplicate keeps its own parsed skills: its skills match, missing skills and
+        knock-out rules are evaluated on them, which is cheap. Only the experience and
+        education relevance is taken from the representative, unless the representative
+        was knocked out and has none, in which case it is computed for the duplicate.
+        
+        Args:
+            result (dict): Analysis result of the representative
+            resume_data (dict): Resume data of the near duplicate
+            representative_data (dict): Resume data of the representative
+            backend (str, optional): Similarity backend for a duplicate of a knocked-out
+                representative. Defaults to None (the analyzer default).
+            
+        Returns:
+            dict: Analysis result of the duplicate
+        """
+        candidate_skills = resume_data.get('skills', [])
+        skills_match = self.calculate_skills_match(candidate_skills)
+        knockout_reason = self.check_knockout_rules(candidate_skills, skills_match)
+        
+        if knockout_reason:
+            duplicate = self._build_result(resume_data, skills_match, 0, 0, knockout_reason)
+            stage = 'knockout'
+        elif result['knocked_out']:
+            experience_score = self.calculate_experience_score(resume_data.get('experience', []), backend=backend)
+            education_score = self.calculate_education_score(resume_data.get('education', []), backend=backend)
+            duplicate = self._build_result(resume_data, skills_match, experience_score, education_score)
+            stage = 'prefilter'
+        else:
+            duplicate = self._build_result(resume_data, skills_match, result['experience_score'],
+                                           result['education_score'])
+            stage = result.get('screening_stage')
+        
+        if 'screening_stage' in result:
+            duplicate['screening_stage'] = stage
+        duplicate['duplicate_of'] = representative_data.get('filename', 'Unknown')
+        return duplicate
+    
+    def screen_resumes(self, resumes, shortlist_size=20, near_duplicates=None):
+        """
+        Two-stage screening: cheap prefilter for everyone, spaCy re-rank for the shortlist.
+        
+        The first stage scores all candidates with skill matches and lexical relevance.
+        The second stage runs spaCy similarity only on the top shortlist_size candidates.
+        With near-duplicate detection, both stages see one representative per cluster and
+        the other members are listed right after it, with its relevance scores and their
+        own skills match.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            shortlist_size (int, optional): Number of candidates re-ranked with spaCy. Defaults to 20.
+            near_duplicates (NearDuplicateIndex or bool, optional): Index to cluster resumes with,
+                keyed by content hash or file name, or True for a fresh index. Defaults to None.
+            
+        Returns:
+            dict: Dictionary with ranked 'results' (shortlist first) and cost 'stats'. Costs
+                count only eligible (not knocked-out, not duplicate) candidates, so cost_fraction
+                is shortlist_size over eligible candidates, as in evaluate_shortlist_recall.
+        """
+        resumes = [resume for resume in resumes if resume]
+        if near_duplicates is None or near_duplicates is False:
+            representative_of = list(range(len(resumes)))
+        else:
+            representative_of = self._group_near_duplicates(resumes, near_duplicates)
+        
+        unique_positions = [i for i, representative in enumerate(representative_of) if representative == i]
+        duplicates = {}
+        for i, representative in enumerate(representative_of):
+            if representative != i:
+                duplicates.setdefault(representative, []).append(i)
+        
+        unique_resumes = [resumes[i] for i in unique_positions]
+        prefilter_results = self._prefilter_resumes(unique_resumes)
+        eligible = [i for i, result in enumerate(prefilter_results) if not result['knocked_out']]
+        
+        # Rank by cheap score and keep the top N for the expensive pass
+        order = sorted(eligible, key=lambda i: prefilter_results[i]['overall_score'], reverse=True)
+        shortlist_size = max(0, min(shortlist_size, len(eligible)))
+        shortlist, remainder = order[:shortlist_size], order[shortlist_size:]
+        
+        # Cost of the spaCy pass over every eligible candidate, against what the shortlist actually ran
+        evaluations = {i: self._count_spacy_evaluations(unique_resumes[i]) for i in eligible}
+        spacy_evaluations = sum(evaluations[i] for i in shortlist)
+        
+        reranked = []
+        for i in shortlist:
+            result = self._rerank_resume(unique_resumes[i], prefilter_results[i])
+            result['screening_stage'] = 'reranked'
+            reranked.append((i, result))
+        reranked.sort(key=lambda item: item[1]['overall_score'], reverse=True)
+        
+        prefiltered = []
+        for i in remainder:
+            result = prefilter_results[i]
+            result['screening_stage'] = 'prefilter'
+            prefiltered.append((i, result))
+        
+        knocked_out = []
+        for i, result in enumerate(prefilter_results):
+            if result['knocked_out']:
+                result['screening_stage'] = 'knockout'
+                knocked_out.append((i, result))
+        
+        # Near duplicates follow their representative and share its result
+        results = []
+        for i, result in reranked + prefiltered + knocked_out:
+            results.append(result)
+            position = unique_positions[i]
+            for duplicate in duplicates.get(position, []):
+                results.append(self._duplicate_result(result, resumes[duplicate], resumes[position], backend='lexical'))
+        
+        stats = {
+            'candidates': len(resumes),
+            'near_duplicates': len(resumes) - len(unique_resumes),
+            'knocked_out': sum(1 for result in results if result['knocked_out']),
+            'eligible': len(eligible),
+            'shortlist_size': shortlist_size,
+            'spacy_evaluations': spacy_evaluations,
+            'spacy_evaluations_saved': sum(evaluations.values()) - spacy_evaluations,
+            'cost_fraction': round(shortlist_size / len(eligible), 4) if eligible else 0
+        }
+        
+        return {'results': results, 'stats': stats}
+    
+    def evaluate_shortlist_recall(self, resumes, top_k=10, shortlist_sizes=(10, 20, 50, 100)):
+        """
+        Measure how well the cheap prefilter recovers the full-cost top candidates.
+        
+        Runs the full spaCy scoring on every resume, so use it on a calibration sample
+        to choose shortlist_size for screen_resumes.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            top_k (int, optional): Size of the reference top list from full scoring. Defaults to 10.
+            shortlist_sizes (tuple, optional): Shortlist sizes to evaluate. Defaults to (10, 20, 50, 100).
+            
+        Returns:
+            list: List of dictionaries with shortlist_size, recall and cost_fraction
+        """
+        resumes = [resume for resume in resumes if resume]
+        if not resumes:
+            return []
+        
+        prefilter_results = self._prefilter_resumes(resumes)
+        eligible = [i for i, result in enumerate(prefilter_results) if not result['knocked_out']]
+        resumes = [resumes[i] for i in eligible]
+        prefilter_results = [prefilter_results[i] for i in eligible]
+        if not resumes:
+            return []
+        
+        full_results = [self._rerank_resume(resume, result) for resume, result in zip(resumes, prefilter_results)]
+        
+        prefilter_order = sorted(range(len(resumes)), key=lambda i: prefilter_results[i]['overall_score'], reverse=True)
+        full_order = sorted(range(len(resumes)), key=lambda i: full_results[i]['overall_score'], reverse=True)
+        reference = set(full_order[:top_k])
+        
+        curve = []
+        for size in shortlist_sizes:
+            size = min(size, len(resumes))
+            found = len(reference.intersection(prefilter_order[:size]))
+            curve.append({
+                'shortlist_size': size,
+                'recall': round(found / len(reference), 4) if reference else 0,
+                'cost_fraction': round(size / len(resumes), 4)
+            })
+        
+        return curve
+    
+    def _prefilter_resumes(self, resumes):
+        """
+        Score resumes with skill matches and lexical relevance only.
+        
+        Knocked-out candidates are excluded from the lexical product.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            
+        Returns:
+            list: List of analysis result dictionaries, one per resume
+        """
+        results = [None] * len(resumes)
+        skills_matches = []
+        passed = []
+        for i, resume_data in enumerate(resumes):
+            candidate_skills = resume_data.get('skills', [])
+            skills_match = self.calculate_skills_match(candidate_skills)
+            skills_matches.append(skills_match)
+            
+            knockout_reason = self.check_knockout_rules(candidate_skills, skills_match)
+            if knockout_reason:
+                results[i] = self._build_result(resume_data, skills_match, 0, 0, knockout_reason)
+            else:
+                passed.append(i)
+        
+        relevance_scores = self.score_resumes_lexical([resumes[i] for i in passed])
+        for i, (experience_score, education_score) in zip(passed, relevance_scores):
+            results[i] = self._build_result(resumes[i], skills_matches[i], experience_score, education_score)
+        
+        return results
+    
+    def _count_spacy_evaluations(self, resume_data):
+        """
+        Count the sections of a resume that the spaCy re-rank actually scores.
+        
+        Empty sections, a missing job description or an unloaded model return 0
+        before any spaCy work, mirroring calculate_experience_score and
+        calculate_education_score.
+        
+        Args:
+            resume_data (dict): Resume data from ResumeParser
+            
+        Returns:
+            int: Number of spaCy similarity computations, 0 to 2
+        """
+        if not self.job_description or not load_nlp():
+            return 0
+        return sum(1 for section in ('experience', 'education') if resume_data.get(section))
+    
+    def _rerank_resume(self, resume_data, prefilter_result):
+        """
+        Re-score a prefiltered resume with spaCy similarity, reusing its skills match.
+        
+        Args:
+            resume_data (dict): Resume data from ResumeParser
+            prefilter_result (dict): Result of the prefilter stage for this resume
+            
+        Returns:
+            dict: Dictionary containing analysis results
+        """
+        experience_score = self.calculate_experience_score(resume_data.get('experience', []), backend='spacy')
+        education_score = self.calculate_education_score(resume_data.get('education', []), backend='spacy')
+        return self._build_result(resume_data, prefilter_result['skills_match'], experience_score, education_score)
+    
+    def _build_result(self, resume_data, skills_match, experience_score, education_score, knockout_reason=None):
+        """
+        Combine component scores into the analysis result dictionary.
+        
+        Args:
+            resume_data (dict): Resume data from ResumeParser
+            skills_match (dict): Result of calculate_skills_match
+            experience_score (float): Experience relevance score
+            education_score (float): Education relevance score
+            knockout_reason (str, optional): Reason the candidate failed a knock-out rule. Defaults to None.
+            
+        Returns:
+            dict: Dictionary containing analysis results
+        """
+        candidate_skills = resume_data.get('skills', [])
+        
         # Calculate overall score
         overall_score = (
             skills_match['score'] * (self.weights['required_skills'] + self.weights['preferred_skills']) +
@@ -205,7 +851,9 @@ class SkillsAnalyzer:
             'experience_score': experience_score,
             'education_score': education_score,
             'skills': candidate_skills,
-            'missing_required_skills': [skill for skill in self.required_skills if skill.lower() not in [s.lower() for s in skills_match['matched_required']]]
+            'missing_required_skills': [skill for skill in self.required_skills if skill.lower() not in [s.lower() for s in skills_match['matched_required']]],
+            'knocked_out': knockout_reason is not None,
+            'knockout_reason': knockout_reason
         }
         
         return result 
\ No newline at end of file
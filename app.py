@@ -1,22 +1,28 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import os
-import matplotlib.pyplot as plt
-import plotly.express as px
-import tempfile
-from pathlib import Path
 import logging
-import plotly.graph_objects as go
-import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from resume_parser.parser import ResumeParser
-from skills_analyzer.analyzer import SkillsAnalyzer
+from utils.shared_resources import get_resume_parser, get_skills_analyzer
+from utils.candidate_index import CandidateIndex
+from utils.near_duplicates import NearDuplicateIndex
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Maximum number of parsing threads per upload. Threads overlap text extraction and the
+# native code that releases the GIL; calls into the shared spaCy pipeline are serialized
+# by NLP_LOCK across threads and sessions, and Python-level parsing runs one thread at a time.
+MAX_UPLOAD_WORKERS = 8
+
+# Page sizes offered by the candidate ranking table
+PAGE_SIZES = [25, 50, 100]
+
+# Maximum number of charts and tables kept per session for the current results
+MAX_CACHED_VIEWS = 32
+
 # Set page config
 st.set_page_config(
     page_title="AI Resume Screener & Analyzer",
@@ -80,35 +86,188 @@ if 'required_skills' not in st.session_state:
     st.session_state.required_skills = []
 if 'preferred_skills' not in st.session_state:
     st.session_state.preferred_skills = []
-if 'temp_dir' not in st.session_state:
-    st.session_state.temp_dir = tempfile.mkdtemp()
+if 'upload_status' not in st.session_state:
+    st.session_state.upload_status = {}
+if 'resume_hashes' not in st.session_state:
+    st.session_state.resume_hashes = {}
+if 'near_duplicates' not in st.session_state:
+    st.session_state.near_duplicates = NearDuplicateIndex()
+if 'candidate_index' not in st.session_state:
+    st.session_state.candidate_index = None
+if 'results_version' not in st.session_state:
+    st.session_state.results_version = 0
+if 'view_cache' not in st.session_state:
+    st.session_state.view_cache = {}
+    st.session_state.view_cache_version = 0
 
 # Custom functions for the app
+def bump_results_version():
+    """Mark the analysis results as changed so cached charts and tables are rebuilt."""
+    st.session_state.results_version += 1
+
+def cached_view(name, build, *params):
+    """Return a chart or table built for the current results version, building it only when missing."""
+    if st.session_state.view_cache_version != st.session_state.results_version:
+        st.session_state.view_cache = {}
+        st.session_state.view_cache_version = st.session_state.results_version
+    
+    cache = st.session_state.view_cache
+    key = (name,) + params
+    if key not in cache:
+        # Drop the oldest views, e.g. pages visited earlier, to bound per-session memory
+        while len(cache) >= MAX_CACHED_VIEWS:
+            cache.pop(next(iter(cache)))
+        cache[key] = build()
+    return cache[key]
+
+def build_top_candidates_chart(index):
+    """Build the bar chart of the top candidates."""
+    # Plotly is imported when the first chart is built, not at startup
+    import plotly.express as px
+    
+    fig = px.bar(
+        index.top(10),
+        x='Name',
+        y='Overall Score',
+        color='Overall Score',
+        color_continuous_scale=px.colors.sequential.Viridis,
+        title="Top Candidates by Overall Score"
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+def build_density_chart(index):
+    """Build the binned skills vs experience heatmap; its size does not grow with the pool."""
+    import plotly.graph_objects as go
+    
+    x_centers, y_centers, counts = index.density_grid()
+    fig = go.Figure(go.Heatmap(
+        x=x_centers,
+        y=y_centers,
+        z=counts,
+        colorscale='Viridis',
+        colorbar=dict(title="Candidates")
+    ))
+    fig.update_layout(
+        title="Skills vs Experience Match",
+        xaxis_title="Skills Match",
+        yaxis_title="Experience Match"
+    )
+    return fig
+
+def parse_resume_file(parser, data, filename):
+    """Parse one uploaded resume in memory on a worker thread; returns (resume_data, error)."""
+    try:
+        return parser.parse_resume_bytes(data, filename), None
+    except Exception as e:
+        logger.error(f"Error parsing resume {filename}: {str(e)}")
+        return None, str(e)
+
+def render_upload_status(status_placeholder, digests):
+    """Render the per-file status of the current upload."""
+    status_placeholder.dataframe(pd.DataFrame([{
+        'File': st.session_state.upload_status[digest]['file'],
+        'Status': st.session_state.upload_status[digest]['status'],
+        'Candidate': st.session_state.upload_status[digest]['candidate'] or ''
+    } for digest in digests]), use_container_width=True, hide_index=True)
+
+def render_parsed_candidate(container, resume_data):
+    """Show one newly parsed candidate under the upload progress."""
+    skills = resume_data.get('skills') or []
+    summary = ", ".join(skills[:5]) + (f" and {len(skills) - 5} more" if len(skills) > 5 else "")
+    container.markdown(
+        f"**{resume_data.get('name') or 'Unknown'}** ({resume_data.get('filename', '')}): "
+        f"{summary or 'no listed skills found'}"
+    )
+
 def process_resume_files(uploaded_files):
-    """Process uploaded resume files."""
+    """Process uploaded resume files on worker threads, showing each candidate as it is parsed."""
     if not uploaded_files:
         return
     
-    parser = ResumeParser()
+    # Parser and spaCy pipeline are shared by all sessions of this process
+    parser = get_resume_parser()
     
+    # Identify uploads by content hash so duplicate content is never parsed twice;
+    # workers get the in-memory contents and Streamlit objects stay on the script thread
+    pending = {}
+    digests = []
+    seen = set()
     for file in uploaded_files:
-        # Save uploaded file to temp directory
-        file_path = os.path.join(st.session_state.temp_dir, file.name)
-        with open(file_path, "wb") as f:
-            f.write(file.getbuffer())
-        
-        # Parse resume
-        resume_data = parser.parse_resume(file_path)
-        
-        if resume_data:
-            # Add to session state if not already present
-            if not any(r.get('filename') == resume_data.get('filename') for r in st.session_state.parsed_resumes):
-                st.session_state.parsed_resumes.append(resume_data)
-                st.success(f"Successfully parsed resume: {file.name}")
-            else:
-                st.info(f"Resume already processed: {file.name}")
+        data = file.getbuffer()
+        digest = hashlib.sha256(data).hexdigest()
+        
+        # Identical content uploaded twice in the same batch is listed once
+        if digest in seen:
+            continue
+        seen.add(digest)
+        digests.append(digest)
+        
+        original = st.session_state.resume_hashes.get(digest)
+        if original is not None:
+            st.session_state.upload_status[digest] = {
+                'file': file.name,
+                'status': f"Duplicate of {original}" if original != file.name else 'Already processed',
+                'candidate': None
+            }
         else:
-            st.error(f"Failed to parse resume: {file.name}")
+            pending[digest] = (file.name, data)
+            st.session_state.upload_status[digest] = {'file': file.name, 'status': 'Queued', 'candidate': None}
+    
+    progress_bar = st.progress(0.0, text=f"Parsing 0 of {len(pending)} resumes...")
+    status_placeholder = st.empty()
+    render_upload_status(status_placeholder, digests)
+    candidates_container = st.container()
+    
+    # Parse on worker threads and publish every result to session state and the page as soon as it is ready
+    completed = 0
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(pending))) as executor:
+            futures = {
+                executor.submit(parse_resume_file, parser, data, name): digest
+                for digest, (name, data) in pending.items()
+            }
+            
+            for future in as_completed(futures):
+                digest = futures[future]
+                resume_data, error = future.result()
+                
+                if resume_data:
+                    resume_data['content_hash'] = digest
+                    st.session_state.parsed_resumes.append(resume_data)
+                    st.session_state.resume_hashes[digest] = resume_data.get('filename')
+                    
+                    # Resubmissions with small edits are clustered as they arrive and scored once
+                    representative = st.session_state.near_duplicates.insert(digest, resume_data.get('full_text', ''))
+                    if representative != digest:
+                        status = f"Parsed (near duplicate of {st.session_state.resume_hashes[representative]})"
+                    else:
+                        status = 'Parsed'
+                    render_parsed_candidate(candidates_container, resume_data)
+                else:
+                    status = f"Failed: {error}" if error else 'Failed'
+                
+                st.session_state.upload_status[digest].update({
+                    'status': status,
+                    'candidate': resume_data.get('name') if resume_data else None
+                })
+                
+                completed += 1
+                progress_bar.progress(completed / len(pending), text=f"Parsed {completed} of {len(pending)} resumes")
+                render_upload_status(status_placeholder, digests)
+    else:
+        progress_bar.progress(1.0, text="All uploaded resumes were already processed")
+    
+    statuses = [st.session_state.upload_status[digest]['status'] for digest in digests]
+    parsed = sum(1 for status in statuses if status.startswith('Parsed'))
+    failed = sum(1 for status in statuses if status.startswith('Failed'))
+    duplicates = len(digests) - len(pending)
+    if parsed:
+        st.success(f"Successfully parsed {parsed} resume(s).")
+    if duplicates:
+        st.info(f"Skipped {duplicates} resume(s) with content that was already processed.")
+    if failed:
+        st.error(f"Failed to parse {failed} resume(s).")
 
 def analyze_resumes():
     """Analyze all parsed resumes."""
@@ -120,20 +279,24 @@ def analyze_resumes():
         st.warning("Please enter a job description first.")
         return
     
-    analyzer = SkillsAnalyzer(
+    # Reuse the analyzer (and its job description vector) of any session with the same job
+    analyzer = get_skills_analyzer(
         job_description=st.session_state.job_description,
         required_skills=st.session_state.required_skills,
         preferred_skills=st.session_state.preferred_skills
     )
     
-    analyzed_resumes = []
-    for resume in st.session_state.parsed_resumes:
-        analysis = analyzer.analyze_resume(resume)
-        if analysis:
-            analyzed_resumes.append(analysis)
+    analyzed_resumes = analyzer.analyze_resumes(
+        st.session_state.parsed_resumes,
+        near_duplicates=st.session_state.near_duplicates
+    )
     
     st.session_state.analyzed_resumes = analyzed_resumes
     
+    # Sort orders and chart aggregates are computed once per analysis, not on every rerun
+    st.session_state.candidate_index = CandidateIndex(analyzed_resumes) if analyzed_resumes else None
+    bump_results_version()
+    
     if analyzed_resumes:
         st.success(f"Successfully analyzed {len(analyzed_resumes)} resumes.")
     else:
@@ -145,6 +308,8 @@ def display_resume_details(resume_data):
         return
     
     st.markdown(f"<h2 class='sub-header'>{resume_data.get('name', 'Unknown Candidate')}</h2>", unsafe_allow_html=True)
+    if resume_data.get('duplicate_of'):
+        st.caption(f"Near duplicate of {resume_data['duplicate_of']}; scores are shared with that resume.")
     
     # Create columns for metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -242,6 +407,8 @@ def display_resume_details(resume_data):
             resume_data.get('education_score', 0)
         ]
         
+        import plotly.graph_objects as go
+        
         fig = go.Figure()
         
         fig.add_trace(go.Scatterpolar(
@@ -356,6 +523,11 @@ def main():
         if st.button("Reset All"):
             st.session_state.parsed_resumes = []
             st.session_state.analyzed_resumes = []
+            st.session_state.upload_status = {}
+            st.session_state.resume_hashes = {}
+            st.session_state.near_duplicates = NearDuplicateIndex()
+            st.session_state.candidate_index = None
+            bump_results_version()
             st.experimental_rerun()
     
     # Main content
@@ -365,69 +537,68 @@ def main():
     if st.session_state.analyzed_resumes:
         st.markdown("<h2 class='sub-header'>Resume Analysis Results</h2>", unsafe_allow_html=True)
         
-        # Create dataframe from analyzed resumes
-        df = pd.DataFrame([{
-            'Name': r.get('name', 'Unknown'),
-            'Overall Score': r.get('overall_score', 0),
-            'Skills Match': r.get('skills_match', {}).get('score', 0),
-            'Experience Match': r.get('experience_score', 0),
-            'Education Match': r.get('education_score', 0),
-            'Missing Required Skills': len(r.get('missing_required_skills', [])),
-            'data': r  # Store the full data for later use
-        } for r in st.session_state.analyzed_resumes])
-        
-        # Sort by overall score
-        df = df.sort_values(by='Overall Score', ascending=False)
+        index = st.session_state.candidate_index
+        if index is None or index.resumes is not st.session_state.analyzed_resumes:
+            index = st.session_state.candidate_index = CandidateIndex(st.session_state.analyzed_resumes)
         
         # Create two columns for visualizations
         col1, col2 = st.columns(2)
         
+        # Charts are rebuilt only when the analysis results change
         with col1:
             # Bar chart of top candidates
-            fig = px.bar(
-                df.head(10),
-                x='Name',
-                y='Overall Score',
-                color='Overall Score',
-                color_continuous_scale=px.colors.sequential.Viridis,
-                title="Top Candidates by Overall Score"
-            )
-            fig.update_layout(xaxis_tickangle=-45)
+            fig = cached_view('top_candidates_chart', lambda: build_top_candidates_chart(index))
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            # Scatter plot of skills vs experience
-            fig = px.scatter(
-                df,
-                x='Skills Match',
-                y='Experience Match',
-                size='Overall Score',
-                color='Overall Score',
-                hover_name='Name',
-                color_continuous_scale=px.colors.sequential.Viridis,
-                title="Skills vs Experience Match"
-            )
+            # Binned density of skills vs experience
+            fig = cached_view('density_chart', lambda: build_density_chart(index))
             st.plotly_chart(fig, use_container_width=True)
         
         # Table of candidates
         st.markdown("<h3>Candidate Rankings</h3>", unsafe_allow_html=True)
         
-        # Display dataframe without the 'data' column
-        display_df = df.drop(columns=['data']).reset_index(drop=True)
-        display_df.index = display_df.index + 1  # Start index from 1 instead of 0
-        st.dataframe(display_df, use_container_width=True)
-        
-        # Detailed view for selected candidate
-        st.markdown("<h3>Candidate Details</h3>", unsafe_allow_html=True)
-        selected_candidate = st.selectbox(
-            "Select a candidate to view details",
-            options=df['Name'].tolist(),
-            index=0
-        )
-        
-        # Get the full data for the selected candidate
-        selected_data = df[df['Name'] == selected_candidate]['data'].iloc[0]
-        display_resume_details(selected_data)
+        # Filtering and sorting run on the precomputed index
+        filter_col1, filter_col2, filter_col3, filter_col4 = st.columns(4)
+        with filter_col1:
+            name_filter = st.text_input("Search by name")
+        with filter_col2:
+            min_overall_score = st.slider("Minimum overall score", 0.0, max(1.0, index.max_overall_score), 0.0, step=0.01)
+        with filter_col3:
+            sort_by = st.selectbox("Sort by", CandidateIndex.SORT_COLUMNS)
+        with filter_col4:
+            ascending = st.checkbox("Ascending", value=False)
+            page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1)
+        
+        positions = index.query(sort_by, ascending, min_overall_score, name_filter)
+        
+        if len(positions) == 0:
+            st.info("No candidates match the current filters.")
+        else:
+            # Only the rows of the current page are materialized
+            page_count = (len(positions) + page_size - 1) // page_size
+            page_number = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+            page_df = cached_view(
+                'ranking_page',
+                lambda: index.page(positions, page_number, page_size),
+                sort_by, ascending, min_overall_score, name_filter.strip().lower(), page_number, page_size
+            )
+            st.caption(f"Showing {page_df.index[0]}-{page_df.index[-1]} of {len(positions)} candidates")
+            st.dataframe(page_df, use_container_width=True)
+            
+            # Detailed view for selected candidate
+            st.markdown("<h3>Candidate Details</h3>", unsafe_allow_html=True)
+            start = (page_number - 1) * page_size
+            page_positions = positions[start:start + page_size]
+            selected_position = st.selectbox(
+                "Select a candidate to view details",
+                options=page_positions.tolist(),
+                format_func=lambda pos: index.names[pos],
+                index=0
+            )
+            
+            # Get the full data for the selected candidate
+            display_resume_details(index.resumes[selected_position])
     else:
         # Instructions if no resumes analyzed
         st.info("""
@@ -0,0 +1,130 @@
+"""
+Report the cold import time of the service entry points.
+
+Each module is imported in a fresh interpreter with ``python -X importtime`` and the
+output is summarized per top-level package, with the slowest individual imports.
+
+The modules import each other as packages (``utils.nlp_utils``, ``resume_parser.parser``,
+``skills_analyzer.analyzer``, ``interview_analyzer.interview_analyzer``), so --path must
+point at the deployment root that contains those package directories, i.e. the
+directory the Streamlit apps are started from. It defaults to the parent of this
+benchmarks directory.
+
+Usage:
+    python benchmarks/import_time.py [module ...] [--path ROOT] [--top N] [--budget-ms MS]
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+DEFAULT_MODULES = (
+    'utils.nlp_utils',
+    'resume_parser.parser',
+    'skills_analyzer.analyzer',
+    'interview_analyzer.interview_analyzer',
+    'utils.worker_pool'
+)
+
+# "import time: self [us] | cumulative | imported package", nesting shown by indentation
+LINE_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure_import(module, path=PROJECT_ROOT):
+    """
+    Import a module in a fresh interpreter and collect its -X importtime records.
+    
+    Args:
+        module (str): Dotted module name
+        path (str, optional): Directory added to PYTHONPATH. Defaults to the project root.
+    
+    Returns:
+        list: List of (name, self_us, cumulative_us, depth) tuples in import order
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (path, env.get('PYTHONPATH')) if p)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, env=env
+    )
+    if result.returncode != 0:
+        hint = ""
+        if "ModuleNotFoundError" in result.stderr:
+            hint = (f"\n{path} does not provide the package layout ({', '.join(DEFAULT_MODULES)}); "
+                    f"pass --path with the deployment root")
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}{hint}")
+    
+    records = []
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+def summarize(module, records, top=10):
+    """
+    Summarize the import records of one module.
+    
+    Args:
+        module (str): Dotted module name that was imported
+        records (list): Records from measure_import
+        top (int, optional): Number of slowest imports listed. Defaults to 10.
+    
+    Returns:
+        dict: Dictionary with the total time, own time per top-level package and the slowest imports, in ms
+    """
+    # Self times summed per distribution, e.g. every numpy.* submodule counts toward numpy
+    packages = {}
+    for name, self_us, _, _ in records:
+        root = name.split('.')[0]
+        packages[root] = packages.get(root, 0) + self_us
+    
+    total_us = sum(cumulative_us for _, _, cumulative_us, depth in records if depth == 0)
+    slowest = sorted(records, key=lambda record: record[1], reverse=True)[:top]
+    
+    return {
+        'module': module,
+        'total_ms': round(total_us / 1000, 1),
+        'packages_ms': {
+            root: round(us / 1000, 1)
+            for root, us in sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        },
+        'slowest_ms': [(name, round(self_us / 1000, 1)) for name, self_us, _, _ in slowest]
+    }
+
+def print_report(summary, top=10):
+    """Print one module summary as a small text table."""
+    print(f"\n{summary['module']}: {summary['total_ms']} ms")
+    print("  by top-level package:")
+    for root, ms in list(summary['packages_ms'].items())[:top]:
+        print(f"    {ms:>9.1f} ms  {root}")
+    print("  slowest single imports (self):")
+    for name, ms in summary['slowest_ms']:
+        print(f"    {ms:>9.1f} ms  {name}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Report cold import time of entry-point modules.")
+    parser.add_argument('modules', nargs='*', default=list(DEFAULT_MODULES), help="Modules to import")
+    parser.add_argument('--path', default=PROJECT_ROOT,
+                        help="Deployment root containing the utils, resume_parser, ... packages")
+    parser.add_argument('--top', type=int, default=10, help="Rows per section of the report")
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help="Exit with status 1 if any module takes longer than this to import")
+    args = parser.parse_args()
+    
+    over_budget = []
+    for module in args.modules:
+        summary = summarize(module, measure_import(module, args.path), top=args.top)
+        print_report(summary, top=args.top)
+        if args.budget_ms is not None and summary['total_ms'] > args.budget_ms:
+            over_budget.append(module)
+    
+    if over_budget:
+        print(f"\nOver the {args.budget_ms} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
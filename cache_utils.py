@@ -0,0 +1,138 @@
+import threading
+from collections import OrderedDict
+
+# Sentinel distinguishing a miss from a cached None
+_MISSING = object()
+
+class LRUCache:
+    """Thread-safe least-recently-used cache bounded by entry count and, optionally, estimated memory."""
+    
+    def __init__(self, max_entries=1024, max_bytes=None, sizeof=None):
+        """
+        Initialize LRUCache.
+        
+        Args:
+            max_entries (int, optional): Maximum number of cached entries; 0 disables caching. Defaults to 1024.
+            max_bytes (int, optional): Maximum total estimated size of the entries. Defaults to None (unbounded).
+            sizeof (callable, optional): Function estimating the size of a value in bytes; required
+                for max_bytes to take effect. Defaults to None.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self._create_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __contains__(self, key):
+        # Membership checks neither count as a lookup nor refresh the entry
+        return key in self._entries
+    
+    def get(self, key, default=None):
+        """
+        Look up an entry and mark it as recently used.
+        
+        Args:
+            key: Cache key
+            default (optional): Value returned on a miss. Defaults to None.
+        
+        Returns:
+            The cached value, or default
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            
+            self.misses += 1
+            return default
+    
+    def put(self, key, value):
+        """
+        Store an entry, evicting the least recently used ones beyond max_entries.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.max_entries <= 0:
+            return
+        
+        size = self.sizeof(value) if self.sizeof else 0
+        
+        with self._lock:
+            self.total_bytes += size - self._sizes.get(key, 0)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._entries.move_to_end(key)
+            
+            # Evict least recently used entries, always keeping the newest one
+            while len(self._entries) > 1 and (
+                    len(self._entries) > self.max_entries
+                    or (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+                evicted_key, _ = self._entries.popitem(last=False)
+                self.total_bytes -= self._sizes.pop(evicted_key)
+                self.evictions += 1
+    
+    def get_or_create(self, key, factory):
+        """
+        Return the cached value for key, building and caching it on a miss.
+        
+        Concurrent misses are serialized so an expensive value is built only once.
+        
+        Args:
+            key: Cache key
+            factory (callable): Function without arguments building the value
+        
+        Returns:
+            The cached or newly built value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        with self._create_lock:
+            # Another thread may have built the value while this one waited
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    return self._entries[key]
+            
+            value = factory()
+            self.put(key, value)
+            return value
+    
+    def clear(self):
+        """Remove all entries; metrics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+    
+    def stats(self):
+        """
+        Report cache metrics.
+        
+        Returns:
+            dict: Dictionary with hits, misses, evictions, current size and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'total_bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
\ No newline at end of file
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+class CandidateIndex:
+    """Columnar, pre-sorted view over analyzed resumes for paginated dashboards."""
+    
+    SORT_COLUMNS = ('Overall Score', 'Skills Match', 'Experience Match', 'Education Match', 'Missing Required Skills')
+    
+    def __init__(self, analyzed_resumes, density_bins=20):
+        """
+        Initialize CandidateIndex.
+        
+        Column arrays, sort orders and chart aggregates are computed once here, so
+        rendering a page afterwards does not depend on the size of the pool.
+        
+        Args:
+            analyzed_resumes (list): List of SkillsAnalyzer.analyze_resume results
+            density_bins (int, optional): Bins per axis of the skills/experience density grid. Defaults to 20.
+        """
+        self.resumes = analyzed_resumes
+        self.names = [r.get('name') or 'Unknown' for r in analyzed_resumes]
+        self._search_names = [name.lower() for name in self.names]
+        
+        self.columns = {
+            'Overall Score': np.array([r.get('overall_score', 0) for r in analyzed_resumes], dtype=float),
+            'Skills Match': np.array([r.get('skills_match', {}).get('score', 0) for r in analyzed_resumes], dtype=float),
+            'Experience Match': np.array([r.get('experience_score', 0) for r in analyzed_resumes], dtype=float),
+            'Education Match': np.array([r.get('education_score', 0) for r in analyzed_resumes], dtype=float),
+            'Missing Required Skills': np.array([len(r.get('missing_required_skills', [])) for r in analyzed_resumes], dtype=int)
+        }
+        
+        # Descending and ascending order per sortable column; ties keep upload order in both
+        self._orders = {
+            column: np.argsort(-values, kind='stable')
+            for column, values in self.columns.items()
+        }
+        self._ascending_orders = {
+            column: np.argsort(values, kind='stable')
+            for column, values in self.columns.items()
+        }
+        
+        # Candidate counts on a skills x experience grid (both scores are percentages)
+        self.density_counts, self.density_x_edges, self.density_y_edges = np.histogram2d(
+            self.columns['Skills Match'],
+            self.columns['Experience Match'],
+            bins=density_bins,
+            range=[[0, 100], [0, 100]]
+        )
+        
+        self._last_query = None
+        self._last_positions = None
+    
+    def __len__(self):
+        return len(self.resumes)
+    
+    @property
+    def max_overall_score(self):
+        """float: Highest overall score in the pool."""
+        return float(self.columns['Overall Score'].max()) if self.resumes else 0.0
+    
+    def query(self, sort_by='Overall Score', ascending=False, min_overall_score=None, name_filter=None):
+        """
+        Filter and sort candidates, returning their positions in ranking order.
+        
+        The most recent query is cached, so Streamlit reruns with unchanged controls
+        reuse it instead of scanning the pool again.
+        
+        Args:
+            sort_by (str, optional): Column to sort by. Defaults to 'Overall Score'.
+            ascending (bool, optional): Sort ascending instead of descending. Defaults to False.
+            min_overall_score (float, optional): Keep candidates scoring at least this much. Defaults to None.
+            name_filter (str, optional): Keep candidates whose name contains this text. Defaults to None.
+        
+        Returns:
+            numpy.ndarray: Positions into the analyzed resumes, in ranking order
+        """
+        if sort_by not in self._orders:
+            raise ValueError(f"Unsupported sort column: {sort_by}")
+        
+        name_filter = (name_filter or '').strip().lower()
+        key = (sort_by, ascending, min_overall_score, name_filter)
+        if key == self._last_query:
+            return self._last_positions
+        
+        order = self._ascending_orders[sort_by] if ascending else self._orders[sort_by]
+        
+        mask = np.ones(len(self.resumes), dtype=bool)
+        if min_overall_score:
+            mask &= self.columns['Overall Score'] >= min_overall_score
+        if name_filter:
+            mask &= np.fromiter((name_filter in name for name in self._search_names), dtype=bool,
+                                count=len(self._search_names))
+        
+        positions = order[mask[order]]
+        self._last_query, self._last_positions = key, positions
+        return positions
+    
+    def page(self, positions, page_number, page_size=50):
+        """
+        Build the table rows of one page.
+        
+        Args:
+            positions (numpy.ndarray): Ranked positions from query
+            page_number (int): 1-based page number
+            page_size (int, optional): Rows per page. Defaults to 50.
+        
+        Returns:
+            pandas.DataFrame: Rows of the page, indexed by rank
+        """
+        start = (page_number - 1) * page_size
+        page_positions = positions[start:start + page_size]
+        
+        df = pd.DataFrame({'Name': [self.names[pos] for pos in page_positions]})
+        for column, values in self.columns.items():
+            df[column] = values[page_positions]
+        df.index = np.arange(start + 1, start + 1 + len(page_positions))
+        return df
+    
+    def top(self, n=10):
+        """
+        Get the n highest ranked candidates by overall score.
+        
+        Args:
+            n (int, optional): Number of candidates. Defaults to 10.
+        
+        Returns:
+            pandas.DataFrame: Rows of the top candidates, indexed by rank
+        """
+        return self.page(self._orders['Overall Score'], 1, n)
+    
+    def density_grid(self):
+        """
+        Get the skills/experience density grid for a heatmap.
+        
+        Returns:
+            tuple: Skills bin centers, experience bin centers, and counts with one row per experience bin
+        """
+        x_centers = (self.density_x_edges[:-1] + self.density_x_edges[1:]) / 2
+        y_centers = (self.density_y_edges[:-1] + self.density_y_edges[1:]) / 2
+        return x_centers, y_centers, self.density_counts.T
\ No newline at end of file
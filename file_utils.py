@@ -1,33 +1,54 @@
+import io
 import os
-import PyPDF2
-import docx
-from pdfminer.high_level import extract_text
+import json
+import codecs
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Byte order marks recognized when decoding text uploads, longest first
+TEXT_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16')
+)
+
+# Characters that may follow a complete array element
+JSON_ARRAY_DELIMITERS = ',] \t\n\r'
+
+# Upper bound on the text buffered for a single array element (characters)
+MAX_JSON_ELEMENT_SIZE = 64 * 1024 * 1024
+
 def extract_text_from_pdf(pdf_path):
     """
     Extract text from a PDF file.
     
     Args:
-        pdf_path (str): Path to the PDF file
+        pdf_path (str or file): Path to the PDF file, or a binary file object
         
     Returns:
         str: Extracted text from the PDF
     """
     try:
+        # PDF libraries are imported on first use to keep startup fast
+        import PyPDF2
+        
         # First try with PyPDF2
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page_num in range(len(pdf_reader.pages)):
-                text += pdf_reader.pages[page_num].extract_text()
+        pdf_reader = PyPDF2.PdfReader(pdf_path)
+        text = ""
+        for page_num in range(len(pdf_reader.pages)):
+            text += pdf_reader.pages[page_num].extract_text()
                 
         # If PyPDF2 doesn't extract enough text, try with pdfminer
         if len(text.strip()) < 100:
+            from pdfminer.high_level import extract_text
+            
+            if hasattr(pdf_path, 'seek'):
+                pdf_path.seek(0)
             text = extract_text(pdf_path)
             
         return text
@@ -40,12 +61,14 @@ def extract_text_from_docx(docx_path):
     Extract text from a DOCX file.
     
     Args:
-        docx_path (str): Path to the DOCX file
+        docx_path (str or file): Path to the DOCX file, or a binary file object
         
     Returns:
         str: Extracted text from the DOCX
     """
     try:
+        import docx
+        
         doc = docx.Document(docx_path)
         text = ""
         for paragraph in doc.paragraphs:
@@ -55,6 +78,54 @@ def extract_text_from_docx(docx_path):
         logger.error(f"Error extracting text from DOCX {docx_path}: {str(e)}")
         return ""
 
+def decode_text_bytes(data):
+    """
+    Decode an uploaded text file held in memory.
+    
+    A byte order mark selects UTF-8/16/32 directly; otherwise the bytes are decoded as
+    UTF-8, falling back to Latin-1 (which accepts any byte sequence) only if that fails.
+    
+    Args:
+        data (bytes or memoryview): Raw file contents
+        
+    Returns:
+        str: Decoded text
+    """
+    head = bytes(data[:4])
+    for bom, encoding in TEXT_BOMS:
+        if head.startswith(bom):
+            return str(data, encoding)
+    
+    try:
+        return str(data, 'utf-8')
+    except UnicodeDecodeError:
+        return str(data, 'latin-1')
+
+def extract_text_from_bytes(data, filename):
+    """
+    Extract text from file contents held in memory, based on the file name's extension.
+    
+    Avoids writing uploads to disk; PDF and DOCX parsers read from an in-memory stream.
+    
+    Args:
+        data (bytes or memoryview): Raw file contents, e.g. UploadedFile.getbuffer()
+        filename (str): Original file name, used to pick the extractor
+        
+    Returns:
+        str: Extracted text from the file
+    """
+    file_extension = os.path.splitext(filename)[1].lower()
+    
+    if file_extension == '.pdf':
+        return extract_text_from_pdf(io.BytesIO(data))
+    elif file_extension == '.docx':
+        return extract_text_from_docx(io.BytesIO(data))
+    elif file_extension == '.txt':
+        return decode_text_bytes(data)
+    else:
+        logger.warning(f"Unsupported file type: {file_extension}")
+        return ""
+
 def extract_text_from_file(file_path):
     """
     Extract text from a file based on its extension.
@@ -80,4 +151,167 @@ def extract_text_from_file(file_path):
             return ""
     else:
         logger.warning(f"Unsupported file type: {file_extension}")
-        return "" 
\ No newline at end of file
+        return "" 
+
+def iter_json_array(file_obj, chunk_size=65536, max_element_size=MAX_JSON_ELEMENT_SIZE):
+    """
+    Incrementally yield the elements of a top-level JSON array.
+    
+    Only the element being decoded is held in memory, so arbitrarily large arrays can be read.
+    Missing or extra separators and data after the closing bracket raise ValueError.
+    
+    Args:
+        file_obj (file): Text file object positioned before the opening bracket
+        chunk_size (int, optional): Number of characters read at a time. Defaults to 65536.
+        max_element_size (int, optional): Largest number of characters buffered for one element;
+            malformed input fails once it is exceeded. Defaults to MAX_JSON_ELEMENT_SIZE.
+        
+    Yields:
+        object: Each decoded array element
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    
+    # Next expected token: 'open', 'first' (value or close), 'value', 'separator' (comma or close), 'end'
+    expected = 'open'
+    
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        
+        if pos < len(buffer):
+            char = buffer[pos]
+            if expected == 'open':
+                if char != '[':
+                    raise ValueError("Expected a JSON array")
+                expected = 'first'
+                pos += 1
+                continue
+            
+            if expected == 'end':
+                raise ValueError(f"Unexpected data after the JSON array at {char!r}")
+            
+            if expected == 'separator':
+                if char not in ',]':
+                    raise ValueError(f"Expected ',' or ']' between array elements, found {char!r}")
+                expected = 'value' if char == ',' else 'end'
+                pos += 1
+                continue
+            
+            if char == ']' and expected == 'first':
+                expected = 'end'
+                pos += 1
+                continue
+            
+            if char in ',]':
+                raise ValueError(f"Expected a JSON value, found {char!r}")
+            
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+                # Accept a value only once a delimiter follows it: "-35." may be a cut-short "-35.0"
+                if eof or (end < len(buffer) and buffer[end] in JSON_ARRAY_DELIMITERS):
+                    yield element
+                    buffer, pos = buffer[end:], 0
+                    expected = 'separator'
+                    continue
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+        elif eof:
+            if expected != 'end' and expected != 'open':
+                raise ValueError("Unterminated JSON array")
+            return
+        
+        # Need more input: drop consumed text and read the next chunk
+        buffer, pos = buffer[pos:], 0
+        if len(buffer) > max_element_size:
+            raise ValueError(f"JSON array element exceeds {max_element_size} characters")
+        chunk = file_obj.read(chunk_size)
+        if chunk:
+            buffer += chunk
+        else:
+            eof = True
+
+def iter_interview_records(file_path):
+    """
+    Stream raw interview records from a JSON or JSONL transcript file.
+    
+    Supports a JSON array of records, a single JSON object, and JSONL/NDJSON with one
+    record per line.
+    
+    Args:
+        file_path (str): Path to the transcript file
+        
+    Yields:
+        dict: Each record as stored in the file
+    """
+    file_extension = os.path.splitext(file_path)[1].lower()
+    
+    with open(file_path, 'r', encoding='utf-8') as file:
+        if file_extension in ('.jsonl', '.ndjson'):
+            for line_number, line in enumerate(file, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.error(f"Skipping malformed line {line_number} in {file_path}: {str(e)}")
+            return
+        
+        # Peek at the first non-whitespace character to tell arrays from single objects
+        first = file.read(1)
+        while first and first.isspace():
+            first = file.read(1)
+        file.seek(0)
+        
+        if first == '[':
+            yield from iter_json_array(file)
+        elif first == '{':
+            yield json.load(file)
+        elif first:
+            logger.error(f"Unsupported interview transcript format: {file_path}")
+
+def iter_interviews(file_path):
+    """
+    Stream interviews, one candidate at a time, from a transcript file.
+    
+    Records that already hold a "responses" list are yielded as they are. Flat records
+    with "question" and "answer" fields (typical for JSONL exports) are grouped into one
+    interview per run of consecutive records with the same "candidate".
+    
+    Args:
+        file_path (str): Path to a JSON, JSON-array or JSONL transcript file
+        
+    Yields:
+        dict: Interview with "candidate", optional metadata and a "responses" list
+    """
+    current = None
+    
+    for record in iter_interview_records(file_path):
+        if not isinstance(record, dict):
+            continue
+        
+        if 'responses' in record:
+            if current:
+                yield current
+                current = None
+            yield record
+            continue
+        
+        if 'question' not in record or 'answer' not in record:
+            continue
+        
+        candidate = record.get('candidate')
+        if current is None or current['candidate'] != candidate:
+            if current:
+                yield current
+            current = {key: value for key, value in record.items() if key not in ('question', 'answer')}
+            current['candidate'] = candidate
+            current['responses'] = []
+        current['responses'].append({'question': record['question'], 'answer': record['answer']})
+    
+    if current:
+        yield current
\ No newline at end of file
@@ -1,23 +1,70 @@
 import re
+import json
+import hashlib
 import logging
 import numpy as np
-from utils.nlp_utils import calculate_similarity, preprocess_text, extract_entities, nlp
+from utils.nlp_utils import (calculate_similarity, calculate_doc_similarity, process_texts, TextVector,
+                             KeywordMatcher, tokenize_for_matching)
+from utils.stats_utils import RunningStats
+from utils.cache_utils import LRUCache
+
+# Character classes for vectorized clarity scoring: 0 text, 1 whitespace, 2 sentence terminator.
+# Every code point str.isspace() accepts is below 0x3001; higher code points map to the last slot.
+_CHAR_CLASS_LIMIT = 0x3001
+_CHAR_CLASSES = None
+
+# Per-question score fields tracked by summaries and cohort statistics
+SCORE_METRICS = ('overall_score', 'relevance_score', 'completeness_score', 'clarity_score', 'technical_accuracy')
+
+# Default cosine similarity for resolving a reworded question to a bank entry. Averaged
+# spaCy vectors of short questions sit close together (unrelated questions of the same
+# shape often score above 0.8), so the default only accepts near-paraphrases. It has not
+# been validated on labeled rewordings; tune it per bank and pass match_threshold.
+QUESTION_MATCH_THRESHOLD = 0.9
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _normalize_question(question):
+    """
+    Normalize question wording for lookup, ignoring case, punctuation and spacing.
+    
+    Args:
+        question (str): Question text
+        
+    Returns:
+        str: Normalized question
+    """
+    return ' '.join(re.findall(r'\w+', question.lower()))
+
 class InterviewAnalyzer:
     """Class to analyze interview responses."""
     
-    def __init__(self, question_bank=None):
+    def __init__(self, question_bank=None, match_threshold=QUESTION_MATCH_THRESHOLD, cache_size=1024):
         """
         Initialize InterviewAnalyzer.
         
         Args:
             question_bank (dict, optional): Dictionary of questions and expected answers/keywords. Defaults to None.
+            match_threshold (float, optional): Minimum cosine similarity for resolving a differently
+                worded question to a bank entry. Defaults to QUESTION_MATCH_THRESHOLD.
+            cache_size (int, optional): Maximum number of memoized response scores; 0 disables
+                memoization. Defaults to 1024.
         """
         self.question_bank = question_bank if question_bank else {}
+        self.match_threshold = match_threshold
+        
+        # Memoized response scores, invalidated through the bank version and weights in the key
+        self.response_cache = LRUCache(cache_size)
+        self.bank_version = 0
+        
+        # Compiled form of each bank entry: cached vectors and keyword matcher
+        self.compiled_questions = {}
+        
+        # Lookup structures for near-duplicate questions, rebuilt lazily after bank changes
+        self._question_index = None
+        self.compile_question_bank()
         
         # Default weights for scoring
         self.weights = {
@@ -42,6 +89,7 @@ class InterviewAnalyzer:
             'keywords': keywords if keywords else [],
             'category': category
         }
+        self.compile_question_bank([question])
     
     def remove_question(self, question):
         """
@@ -52,14 +100,156 @@ class InterviewAnalyzer:
         """
         if question in self.question_bank:
             del self.question_bank[question]
+        self.compiled_questions.pop(question, None)
+        self._question_index = None
+        self.bank_version += 1
+    
+    def load_question_bank(self, file_path):
+        """
+        Load and compile questions from a JSON file such as sample_interview_questions.json.
+        
+        Args:
+            file_path (str): Path to a JSON file with a "questions" list (or a bare list)
+                of question/expected_answer/keywords/category dictionaries
+                
+        Returns:
+            int: Number of questions loaded
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        entries = data.get('questions', []) if isinstance(data, dict) else data
+        
+        loaded = []
+        for entry in entries:
+            question = entry.get('question')
+            if not question:
+                continue
+            self.question_bank[question] = {
+                'expected_answer': entry.get('expected_answer') or None,
+                'keywords': entry.get('keywords') or [],
+                'category': entry.get('category')
+            }
+            loaded.append(question)
+        
+        # Compile all loaded questions with one batched spaCy pass
+        self.compile_question_bank(loaded)
+        logger.info(f"Loaded {len(loaded)} questions from {file_path}")
+        return len(loaded)
+    
+    def compile_question_bank(self, questions=None):
+        """
+        Precompute question and expected-answer vectors and keyword matchers.
+        
+        After compilation, scoring an answer to a bank question only processes the answer.
+        
+        Args:
+            questions (list, optional): Questions to (re)compile. Defaults to the whole bank.
+        """
+        if questions is None:
+            questions = list(self.question_bank)
+        
+        questions = [question for question in questions if question in self.question_bank]
+        if not questions:
+            return
+        
+        texts = []
+        for question in questions:
+            texts.append(question)
+            texts.append(self.question_bank[question].get('expected_answer'))
+        docs = process_texts(texts)
+        
+        for question in questions:
+            details = self.question_bank[question]
+            question_doc = docs.get(question)
+            expected_doc = docs.get(details.get('expected_answer'))
+            self.compiled_questions[question] = {
+                'question_vector': TextVector.from_doc(question_doc) if question_doc is not None else None,
+                'expected_vector': TextVector.from_doc(expected_doc) if expected_doc is not None else None,
+                'keyword_matcher': KeywordMatcher(details.get('keywords'))
+            }
+        
+        self._question_index = None
+        self.bank_version += 1
+    
+    def _get_question_index(self):
+        """
+        Build (or return) the lookup structures over compiled bank questions.
+        
+        Returns:
+            dict: Normalized-wording map plus the bank questions and their unit question vectors
+                stacked into one matrix (None if no question has a vector)
+        """
+        if self._question_index is None:
+            normalized = {}
+            questions = []
+            vectors = []
+            for question, compiled in self.compiled_questions.items():
+                normalized.setdefault(_normalize_question(question), question)
+                
+                vector = compiled.get('question_vector')
+                if vector is not None and vector.vector_norm:
+                    questions.append(question)
+                    vectors.append(vector.vector / vector.vector_norm)
+            
+            self._question_index = {
+                'normalized': normalized,
+                'questions': questions,
+                'matrix': np.vstack(vectors).astype(np.float32) if vectors else None
+            }
+        
+        return self._question_index
+    
+    def resolve_question(self, question, question_doc=None):
+        """
+        Find the bank entry for a question, tolerating differences in wording.
+        
+        Tries the exact wording, then the wording ignoring case and punctuation, and finally
+        the most similar bank question by vector, accepted at or above match_threshold.
+        
+        Args:
+            question (str): The interview question as asked
+            question_doc (spacy.tokens.Doc, optional): Processed question, if already available. Defaults to None.
+            
+        Returns:
+            str: The matching bank question, or None if there is no close enough entry
+        """
+        if question in self.question_bank:
+            return question
+        
+        index = self._get_question_index()
+        match = index['normalized'].get(_normalize_question(question))
+        if match is not None:
+            return match
+        
+        if index['matrix'] is None:
+            return None
+        
+        if question_doc is None:
+            question_doc = process_texts([question]).get(question)
+        if question_doc is None or not question_doc.vector_norm:
+            return None
+        
+        # One matrix-vector product scores the question against the whole bank
+        query = np.asarray(question_doc.vector, dtype=np.float32) / question_doc.vector_norm
+        similarities = index['matrix'] @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.match_threshold:
+            return None
+        
+        logger.debug(f"Resolved question '{question}' to bank question '{index['questions'][best]}' "
+                     f"(similarity {similarities[best]:.3f})")
+        return index['questions'][best]
     
-    def calculate_relevance_score(self, question, answer):
+    def calculate_relevance_score(self, question, answer, question_doc=None, answer_doc=None):
         """
         Calculate how relevant the answer is to the question.
         
         Args:
             question (str): The interview question
             answer (str): The candidate's answer
+            question_doc (spacy.tokens.Doc or TextVector, optional): Already processed question. Defaults to None.
+            answer_doc (spacy.tokens.Doc, optional): Already processed answer. Defaults to None.
             
         Returns:
             float: Relevance score between 0 and 100
@@ -67,12 +257,16 @@ class InterviewAnalyzer:
         if not question or not answer:
             return 0
         
-        # Calculate semantic similarity
-        similarity = calculate_similarity(question, answer)
+        # Calculate semantic similarity, reusing Docs from a batched run when available
+        if question_doc is not None and answer_doc is not None:
+            similarity = calculate_doc_similarity(question_doc, answer_doc)
+        else:
+            similarity = calculate_similarity(question, answer)
         
         return round(similarity * 100, 2)
     
-    def calculate_completeness_score(self, answer, expected_answer=None, keywords=None):
+    def calculate_completeness_score(self, answer, expected_answer=None, keywords=None, answer_doc=None,
+                                     expected_doc=None, keyword_hits=None):
         """
         Calculate how complete the answer is.
         
@@ -80,6 +274,10 @@ class InterviewAnalyzer:
             answer (str): The candidate's answer
             expected_answer (str, optional): Expected answer. Defaults to None.
             keywords (list, optional): List of expected keywords. Defaults to None.
+            answer_doc (spacy.tokens.Doc, optional): Already processed answer. Defaults to None.
+            expected_doc (spacy.tokens.Doc or TextVector, optional): Already processed expected answer. Defaults to None.
+            keyword_hits (list, optional): Keywords already found in the answer by a shared
+                keyword pass. Defaults to None.
             
         Returns:
             float: Completeness score between 0 and 100
@@ -87,22 +285,47 @@ class InterviewAnalyzer:
         if not answer:
             return 0
         
-        score = 0
+        keyword_score = None
+        similarity = None
         
         # If we have keywords, check how many are present
         if keywords:
-            answer_lower = answer.lower()
-            found_keywords = [keyword for keyword in keywords if keyword.lower() in answer_lower]
-            keyword_score = len(found_keywords) / len(keywords) if keywords else 0
-            score += keyword_score * 0.6  # Weight for keywords
+            if keyword_hits is not None:
+                found_keywords = keyword_hits
+            else:
+                found_keywords = KeywordMatcher(keywords).find_matches(answer)
+            keyword_score = len(found_keywords) / len(keywords)
         
         # If we have an expected answer, calculate similarity
         if expected_answer:
-            similarity = calculate_similarity(expected_answer, answer)
+            if expected_doc is not None and answer_doc is not None:
+                similarity = calculate_doc_similarity(expected_doc, answer_doc)
+            else:
+                similarity = calculate_similarity(expected_answer, answer)
+        
+        return self._combine_completeness(keyword_score, similarity)
+    
+    def _combine_completeness(self, keyword_score=None, similarity=None):
+        """
+        Combine keyword coverage and expected-answer similarity into a completeness score.
+        
+        Args:
+            keyword_score (float, optional): Fraction of keywords found, None without keywords. Defaults to None.
+            similarity (float, optional): Similarity to the expected answer, None without one. Defaults to None.
+            
+        Returns:
+            float: Completeness score between 0 and 100
+        """
+        score = 0
+        
+        if keyword_score is not None:
+            score += keyword_score * 0.6  # Weight for keywords
+        
+        if similarity is not None:
             score += similarity * 0.4  # Weight for expected answer similarity
         else:
             # If no expected answer, just consider keywords
-            score = keyword_score if keywords else 0.5  # Default middle score
+            score = keyword_score if keyword_score is not None else 0.5  # Default middle score
         
         return round(score * 100, 2)
     
@@ -123,14 +346,102 @@ class InterviewAnalyzer:
         words = answer.split()
         avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
         
-        # Very long words might indicate complexity
-        word_length_score = 1.0 if 4 <= avg_word_length <= 8 else 0.7
-        
         # Sentence length analysis
         sentences = re.split(r'[.!?]+', answer)
         sentences = [s.strip() for s in sentences if s.strip()]
         avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0
         
+        return self._clarity_from_stats(avg_word_length, avg_sentence_length)
+    
+    def calculate_clarity_scores(self, answers):
+        """
+        Calculate clarity for many answers at once with array operations.
+        
+        All answers are concatenated into one code point buffer; words, sentence pieces
+        and sentences are found with vectorized masks and counted per answer via offsets.
+        Results are identical to calling calculate_clarity_score on each answer.
+        
+        Args:
+            answers (list): List of answer strings
+            
+        Returns:
+            list: Clarity scores between 0 and 100, one per answer
+        """
+        global _CHAR_CLASSES
+        
+        if not answers:
+            return []
+        
+        if _CHAR_CLASSES is None:
+            classes = np.zeros(_CHAR_CLASS_LIMIT + 1, dtype=np.uint8)
+            classes[[c for c in range(_CHAR_CLASS_LIMIT) if chr(c).isspace()]] = 1
+            classes[[ord('.'), ord('!'), ord('?')]] = 2
+            _CHAR_CLASSES = classes
+        
+        answers = [answer if answer else "" for answer in answers]
+        lengths = np.array([len(answer) for answer in answers], dtype=np.int64)
+        edges = np.concatenate(([0], np.cumsum(lengths)))
+        starts = edges[:-1]
+        
+        def count_per_answer(positions):
+            # Positions are sorted, so answer offsets split them into per-answer runs
+            return np.diff(np.searchsorted(positions, edges))
+        
+        # One code point buffer for all answers
+        buffer = np.frombuffer("".join(answers).encode('utf-32-le'), dtype=np.uint32)
+        char_class = _CHAR_CLASSES[np.minimum(buffer, _CHAR_CLASS_LIMIT)]
+        is_space = char_class == 1
+        is_terminator = char_class == 2
+        
+        # Characters that begin a new answer act as if preceded by whitespace
+        answer_start = np.zeros(len(buffer), dtype=bool)
+        answer_start[starts[lengths > 0]] = True
+        
+        # Words as str.split() sees them: runs of non-whitespace
+        prev_space = np.concatenate(([True], is_space[:-1])) | answer_start
+        word_count = count_per_answer(np.flatnonzero(~is_space & prev_space))
+        word_chars = lengths - count_per_answer(np.flatnonzero(is_space))
+        
+        # Sentence words: runs of characters that are neither whitespace nor terminators
+        is_text = ~is_space & ~is_terminator
+        prev_break = np.concatenate(([True], ~is_text[:-1])) | answer_start
+        piece_starts = np.flatnonzero(is_text & prev_break)
+        sentence_words = count_per_answer(piece_starts)
+        
+        # Non-empty sentences: distinct terminator-delimited segments containing a word
+        boundaries = np.flatnonzero(is_terminator | answer_start)
+        piece_segments = np.searchsorted(boundaries, piece_starts, side='right')
+        first_in_segment = np.diff(piece_segments, prepend=-1) != 0
+        sentence_count = count_per_answer(piece_starts[first_in_segment])
+        
+        scores = []
+        for i, answer in enumerate(answers):
+            if not answer:
+                scores.append(0)
+                continue
+            
+            words = int(word_count[i])
+            sentences = int(sentence_count[i])
+            avg_word_length = int(word_chars[i]) / words if words else 0
+            avg_sentence_length = int(sentence_words[i]) / sentences if sentences else 0
+            scores.append(self._clarity_from_stats(avg_word_length, avg_sentence_length))
+        
+        return scores
+    
+    def _clarity_from_stats(self, avg_word_length, avg_sentence_length):
+        """
+        Turn average word and sentence lengths into a clarity score.
+        
+        Args:
+            avg_word_length (float): Average characters per word
+            avg_sentence_length (float): Average words per sentence
+            
+        Returns:
+            float: Clarity score between 0 and 100
+        """
+        # Very long words might indicate complexity
+        word_length_score = 1.0 if 4 <= avg_word_length <= 8 else 0.7
+        
         # Very long sentences might indicate lack of clarity
         sentence_length_score = 1.0 if 8 <= avg_sentence_length <= 20 else 0.7
         
@@ -139,13 +450,15 @@ class InterviewAnalyzer:
         
         return round(clarity_score * 100, 2)
     
-    def calculate_technical_accuracy(self, answer, technical_keywords=None):
+    def calculate_technical_accuracy(self, answer, technical_keywords=None, keyword_hits=None):
         """
         Calculate technical accuracy of the answer.
         
         Args:
             answer (str): The candidate's answer
             technical_keywords (list, optional): List of technical keywords. Defaults to None.
+            keyword_hits (list, optional): Keywords already found in the answer by a shared
+                keyword pass. Defaults to None.
             
         Returns:
             float: Technical accuracy score between 0 and 100
@@ -154,20 +467,24 @@ class InterviewAnalyzer:
             return 50  # Default middle score
         
         # Check for technical keywords
-        answer_lower = answer.lower()
-        found_keywords = [keyword for keyword in technical_keywords if keyword.lower() in answer_lower]
+        if keyword_hits is not None:
+            found_keywords = keyword_hits
+        else:
+            found_keywords = KeywordMatcher(technical_keywords).find_matches(answer)
         
         technical_score = len(found_keywords) / len(technical_keywords) if technical_keywords else 0.5
         
         return round(technical_score * 100, 2)
     
-    def analyze_response(self, question, answer):
+    def analyze_response(self, question, answer, docs=None, clarity_score=None):
         """
         Analyze a single interview response.
         
         Args:
             question (str): The interview question
             answer (str): The candidate's answer
+            docs (dict, optional): Docs keyed by text from a batched process_texts run. Defaults to None.
+            clarity_score (float, optional): Clarity already computed by calculate_clarity_scores. Defaults to None.
             
         Returns:
             dict: Dictionary containing analysis results
@@ -176,51 +493,169 @@ class InterviewAnalyzer:
             logger.error("Question or answer is empty")
             return None
         
+        # Resubmitted answers only need their feedback assembled again
+        cache_key = self._response_cache_key(question, answer)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return self._assemble_result(question, answer, cached)
+        
+        # Look up Docs shared by the relevance and completeness scores
+        docs = docs or {}
+        question_doc = docs.get(question)
+        answer_doc = docs.get(answer)
+        
+        # Questions worded differently from the bank need their own Doc, processed with the answer
+        if question not in self.compiled_questions and question_doc is None:
+            new_docs = process_texts([answer, question] if answer_doc is None else [question])
+            answer_doc = answer_doc if answer_doc is not None else new_docs.get(answer)
+            question_doc = new_docs.get(question)
+        
         # Get question details from bank if available
-        question_details = self.question_bank.get(question, {
+        bank_question = self.resolve_question(question, question_doc)
+        question_details = self.question_bank.get(bank_question, {
             'expected_answer': None,
             'keywords': [],
             'category': None
         })
         
+        # Cached vectors and matcher for bank questions
+        compiled = self.compiled_questions.get(bank_question, {})
+        expected_answer = question_details.get('expected_answer')
+        if question_doc is None:
+            question_doc = compiled.get('question_vector')
+        expected_doc = compiled.get('expected_vector') or docs.get(expected_answer)
+        
+        # Process only what is not cached yet, in a single spaCy call
+        missing = [answer] if answer_doc is None else []
+        if question_doc is None:
+            missing.append(question)
+        if expected_answer and expected_doc is None:
+            missing.append(expected_answer)
+        if missing:
+            new_docs = process_texts(missing)
+            answer_doc = answer_doc if answer_doc is not None else new_docs.get(answer)
+            question_doc = question_doc if question_doc is not None else new_docs.get(question)
+            expected_doc = expected_doc if expected_doc is not None else new_docs.get(expected_answer)
+        
+        # Single keyword pass shared by completeness and technical accuracy
+        keyword_matcher = compiled.get('keyword_matcher')
+        if keyword_matcher is None:
+            keyword_matcher = KeywordMatcher(question_details.get('keywords'))
+        keyword_hits = keyword_matcher.find_matches(answer)
+        
         # Calculate individual scores
-        relevance_score = self.calculate_relevance_score(question, answer)
+        relevance_score = self.calculate_relevance_score(question, answer, question_doc, answer_doc)
         completeness_score = self.calculate_completeness_score(
             answer, 
-            question_details.get('expected_answer'), 
-            question_details.get('keywords')
+            expected_answer, 
+            question_details.get('keywords'),
+            answer_doc,
+            expected_doc,
+            keyword_hits
+        )
+        if clarity_score is None:
+            clarity_score = self.calculate_clarity_score(answer)
+        technical_accuracy = self.calculate_technical_accuracy(
+            answer,
+            question_details.get('keywords'),
+            keyword_hits
         )
-        clarity_score = self.calculate_clarity_score(answer)
-        technical_accuracy = self.calculate_technical_accuracy(answer, question_details.get('keywords'))
         
         # Calculate overall score
-        overall_score = (
-            relevance_score * self.weights['relevance'] +
-            completeness_score * self.weights['completeness'] +
-            clarity_score * self.weights['clarity'] +
-            technical_accuracy * self.weights['technical_accuracy']
-        ) / 100
+        overall_score = self._calculate_overall_score(relevance_score, completeness_score, clarity_score, technical_accuracy)
         
-        # Prepare result
-        result = {
-            'question': question,
+        scores = {
+            'bank_question': bank_question,
             'category': question_details.get('category', 'General'),
-            'answer': answer,
-            'overall_score': round(overall_score, 2),
+            'overall_score': overall_score,
             'relevance_score': relevance_score,
             'completeness_score': completeness_score,
             'clarity_score': clarity_score,
             'technical_accuracy': technical_accuracy,
+            'keywords': question_details.get('keywords', [])
+        }
+        self.response_cache.put(cache_key, scores)
+        
+        return self._assemble_result(question, answer, scores)
+    
+    def _response_cache_key(self, question, answer):
+        """
+        Build the memoization key for a response.
+        
+        Args:
+            question (str): The interview question
+            answer (str): The candidate's answer
+            
+        Returns:
+            tuple: Question, answer digest, question bank version, weights and match threshold
+        """
+        answer_digest = hashlib.sha1(answer.encode('utf-8')).hexdigest()
+        return (question, answer_digest, self.bank_version, tuple(sorted(self.weights.items())), self.match_threshold)
+    
+    def _assemble_result(self, question, answer, scores):
+        """
+        Assemble a response result, including feedback, from its (possibly memoized) scores.
+        
+        Args:
+            question (str): The interview question
+            answer (str): The candidate's answer
+            scores (dict): Scores computed by analyze_response
+            
+        Returns:
+            dict: Dictionary containing analysis results
+        """
+        return {
+            'question': question,
+            'bank_question': scores['bank_question'],
+            'category': scores['category'],
+            'answer': answer,
+            'overall_score': scores['overall_score'],
+            'relevance_score': scores['relevance_score'],
+            'completeness_score': scores['completeness_score'],
+            'clarity_score': scores['clarity_score'],
+            'technical_accuracy': scores['technical_accuracy'],
             'feedback': self.generate_feedback(
-                relevance_score, 
-                completeness_score, 
-                clarity_score, 
-                technical_accuracy,
-                question_details.get('keywords', [])
+                scores['relevance_score'], 
+                scores['completeness_score'], 
+                scores['clarity_score'], 
+                scores['technical_accuracy'],
+                scores['keywords']
             )
         }
+    
+    def _calculate_overall_score(self, relevance, completeness, clarity, technical_accuracy):
+        """
+        Combine component scores using the analyzer weights.
+        
+        Args:
+            relevance (float): Relevance score
+            completeness (float): Completeness score
+            clarity (float): Clarity score
+            technical_accuracy (float): Technical accuracy score
+            
+        Returns:
+            float: Overall score
+        """
+        overall_score = (
+            relevance * self.weights['relevance'] +
+            completeness * self.weights['completeness'] +
+            clarity * self.weights['clarity'] +
+            technical_accuracy * self.weights['technical_accuracy']
+        ) / 100
+        
+        return round(overall_score, 2)
+    
+    def start_live_response(self, question):
+        """
+        Start scoring an answer that arrives as a stream of transcript chunks.
         
-        return result
+        Args:
+            question (str): The interview question being answered
+            
+        Returns:
+            LiveResponse: In-progress answer accepting chunks via append()
+        """
+        return LiveResponse(self, question)
     
     def generate_feedback(self, relevance, completeness, clarity, technical_accuracy, expected_keywords=None):
         """
@@ -289,55 +724,490 @@ class InterviewAnalyzer:
             logger.error("No interview data provided")
             return None
         
-        analysis_results = []
-        for item in interview_data:
-            question = item.get('question')
-            answer = item.get('answer')
+        return self.analyze_interviews([interview_data])[0]
+    
+    def analyze_interviews(self, interviews, batch_size=64):
+        """
+        Analyze many interviews as one batched job.
+        
+        All answers (and questions missing from the compiled bank) are run through spaCy
+        once with nlp.pipe, and the resulting Docs are shared by the relevance and
+        completeness scores. Clarity is computed for all answers in one vectorized pass.
+        Memoized responses are skipped by both passes.
+        
+        Args:
+            interviews (list): List of interviews, each a list of question/answer dictionaries
+            batch_size (int, optional): Number of texts per spaCy batch. Defaults to 64.
+            
+        Returns:
+            list: List of interview summaries (None for empty interviews), in input order
+        """
+        # Collect every text needed for similarity across all interviews
+        texts = []
+        answers = []
+        for interview_data in interviews:
+            for item in interview_data or []:
+                question = item.get('question')
+                answer = item.get('answer')
+                # Memoized responses need no spaCy or clarity work
+                if question and answer and self._response_cache_key(question, answer) not in self.response_cache:
+                    texts.append(answer)
+                    answers.append(answer)
+                    # Bank questions already carry cached question and expected-answer vectors
+                    if question not in self.compiled_questions:
+                        texts.append(question)
+        
+        docs = process_texts(texts, batch_size=batch_size)
+        
+        # Clarity for every answer in one vectorized pass
+        answers = list(dict.fromkeys(answers))
+        clarity_scores = dict(zip(answers, self.calculate_clarity_scores(answers)))
+        
+        summaries = []
+        for interview_data in interviews:
+            analysis_results = []
+            for item in interview_data or []:
+                question = item.get('question')
+                answer = item.get('answer')
+                
+                if question and answer:
+                    result = self.analyze_response(question, answer, docs=docs, clarity_score=clarity_scores.get(answer))
+                    if result:
+                        analysis_results.append(result)
+            
+            summaries.append(self._summarize_results(analysis_results))
+        
+        return summaries
+    
+    def stream_interview_summaries(self, interviews, batch_size=32, include_details=False, aggregator=None):
+        """
+        Analyze a stream of interviews in batches and yield one summary per candidate.
+        
+        Memory stays bounded by the batch size, so archives that do not fit in memory can
+        be scored by passing file_utils.iter_interviews(path).
+        
+        Args:
+            interviews (iterable): Interviews with a "responses" list, e.g. from file_utils.iter_interviews
+            batch_size (int, optional): Number of interviews analyzed per batched spaCy run. Defaults to 32.
+            include_details (bool, optional): Keep per-question results in each summary. Defaults to False.
+            aggregator (InterviewStatsAggregator, optional): Receives every per-question result before
+                details are dropped, so cohort statistics need no second pass. Defaults to None.
+            
+        Yields:
+            dict: Candidate metadata plus the interview "summary" (None if nothing could be scored)
+        """
+        batch = []
+        for interview in interviews:
+            batch.append(interview)
+            if len(batch) >= batch_size:
+                yield from self._summarize_batch(batch, include_details, aggregator)
+                batch = []
+        
+        if batch:
+            yield from self._summarize_batch(batch, include_details, aggregator)
+    
+    def _summarize_batch(self, batch, include_details, aggregator=None):
+        """
+        Analyze one batch of streamed interviews.
+        
+        Args:
+            batch (list): Interviews with a "responses" list
+            include_details (bool): Keep per-question results in each summary
+            aggregator (InterviewStatsAggregator, optional): Collects cohort statistics. Defaults to None.
+            
+        Yields:
+            dict: Candidate metadata plus the interview "summary"
+        """
+        summaries = self.analyze_interviews([interview.get('responses') for interview in batch])
+        
+        for interview, summary in zip(batch, summaries):
+            if summary and aggregator is not None:
+                aggregator.add_summary(summary)
             
-            if question and answer:
-                result = self.analyze_response(question, answer)
-                if result:
-                    analysis_results.append(result)
-        
-        # Calculate average scores
-        if analysis_results:
-            avg_overall = sum(r['overall_score'] for r in analysis_results) / len(analysis_results)
-            avg_relevance = sum(r['relevance_score'] for r in analysis_results) / len(analysis_results)
-            avg_completeness = sum(r['completeness_score'] for r in analysis_results) / len(analysis_results)
-            avg_clarity = sum(r['clarity_score'] for r in analysis_results) / len(analysis_results)
-            avg_technical = sum(r['technical_accuracy'] for r in analysis_results) / len(analysis_results)
+            if summary and not include_details:
+                summary.pop('detailed_results', None)
             
-            # Group results by category
-            categories = {}
-            for result in analysis_results:
-                category = result['category']
-                if category not in categories:
-                    categories[category] = {
-                        'count': 0,
-                        'score_sum': 0
-                    }
-                categories[category]['count'] += 1
-                categories[category]['score_sum'] += result['overall_score']
+            result = {key: value for key, value in interview.items() if key != 'responses'}
+            result['summary'] = summary
+            yield result
+    
+    def _summarize_results(self, analysis_results):
+        """
+        Aggregate per-question results into an interview summary.
+        
+        Args:
+            analysis_results (list): List of analyze_response results
             
-            # Calculate average score per category
-            category_scores = {
-                category: round(data['score_sum'] / data['count'], 2)
-                for category, data in categories.items()
-            }
+        Returns:
+            dict: Dictionary containing analysis results, or None if there are no results
+        """
+        if not analysis_results:
+            return None
+        
+        # Accumulate metric sums and per-category totals in a single pass
+        totals = dict.fromkeys(SCORE_METRICS, 0)
+        categories = {}
+        for result in analysis_results:
+            for metric in SCORE_METRICS:
+                totals[metric] += result[metric]
             
-            summary = {
-                'overall_score': round(avg_overall, 2),
-                'average_scores': {
-                    'relevance': round(avg_relevance, 2),
-                    'completeness': round(avg_completeness, 2),
-                    'clarity': round(avg_clarity, 2),
-                    'technical_accuracy': round(avg_technical, 2)
-                },
-                'category_scores': category_scores,
-                'question_count': len(analysis_results),
-                'detailed_results': analysis_results
+            category = result['category']
+            if category not in categories:
+                categories[category] = {
+                    'count': 0,
+                    'score_sum': 0
+                }
+            categories[category]['count'] += 1
+            categories[category]['score_sum'] += result['overall_score']
+        
+        count = len(analysis_results)
+        
+        # Calculate average score per category
+        category_scores = {
+            category: round(data['score_sum'] / data['count'], 2)
+            for category, data in categories.items()
+        }
+        
+        return {
+            'overall_score': round(totals['overall_score'] / count, 2),
+            'average_scores': {
+                'relevance': round(totals['relevance_score'] / count, 2),
+                'completeness': round(totals['completeness_score'] / count, 2),
+                'clarity': round(totals['clarity_score'] / count, 2),
+                'technical_accuracy': round(totals['technical_accuracy'] / count, 2)
+            },
+            'category_scores': category_scores,
+            'question_count': count,
+            'detailed_results': analysis_results
+        }
+
+class LiveResponse:
+    """In-progress interview answer scored incrementally as transcript chunks arrive."""
+    
+    def __init__(self, analyzer, question):
+        """
+        Initialize LiveResponse.
+        
+        Args:
+            analyzer (InterviewAnalyzer): Analyzer providing the question bank and weights
+            question (str): The interview question being answered
+        """
+        self.analyzer = analyzer
+        self.question = question
+        
+        question_doc = None
+        if question not in analyzer.compiled_questions:
+            question_doc = process_texts([question]).get(question)
+        
+        self.bank_question = analyzer.resolve_question(question, question_doc)
+        self.question_details = analyzer.question_bank.get(self.bank_question, {
+            'expected_answer': None,
+            'keywords': [],
+            'category': None
+        })
+        
+        # Expected answer and matcher come from the compiled bank entry when available
+        compiled = analyzer.compiled_questions.get(self.bank_question)
+        if compiled is None:
+            compiled = {
+                'question_vector': None,
+                'expected_vector': None,
+                'keyword_matcher': KeywordMatcher(self.question_details.get('keywords'))
             }
+        
+        # Relevance is measured against the question as asked, not its bank wording
+        if question_doc is not None:
+            self.question_vector = TextVector.from_doc(question_doc)
+        else:
+            self.question_vector = analyzer.compiled_questions.get(question, {}).get('question_vector')
+        self.expected_vector = compiled['expected_vector']
+        self.keyword_matcher = compiled['keyword_matcher']
+        
+        self._chunks = []
+        
+        # Trailing text after the last whitespace; may be a word that is still being spoken
+        self._pending = ""
+        
+        # Clarity statistics over completed words
+        self._word_count = 0
+        self._word_chars = 0
+        self._sentence_count = 0
+        self._sentence_words = 0
+        self._open_sentence_words = 0
+        
+        # Keyword hits, plus the last tokens needed to complete multi-token keywords
+        self._keyword_hits = set()
+        self._token_tail = []
+        
+        # Running sum of token vectors
+        self._vector_sum = None
+        self._vector_tokens = 0
+    
+    @property
+    def text(self):
+        """str: The answer received so far."""
+        return "".join(self._chunks)
+    
+    def append(self, chunk):
+        """
+        Append a transcript chunk and update the running statistics.
+        
+        Only the new chunk is processed, so the cost per chunk does not depend on the answer length.
+        
+        Args:
+            chunk (str): Next piece of the transcript
+        """
+        if not chunk:
+            return
+        
+        self._chunks.append(chunk)
+        
+        # Hold back the trailing partial word until whitespace closes it
+        buffer = self._pending + chunk
+        split_at = len(buffer)
+        while split_at and not buffer[split_at - 1].isspace():
+            split_at -= 1
+        complete, self._pending = buffer[:split_at], buffer[split_at:]
+        
+        if not complete.strip():
+            return
+        
+        words = complete.split()
+        self._word_count += len(words)
+        self._word_chars += sum(len(word) for word in words)
+        self._sentence_count, self._sentence_words, self._open_sentence_words = self._count_sentences(
+            words, self._sentence_count, self._sentence_words, self._open_sentence_words
+        )
+        
+        window = self._token_tail + tokenize_for_matching(complete)
+        self._keyword_hits |= self.keyword_matcher.match_indices(window)
+        keep = self.keyword_matcher.max_tokens - 1
+        self._token_tail = window[-keep:] if keep > 0 else []
+        
+        doc = process_texts([complete]).get(complete)
+        if doc is not None and len(doc):
+            weighted = np.array(doc.vector) * len(doc)
+            self._vector_sum = weighted if self._vector_sum is None else self._vector_sum + weighted
+            self._vector_tokens += len(doc)
+    
+    def _count_sentences(self, words, sentence_count, sentence_words, open_sentence_words):
+        """
+        Advance the sentence statistics of calculate_clarity_score over whitespace-separated words.
+        
+        Args:
+            words (list): Completed words in order
+            sentence_count (int): Number of closed non-empty sentences so far
+            sentence_words (int): Words in closed sentences so far
+            open_sentence_words (int): Words in the sentence still open
             
-            return summary
+        Returns:
+            tuple: Updated (sentence_count, sentence_words, open_sentence_words)
+        """
+        for word in words:
+            pieces = re.split(r'[.!?]+', word)
+            if pieces[0]:
+                open_sentence_words += 1
+            
+            # Every further piece starts after a sentence terminator
+            for piece in pieces[1:]:
+                if open_sentence_words:
+                    sentence_count += 1
+                    sentence_words += open_sentence_words
+                open_sentence_words = 1 if piece else 0
+        
+        return sentence_count, sentence_words, open_sentence_words
+    
+    def provisional_scores(self):
+        """
+        Score the answer received so far without reprocessing earlier chunks.
+        
+        Clarity and keyword scores include the trailing partial word; the running vector
+        covers completed words only.
+        
+        Returns:
+            dict: Dictionary of provisional scores, or None if nothing has been received
+        """
+        if not self._word_count and not self._pending.strip():
+            return None
+        
+        # Clarity statistics including the pending word, as calculate_clarity_score would see them
+        pending_words = self._pending.split()
+        word_count = self._word_count + len(pending_words)
+        word_chars = self._word_chars + sum(len(word) for word in pending_words)
+        sentence_count, sentence_words, open_words = self._count_sentences(
+            pending_words, self._sentence_count, self._sentence_words, self._open_sentence_words
+        )
+        if open_words:
+            sentence_count += 1
+            sentence_words += open_words
+        
+        avg_word_length = word_chars / word_count if word_count else 0
+        avg_sentence_length = sentence_words / sentence_count if sentence_count else 0
+        clarity_score = self.analyzer._clarity_from_stats(avg_word_length, avg_sentence_length)
+        
+        # Keyword hits including tokens of the pending word
+        hits = self._keyword_hits
+        if self._pending:
+            hits = hits | self.keyword_matcher.match_indices(self._token_tail + tokenize_for_matching(self._pending))
+        
+        keywords = self.question_details.get('keywords')
+        keyword_score = len(hits) / len(keywords) if keywords else None
+        technical_accuracy = round(keyword_score * 100, 2) if keywords else 50
+        
+        # Similarities from the running mean vector
+        answer_vector = None
+        if self._vector_tokens:
+            mean_vector = self._vector_sum / self._vector_tokens
+            answer_vector = TextVector(mean_vector, float(np.linalg.norm(mean_vector)))
+        
+        relevance_score = 0
+        if answer_vector is not None and self.question_vector is not None:
+            relevance_score = round(calculate_doc_similarity(self.question_vector, answer_vector) * 100, 2)
+        
+        similarity = None
+        if self.question_details.get('expected_answer'):
+            similarity = 0.0
+            if answer_vector is not None and self.expected_vector is not None:
+                similarity = calculate_doc_similarity(self.expected_vector, answer_vector)
+        completeness_score = self.analyzer._combine_completeness(keyword_score, similarity)
+        
+        return {
+            'question': self.question,
+            'category': self.question_details.get('category', 'General'),
+            'overall_score': self.analyzer._calculate_overall_score(
+                relevance_score, completeness_score, clarity_score, technical_accuracy
+            ),
+            'relevance_score': relevance_score,
+            'completeness_score': completeness_score,
+            'clarity_score': clarity_score,
+            'technical_accuracy': technical_accuracy,
+            'found_keywords': [self.keyword_matcher.keywords[i] for i in sorted(hits)],
+            'provisional': True
+        }
+    
+    def finalize(self):
+        """
+        Run the full analysis on the complete answer.
+        
+        Returns:
+            dict: Dictionary containing analysis results from InterviewAnalyzer.analyze_response
+        """
+        return self.analyzer.analyze_response(self.question, self.text)
+
+class InterviewStatsAggregator:
+    """Online cohort statistics per metric, category and question, mergeable across workers."""
+    
+    def __init__(self, resolution=0.01):
+        """
+        Initialize InterviewStatsAggregator.
+        
+        Args:
+            resolution (float, optional): Score resolution of the quantile histograms, matching the
+                two-decimal rounding of analyzer scores. Defaults to 0.01.
+        """
+        self.resolution = resolution
+        self.interview_count = 0
+        self.response_count = 0
+        self.overall = self._new_group()
+        self.categories = {}
+        self.questions = {}
+    
+    def _new_group(self):
+        """
+        Create one RunningStats per score metric.
+        
+        Returns:
+            dict: Dictionary mapping metric names to RunningStats
+        """
+        return {metric: RunningStats(self.resolution) for metric in SCORE_METRICS}
+    
+    def add_result(self, result):
+        """
+        Add one analyze_response result.
+        
+        Args:
+            result (dict): Per-question analysis result
+        """
+        # Questions outside the bank have category None, as in get_overall_analysis
+        category = result.get('category')
+        category_group = self.categories.get(category)
+        if category_group is None:
+            category_group = self.categories[category] = self._new_group()
+        
+        # Rephrasings of a bank question are counted under the bank wording
+        question = result.get('bank_question') or result['question']
+        question_group = self.questions.get(question)
+        if question_group is None:
+            question_group = self.questions[question] = self._new_group()
+        
+        for metric in SCORE_METRICS:
+            value = result[metric]
+            self.overall[metric].add(value)
+            category_group[metric].add(value)
+            question_group[metric].add(value)
+        
+        self.response_count += 1
+    
+    def add_summary(self, summary):
+        """
+        Add every per-question result of an interview summary.
+        
+        Args:
+            summary (dict): Summary from analyze_interview, including "detailed_results"
+        """
+        for result in summary.get('detailed_results', []):
+            self.add_result(result)
+        self.interview_count += 1
+    
+    def merge(self, other):
+        """
+        Merge an aggregator filled by another worker process.
+        
+        Args:
+            other (InterviewStatsAggregator): Aggregator to fold into this one
+        
+        Returns:
+            InterviewStatsAggregator: This aggregator
+        """
+        self._merge_group(self.overall, other.overall)
+        for target, source in ((self.categories, other.categories), (self.questions, other.questions)):
+            for key, group in source.items():
+                if key not in target:
+                    target[key] = self._new_group()
+                self._merge_group(target[key], group)
+        
+        self.interview_count += other.interview_count
+        self.response_count += other.response_count
+        return self
+    
+    def _merge_group(self, target, source):
+        """
+        Merge the per-metric statistics of one group.
+        
+        Args:
+            target (dict): Metric statistics updated in place
+            source (dict): Metric statistics to merge in
+        """
+        for metric in SCORE_METRICS:
+            target[metric].merge(source[metric])
+    
+    def to_dict(self, quantiles=(0.25, 0.5, 0.75, 0.9)):
+        """
+        Report the collected statistics.
+        
+        Args:
+            quantiles (tuple, optional): Quantiles to report per metric. Defaults to (0.25, 0.5, 0.75, 0.9).
+        
+        Returns:
+            dict: Dictionary with overall, per-category and per-question metric statistics
+        """
+        def describe(group):
+            return {metric: stats.to_dict(quantiles) for metric, stats in group.items()}
         
-        return None 
\ No newline at end of file
+        return {
+            'interview_count': self.interview_count,
+            'response_count': self.response_count,
+            'overall': describe(self.overall),
+            'categories': {category: describe(group) for category, group in self.categories.items()},
+            'questions': {question: describe(group) for question, group in self.questions.items()}
+        }
\ No newline at end of file
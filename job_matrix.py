@@ -0,0 +1,470 @@
+import os
+import json
+import logging
+import argparse
+import numpy as np
+from scipy import sparse
+
+from utils.nlp_utils import preprocess_text, remove_stopwords, lemmatize_text, load_nlp, process_texts
+from utils.lexical_utils import LexicalScorer
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Same component weights as SkillsAnalyzer
+DEFAULT_WEIGHTS = {
+    'required_skills': 0.4,
+    'preferred_skills': 0.2,
+    'experience': 0.25,
+    'education': 0.15
+}
+
+# Bumped whenever the persisted JobIndex layout changes
+JOB_INDEX_VERSION = 2
+
+def _join_section(section):
+    """Join a resume section given as a list of entries into one string."""
+    if isinstance(section, list):
+        return ' '.join(section)
+    return section or ""
+
+def _prepare_text(text):
+    """Apply the SkillsAnalyzer preprocessing used before spaCy similarity."""
+    return lemmatize_text(remove_stopwords(preprocess_text(text)))
+
+def _unit_rows(vectors):
+    """
+    Scale the rows of a matrix to unit length, leaving all-zero rows at zero.
+    
+    Args:
+        vectors (numpy.ndarray): Matrix with one vector per row
+    
+    Returns:
+        numpy.ndarray: Row-normalized matrix
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+class MultiJobScorer:
+    """Score a resume pool against many job descriptions at once with matrix products."""
+    
+    def __init__(self, jobs, similarity_backend='spacy', weights=None, skill_taxonomy=None):
+        """
+        Initialize MultiJobScorer.
+        
+        Skill lists are compiled into sparse job-by-skill matrices and, for the spaCy
+        backend, every job description is vectorized once here.
+        
+        Args:
+            jobs (list): List of job dictionaries with 'job_description', 'required_skills' and
+                'preferred_skills', and optionally an 'id' (defaults to the position) and 'title'
+            similarity_backend (str, optional): 'spacy' or 'lexical', as in SkillsAnalyzer. Defaults to 'spacy'.
+            weights (dict, optional): Component weights. Defaults to the SkillsAnalyzer weights.
+            skill_taxonomy (SkillTaxonomy, optional): Taxonomy giving partial skill credit, as in
+                SkillsAnalyzer. Defaults to None.
+        """
+        if similarity_backend not in ('spacy', 'lexical'):
+            raise ValueError(f"Unsupported similarity backend: {similarity_backend}")
+        
+        self.jobs = jobs
+        self.job_ids = [job.get('id', i) for i, job in enumerate(jobs)]
+        self.job_descriptions = [job.get('job_description') or '' for job in jobs]
+        self.similarity_backend = similarity_backend
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self.lexical_scorer = None
+        self._job_queries = None
+        
+        # Skill vocabulary over all jobs; duplicate list entries count twice, as in calculate_skills_match
+        self.skill_ids = {}
+        required_entries, self.required_counts = self._collect_skills('required_skills')
+        preferred_entries, self.preferred_counts = self._collect_skills('preferred_skills')
+        self.required_matrix = self._skill_matrix(required_entries)
+        self.preferred_matrix = self._skill_matrix(preferred_entries)
+        
+        # Taxonomy credit rows of every vocabulary skill, gathered once for all pools
+        self.skill_taxonomy = skill_taxonomy
+        self.vocabulary_credit = None
+        if skill_taxonomy is not None:
+            vocabulary = sorted(self.skill_ids, key=self.skill_ids.get)
+            self.vocabulary_credit = skill_taxonomy.requirement_matrix(vocabulary).tocsc()
+        
+        self.job_vectors = self._build_job_vectors() if similarity_backend == 'spacy' else None
+        
+        logger.info(f"Prepared {len(jobs)} job descriptions over {len(self.skill_ids)} distinct skills")
+    
+    def __len__(self):
+        return len(self.jobs)
+    
+    def _collect_skills(self, field):
+        """
+        Collect the (job, skill) entries of one skill list field, extending the vocabulary.
+        
+        Args:
+            field (str): 'required_skills' or 'preferred_skills'
+        
+        Returns:
+            tuple: ((rows, cols) entry lists, numpy.ndarray of list lengths per job)
+        """
+        rows, cols = [], []
+        counts = np.zeros(len(self.jobs))
+        for row, job in enumerate(self.jobs):
+            skills = job.get(field) or []
+            counts[row] = len(skills)
+            for skill in skills:
+                rows.append(row)
+                cols.append(self.skill_ids.setdefault(skill.lower(), len(self.skill_ids)))
+        return (rows, cols), counts
+    
+    def _skill_matrix(self, entries):
+        """Build a sparse job-by-skill count matrix over the full vocabulary."""
+        rows, cols = entries
+        return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(self.jobs), len(self.skill_ids)))
+    
+    def _build_job_vectors(self):
+        """
+        Vectorize every job description once.
+        
+        Returns:
+            numpy.ndarray: Unit job vectors, one row per job (zero rows without a description)
+        """
+        nlp = load_nlp()
+        if not nlp:
+            logger.error("spaCy model not loaded. Cannot calculate similarity.")
+            return None
+        
+        prepared = [_prepare_text(text) if text else '' for text in self.job_descriptions]
+        docs = process_texts(prepared)
+        vectors = np.zeros((len(self.jobs), nlp.vocab.vectors_length), dtype=np.float32)
+        for row, text in enumerate(prepared):
+            if text in docs:
+                vectors[row] = docs[text].vector
+        return _unit_rows(vectors)
+    
+    def candidate_bitsets(self, resumes):
+        """
+        Encode each resume's skills as a binary row over the job skill vocabulary.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+        
+        Returns:
+            scipy.sparse.csr_matrix: Resume-by-skill matrix of ones
+        """
+        rows, cols = [], []
+        for row, resume in enumerate(resumes):
+            skill_columns = {self.skill_ids.get(skill.lower()) for skill in resume.get('skills') or []}
+            skill_columns.discard(None)
+            rows.extend([row] * len(skill_columns))
+            cols.extend(skill_columns)
+        
+        return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(resumes), len(self.skill_ids)))
+    
+    def score_skills(self, resumes):
+        """
+        Calculate the skills match score of every (resume, job) pair.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+        
+        Returns:
+            numpy.ndarray: Resume-by-job skills scores between 0 and 100
+        """
+        bitsets = self.candidate_bitsets(resumes)
+        if self.skill_taxonomy is not None:
+            # Best credit of the whole pool toward every vocabulary skill in one max-aggregating product
+            credits = self.skill_taxonomy.max_credits([resume.get('skills') for resume in resumes],
+                                                      self.vocabulary_credit)
+            bitsets = bitsets.maximum(credits)
+        
+        matched_required = (bitsets @ self.required_matrix.T).toarray()
+        matched_preferred = (bitsets @ self.preferred_matrix.T).toarray()
+        
+        required_match = np.divide(matched_required, self.required_counts,
+                                   out=np.zeros_like(matched_required), where=self.required_counts > 0)
+        preferred_match = np.divide(matched_preferred, self.preferred_counts,
+                                    out=np.zeros_like(matched_preferred), where=self.preferred_counts > 0)
+        
+        skill_weight = self.weights['required_skills'] + self.weights['preferred_skills']
+        scores = (required_match * self.weights['required_skills'] +
+                  preferred_match * self.weights['preferred_skills']) / skill_weight * 100
+        
+        # Resumes without any extracted skills score zero, as in calculate_skills_match
+        has_skills = np.array([bool(resume.get('skills')) for resume in resumes], dtype=bool)
+        scores[~has_skills] = 0
+        return np.round(scores, 2)
+    
+    def fit_lexical_model(self, resumes, method='tfidf'):
+        """
+        Fit the sparse lexical model on all job descriptions and the candidate corpus.
+        
+        The model is kept and used for every later pool; without it, score_relevance
+        fits a model on each pool it scores.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            method (str, optional): 'tfidf' or 'bm25'. Defaults to 'tfidf'.
+        
+        Returns:
+            LexicalScorer: The fitted scorer
+        """
+        self.lexical_scorer = LexicalScorer(method=method).fit(self._lexical_corpus(resumes))
+        self._job_queries = self.lexical_scorer.transform_queries(self.job_descriptions)
+        return self.lexical_scorer
+    
+    def _lexical_corpus(self, resumes):
+        """Collect every job description and every resume's experience and education texts."""
+        corpus = [text for text in self.job_descriptions if text]
+        for resume in resumes:
+            corpus.append(_join_section(resume.get('experience', [])))
+            corpus.append(_join_section(resume.get('education', [])))
+        return corpus
+    
+    def score_relevance(self, resumes):
+        """
+        Calculate experience and education relevance of every (resume, job) pair.
+        
+        Without a model from fit_lexical_model, the lexical backend fits a model on all
+        job descriptions and this pool for this call only, so one pool's statistics never
+        carry over to the next. Its term weights come from every job description, so
+        lexical scores differ slightly from a SkillsAnalyzer fitted on one job.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+        
+        Returns:
+            tuple: Resume-by-job experience and education scores between 0 and 100
+        """
+        experience_texts = [_join_section(resume.get('experience', [])) for resume in resumes]
+        education_texts = [_join_section(resume.get('education', [])) for resume in resumes]
+        shape = (len(resumes), len(self.jobs))
+        if not resumes:
+            return np.zeros(shape), np.zeros(shape)
+        
+        if self.similarity_backend == 'lexical':
+            scorer, queries = self.lexical_scorer, self._job_queries
+            if scorer is None:
+                try:
+                    scorer = LexicalScorer().fit(self._lexical_corpus(resumes))
+                except ValueError:
+                    # No job description or section has a single scorable term
+                    return np.zeros(shape), np.zeros(shape)
+                queries = scorer.transform_queries(self.job_descriptions)
+            documents = scorer.transform_documents(experience_texts + education_texts)
+            similarities = (documents @ queries.T).toarray()
+        elif self.job_vectors is not None:
+            prepared = [_prepare_text(text) if text else '' for text in experience_texts + education_texts]
+            docs = process_texts(prepared)
+            vectors = np.zeros((len(prepared), self.job_vectors.shape[1]), dtype=np.float32)
+            for row, text in enumerate(prepared):
+                if text in docs:
+                    vectors[row] = docs[text].vector
+            similarities = _unit_rows(vectors) @ self.job_vectors.T
+        else:
+            return np.zeros(shape), np.zeros(shape)
+        
+        similarities = np.round(similarities.astype(float) * 100, 2)
+        experience, education = similarities[:len(resumes)], similarities[len(resumes):]
+        
+        # Empty sections and empty job descriptions score zero
+        has_description = np.array([bool(text) for text in self.job_descriptions], dtype=bool)
+        experience[~np.array([bool(text) for text in experience_texts], dtype=bool)] = 0
+        education[~np.array([bool(text) for text in education_texts], dtype=bool)] = 0
+        experience[:, ~has_description] = 0
+        education[:, ~has_description] = 0
+        return experience, education
+    
+    def score(self, resumes, top_k=10):
+        """
+        Score every resume against every job.
+        
+        Args:
+            resumes (list): List of resume data dictionaries from ResumeParser
+            top_k (int, optional): Number of best candidates reported per job. Defaults to 10.
+        
+        Returns:
+            dict: Dictionary with resume-by-job 'overall', 'skills', 'experience' and 'education'
+                score matrices (overall on SkillsAnalyzer's 0-1 scale), 'job_ids', and
+                'top_candidates' mapping each job id to its best candidates
+        """
+        resumes = [resume for resume in resumes if resume]
+        skills = self.score_skills(resumes)
+        experience, education = self.score_relevance(resumes)
+        
+        overall = (
+            skills * (self.weights['required_skills'] + self.weights['preferred_skills']) +
+            experience * self.weights['experience'] +
+            education * self.weights['education']
+        ) / 100
+        overall = np.round(overall, 2)
+        
+        top_candidates = {}
+        for column, job_id in enumerate(self.job_ids):
+            top_candidates[job_id] = [
+                {
+                    'resume_index': int(row),
+                    'name': resumes[row].get('name', 'Unknown'),
+                    'filename': resumes[row].get('filename', 'Unknown'),
+                    'overall_score': float(overall[row, column])
+                }
+                for row in self._top_rows(overall[:, column], top_k)
+            ]
+        
+        logger.info(f"Scored {len(resumes)} resumes against {len(self.jobs)} job descriptions")
+        
+        return {
+            'job_ids': self.job_ids,
+            'overall': overall,
+            'skills': skills,
+            'experience': experience,
+            'education': education,
+            'top_candidates': top_candidates
+        }
+    
+    def _top_rows(self, scores, k):
+        """
+        Select the positions of the k highest scores, best first.
+        
+        Args:
+            scores (numpy.ndarray): Scores of one column
+            k (int): Number of positions
+        
+        Returns:
+            numpy.ndarray: Selected positions
+        """
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.zeros(0, dtype=int)
+        
+        candidates = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+class JobIndex(MultiJobScorer):
+    """Persistent index of open jobs for ranking the best-fitting jobs for one candidate."""
+    
+    def __init__(self, jobs, similarity_backend='spacy', weights=None, lexical_method='tfidf', skill_taxonomy=None):
+        """
+        Initialize JobIndex.
+        
+        Besides the skill matrices and job vectors of MultiJobScorer, the lexical
+        statistics are fitted on the job descriptions alone, so ranking a candidate
+        never refits anything.
+        
+        Args:
+            jobs (list): List of job dictionaries as for MultiJobScorer
+            similarity_backend (str, optional): 'spacy' or 'lexical'. Defaults to 'spacy'.
+            weights (dict, optional): Component weights. Defaults to the SkillsAnalyzer weights.
+            lexical_method (str, optional): 'tfidf' or 'bm25' for the lexical backend. Defaults to 'tfidf'.
+            skill_taxonomy (SkillTaxonomy, optional): Taxonomy giving partial skill credit. It is saved
+                by path and reopened on load. Defaults to None.
+        """
+        super().__init__(jobs, similarity_backend=similarity_backend, weights=weights, skill_taxonomy=skill_taxonomy)
+        
+        if similarity_backend == 'lexical':
+            self.fit_lexical_model([], method=lexical_method)
+    
+    def rank_jobs(self, resume_data, top_k=10):
+        """
+        Rank the indexed jobs for one candidate.
+        
+        Args:
+            resume_data (dict): Resume data from ResumeParser
+            top_k (int, optional): Number of jobs returned. Defaults to 10.
+        
+        Returns:
+            list: List of dictionaries with the job id, title and scores, best fit first
+        """
+        if not resume_data or not self.jobs:
+            return []
+        
+        skills = self.score_skills([resume_data])[0]
+        experience, education = self.score_relevance([resume_data])
+        experience, education = experience[0], education[0]
+        
+        overall = np.round((
+            skills * (self.weights['required_skills'] + self.weights['preferred_skills']) +
+            experience * self.weights['experience'] +
+            education * self.weights['education']
+        ) / 100, 2)
+        
+        return [
+            {
+                'job_id': self.job_ids[column],
+                'title': self.jobs[column].get('title', ''),
+                'overall_score': float(overall[column]),
+                'skills_score': float(skills[column]),
+                'experience_score': float(experience[column]),
+                'education_score': float(education[column])
+            }
+            for column in self._top_rows(overall, top_k)
+        ]
+    
+    def save(self, path):
+        """
+        Persist the index with its precomputed matrices and lexical model.
+        
+        Args:
+            path (str): Output file path
+        """
+        import joblib
+        
+        joblib.dump({'version': JOB_INDEX_VERSION, 'index': self}, path)
+        logger.info(f"Saved job index with {len(self.jobs)} jobs to {path}")
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index saved with save.
+        
+        Args:
+            path (str): Index file path
+        
+        Returns:
+            JobIndex: The loaded index
+        """
+        import joblib
+        
+        payload = joblib.load(path)
+        if payload.get('version') != JOB_INDEX_VERSION:
+            raise ValueError(f"Unsupported job index version {payload.get('version')}; rebuild the index")
+        
+        logger.info(f"Loaded job index with {len(payload['index'].jobs)} jobs from {path}")
+        return payload['index']
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the open-positions index used to rank jobs for a candidate.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    build = commands.add_parser('build', help="Build a JobIndex from a JSON file of jobs")
+    build.add_argument('jobs_path', help="JSON array of jobs, each with 'job_description', 'required_skills' and "
+                                         "'preferred_skills', and optionally 'id' and 'title'")
+    build.add_argument('output_path', help="Path of the index, e.g. job_index.joblib")
+    build.add_argument('--backend', choices=('spacy', 'lexical'), default='spacy',
+                       help="Similarity backend for experience and education relevance")
+    build.add_argument('--lexical-method', choices=('tfidf', 'bm25'), default='tfidf',
+                       help="Weighting scheme of the lexical backend")
+    build.add_argument('--taxonomy-file', help="Compiled skill taxonomy giving partial skill credit")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.jobs_path):
+        parser.error(f"{args.jobs_path} does not exist")
+    with open(args.jobs_path, 'r', encoding='utf-8') as file:
+        jobs = json.load(file)
+    if not isinstance(jobs, list):
+        parser.error(f"{args.jobs_path} must contain a JSON array of jobs")
+    
+    skill_taxonomy = None
+    if args.taxonomy_file:
+        from utils.skill_taxonomy import SkillTaxonomy
+        skill_taxonomy = SkillTaxonomy.load(args.taxonomy_file)
+    
+    # Under python -m this module is __main__; build through the importable module so the
+    # pickled index refers to utils.job_matrix.JobIndex and loads in the apps
+    import utils.job_matrix as job_matrix
+    
+    index = job_matrix.JobIndex(jobs, similarity_backend=args.backend, lexical_method=args.lexical_method,
+                     skill_taxonomy=skill_taxonomy)
+    index.save(args.output_path)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,139 @@
+import logging
+import numpy as np
+
+from utils.nlp_utils import preprocess_text
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class LexicalScorer:
+    """Sparse lexical relevance scorer (TF-IDF or BM25) fitted on a candidate corpus."""
+    
+    def __init__(self, method='tfidf', k1=1.5, b=0.75):
+        """
+        Initialize LexicalScorer.
+        
+        Args:
+            method (str, optional): Weighting scheme, 'tfidf' or 'bm25'. Defaults to 'tfidf'.
+            k1 (float, optional): BM25 term frequency saturation. Defaults to 1.5.
+            b (float, optional): BM25 document length normalization. Defaults to 0.75.
+        """
+        if method not in ('tfidf', 'bm25'):
+            raise ValueError(f"Unsupported lexical scoring method: {method}")
+        
+        self.method = method
+        self.k1 = k1
+        self.b = b
+        self.vectorizer = None
+        self.idf = None
+        self.avg_doc_length = 0.0
+    
+    @property
+    def is_fitted(self):
+        """bool: Whether the scorer has been fitted on a corpus."""
+        return self.vectorizer is not None
+    
+    def fit(self, corpus):
+        """
+        Fit the vocabulary and term weights on a corpus of documents.
+        
+        Args:
+            corpus (list): List of document texts
+        
+        Returns:
+            LexicalScorer: The fitted scorer
+        """
+        corpus = [text for text in corpus if text]
+        if not corpus:
+            raise ValueError("Cannot fit lexical scorer on an empty corpus")
+        
+        # scikit-learn is imported on first fit, keeping it out of the analyzer's import time
+        from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+        
+        if self.method == 'tfidf':
+            self.vectorizer = TfidfVectorizer(preprocessor=preprocess_text, stop_words='english', sublinear_tf=True)
+            self.vectorizer.fit(corpus)
+            self.idf = self.vectorizer.idf_
+        else:
+            self.vectorizer = CountVectorizer(preprocessor=preprocess_text, stop_words='english')
+            counts = self.vectorizer.fit_transform(corpus)
+            
+            # Okapi BM25 idf, shifted to stay positive for very common terms
+            doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+            n_docs = counts.shape[0]
+            self.idf = np.log((n_docs - doc_freq + 0.5) / (doc_freq + 0.5) + 1.0)
+            self.avg_doc_length = float(counts.sum()) / n_docs
+        
+        logger.info(f"Fitted {self.method} lexical scorer on {len(corpus)} documents "
+                    f"({len(self.vectorizer.vocabulary_)} terms)")
+        return self
+    
+    def transform_documents(self, texts):
+        """
+        Convert documents to L2-normalized sparse term-weight vectors.
+        
+        Args:
+            texts (list): List of document texts
+        
+        Returns:
+            scipy.sparse.csr_matrix: Matrix with one row per document
+        """
+        if not self.is_fitted:
+            raise RuntimeError("LexicalScorer must be fitted before scoring")
+        
+        texts = [text if text else "" for text in texts]
+        
+        if self.method == 'tfidf':
+            return self.vectorizer.transform(texts)
+        
+        from sklearn.preprocessing import normalize
+        
+        # BM25 saturated term frequencies, applied to the stored counts in place
+        counts = self.vectorizer.transform(texts).astype(np.float64).tocsr()
+        doc_lengths = np.asarray(counts.sum(axis=1)).ravel()
+        length_norm = self.k1 * (1 - self.b + self.b * doc_lengths / (self.avg_doc_length or 1.0))
+        row_norm = np.repeat(length_norm, np.diff(counts.indptr))
+        counts.data = counts.data * (self.k1 + 1) / (counts.data + row_norm) * self.idf[counts.indices]
+        return normalize(counts, norm='l2', copy=False)
+    
+    def transform_queries(self, texts):
+        """
+        Convert queries (e.g. job descriptions) to L2-normalized sparse vectors.
+        
+        Args:
+            texts (list): List of query texts
+        
+        Returns:
+            scipy.sparse.csr_matrix: Matrix with one row per query
+        """
+        if not self.is_fitted:
+            raise RuntimeError("LexicalScorer must be fitted before scoring")
+        
+        if self.method == 'tfidf':
+            return self.transform_documents(texts)
+        
+        from sklearn.preprocessing import normalize
+        
+        # BM25 queries weight each distinct term by its idf only
+        counts = self.vectorizer.transform([text if text else "" for text in texts]).astype(np.float64).tocsr()
+        counts.data = self.idf[counts.indices]
+        return normalize(counts, norm='l2', copy=False)
+    
+    def score(self, query, texts):
+        """
+        Score many documents against one query with a single sparse product.
+        
+        Args:
+            query (str): Query text, e.g. the job description
+            texts (list): List of document texts
+        
+        Returns:
+            numpy.ndarray: Cosine relevance scores between 0 and 1, one per document
+        """
+        if not texts:
+            return np.zeros(0)
+        
+        query_vector = self.transform_queries([query])
+        doc_matrix = self.transform_documents(texts)
+        return np.asarray((doc_matrix @ query_vector.T).todense()).ravel()
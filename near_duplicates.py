@@ -0,0 +1,192 @@
+import re
+import zlib
+import logging
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Universal hashing parameters for MinHash permutations
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+WORD_PATTERN = re.compile(r'\w+')
+
+class NearDuplicateIndex:
+    """Incremental MinHash/LSH index clustering near-duplicate documents such as resubmitted resumes."""
+    
+    def __init__(self, threshold=0.8, num_perm=128, bands=16, shingle_size=5, seed=1):
+        """
+        Initialize NearDuplicateIndex.
+        
+        Args:
+            threshold (float, optional): Minimum estimated Jaccard similarity of word shingles between a
+                document and a cluster's representative for the document to join it. Defaults to 0.8.
+            num_perm (int, optional): Number of MinHash permutations per signature. Defaults to 128.
+            bands (int, optional): Number of LSH bands; must divide num_perm. Defaults to 16.
+            shingle_size (int, optional): Number of words per shingle. Defaults to 5.
+            seed (int, optional): Seed of the hash permutations. Defaults to 1.
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        
+        # Coefficients below 2**32 keep a * x + b within 64 bits for 32-bit shingle hashes
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        
+        self.signatures = {}
+        self._buckets = [{} for _ in range(bands)]
+        self._representatives = {}
+        self._order = {}
+    
+    def __len__(self):
+        return len(self.signatures)
+    
+    def __contains__(self, doc_id):
+        return doc_id in self.signatures
+    
+    def shingle_hashes(self, text):
+        """
+        Hash the distinct word shingles of a text.
+        
+        Args:
+            text (str): Document text
+        
+        Returns:
+            numpy.ndarray: 32-bit shingle hashes as uint64
+        """
+        words = WORD_PATTERN.findall((text or '').lower())
+        if len(words) < self.shingle_size:
+            shingles = {' '.join(words)} if words else set()
+        else:
+            shingles = {' '.join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+        
+        return np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+                           dtype=np.uint64, count=len(shingles))
+    
+    def signature(self, text):
+        """
+        Compute the MinHash signature of a text.
+        
+        Args:
+            text (str): Document text
+        
+        Returns:
+            numpy.ndarray: Signature of num_perm uint32 values
+        """
+        hashes = self.shingle_hashes(text)
+        if not len(hashes):
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        
+        # All permutations of all shingles in one vectorized pass
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return (permuted.min(axis=0) & _MAX_HASH).astype(np.uint32)
+    
+    def similarity(self, doc_id, other_id):
+        """
+        Estimate the Jaccard similarity of two indexed documents.
+        
+        Args:
+            doc_id: First document id
+            other_id: Second document id
+        
+        Returns:
+            float: Fraction of matching signature values
+        """
+        return np.count_nonzero(self.signatures[doc_id] == self.signatures[other_id]) / self.num_perm
+    
+    def insert(self, doc_id, text):
+        """
+        Add a document, joining the cluster whose representative it is most similar to.
+        
+        A document joins a cluster only if it meets the threshold against the cluster's
+        representative, never through a chain of members: if A is close to B and B to C,
+        C only joins A's cluster when it is itself close to A. Clusters never merge.
+        
+        Args:
+            doc_id: Hashable document id, e.g. a content hash or file name
+            text (str): Document text, e.g. the parsed resume's full_text
+        
+        Returns:
+            The id of the cluster representative (the earliest inserted member)
+        """
+        if doc_id in self.signatures:
+            return self.representative(doc_id)
+        
+        signature = self.signature(text)
+        self.signatures[doc_id] = signature
+        self._order[doc_id] = len(self._order)
+        
+        # Documents sharing any band are candidates; buckets hold an id, or a list once shared
+        candidates = set()
+        for band, bucket in enumerate(self._buckets):
+            key = hash(signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            entry = bucket.get(key)
+            if entry is None:
+                bucket[key] = doc_id
+            elif isinstance(entry, list):
+                candidates.update(entry)
+                entry.append(doc_id)
+            else:
+                candidates.add(entry)
+                bucket[key] = [entry, doc_id]
+        
+        # Verify the candidates' representatives against the full signature; ties keep the earliest
+        best, best_similarity = doc_id, -1.0
+        for representative in sorted({self._representatives[other_id] for other_id in candidates}, key=self._order.get):
+            similarity = self.similarity(doc_id, representative)
+            if similarity >= self.threshold and similarity > best_similarity:
+                best, best_similarity = representative, similarity
+        
+        self._representatives[doc_id] = best
+        return best
+    
+    def insert_many(self, documents):
+        """
+        Add many documents.
+        
+        Args:
+            documents (iterable): (doc_id, text) pairs
+        
+        Returns:
+            list: Cluster representative of each document, in input order
+        """
+        representatives = [self.insert(doc_id, text) for doc_id, text in documents]
+        logger.info(f"Indexed {len(representatives)} documents for near-duplicate detection "
+                    f"({len(self.clusters())} clusters with duplicates)")
+        return representatives
+    
+    def representative(self, doc_id):
+        """
+        Get the representative of a document's cluster.
+        
+        Args:
+            doc_id: Indexed document id
+        
+        Returns:
+            The id of the cluster's first inserted member
+        """
+        return self._representatives[doc_id]
+    
+    def clusters(self, min_size=2):
+        """
+        Group indexed documents by cluster.
+        
+        Args:
+            min_size (int, optional): Smallest cluster size to report. Defaults to 2.
+        
+        Returns:
+            dict: Dictionary mapping each representative to its members, in insertion order
+        """
+        groups = {}
+        for doc_id, representative in self._representatives.items():
+            groups.setdefault(representative, []).append(doc_id)
+        return {rep: members for rep, members in groups.items() if len(members) >= min_size}
\ No newline at end of file
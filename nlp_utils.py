@@ -1,36 +1,102 @@
 import re
-import nltk
-import spacy
+import threading
+import numpy as np
 import logging
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Download necessary NLTK data
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('wordnet', quiet=True)
-except Exception as e:
-    logger.warning(f"Error downloading NLTK resources: {str(e)}")
-
-# Initialize spaCy model
-try:
-    nlp = spacy.load("en_core_web_lg")
-except OSError:
-    logger.warning("Spacy model 'en_core_web_lg' not found. Using 'en_core_web_sm' instead.")
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        logger.error("No spaCy models found. Please install using: python -m spacy download en_core_web_lg")
-        nlp = None
-
-# Initialize lemmatizer
-lemmatizer = WordNetLemmatizer()
+# spaCy and NLTK are imported and loaded on first use, so importing this module stays cheap
+_load_lock = threading.Lock()
+_nlp = None
+
+# A spaCy Language is not guaranteed to be thread-safe, so every call into the shared
+# pipeline holds this lock; threads still overlap everything outside those calls
+NLP_LOCK = threading.RLock()
+_nlp_loaded = False
+_word_tokenize = None
+_lemmatizer = None
+_stop_words = None
+
+def load_nlp():
+    """
+    Get the spaCy pipeline, loading it on first use.
+    
+    Returns:
+        spacy.Language: The loaded pipeline, or None if no model is installed
+    """
+    global _nlp, _nlp_loaded
+    
+    if _nlp_loaded:
+        return _nlp
+    
+    with _load_lock:
+        if not _nlp_loaded:
+            import spacy
+            
+            # Initialize spaCy model
+            try:
+                _nlp = spacy.load("en_core_web_lg")
+            except OSError:
+                logger.warning("Spacy model 'en_core_web_lg' not found. Using 'en_core_web_sm' instead.")
+                try:
+                    _nlp = spacy.load("en_core_web_sm")
+                except OSError:
+                    logger.error("No spaCy models found. Please install using: python -m spacy download en_core_web_lg")
+                    _nlp = None
+            _nlp_loaded = True
+    
+    return _nlp
+
+def is_nlp_loaded():
+    """
+    Check whether a spaCy model has been loaded, without triggering the load.
+    
+    Returns:
+        bool: True if load_nlp has run and returned a model
+    """
+    return _nlp_loaded and _nlp is not None
+
+def _load_nltk():
+    """
+    Import NLTK and download its data on first use.
+    
+    Returns:
+        callable: NLTK's word_tokenize
+    """
+    global _word_tokenize, _lemmatizer
+    
+    if _word_tokenize is not None:
+        return _word_tokenize
+    
+    with _load_lock:
+        if _word_tokenize is None:
+            import nltk
+            from nltk.stem import WordNetLemmatizer
+            from nltk.tokenize import word_tokenize
+            
+            # Download necessary NLTK data
+            try:
+                nltk.download('punkt', quiet=True)
+                nltk.download('stopwords', quiet=True)
+                nltk.download('wordnet', quiet=True)
+            except Exception as e:
+                logger.warning(f"Error downloading NLTK resources: {str(e)}")
+            
+            _lemmatizer = WordNetLemmatizer()
+            _word_tokenize = word_tokenize
+    
+    return _word_tokenize
+
+def __getattr__(name):
+    # Keeps `from utils.nlp_utils import nlp` working; it loads the pipeline at that point
+    if name == 'nlp':
+        return load_nlp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Tokens for keyword matching: runs of word characters, or single punctuation marks
+MATCH_TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
 
 def preprocess_text(text):
     """
@@ -76,9 +142,15 @@ def remove_stopwords(text):
     Returns:
         str: Text with stopwords removed
     """
-    stop_words = set(stopwords.words('english'))
+    global _stop_words
+    
+    word_tokenize = _load_nltk()
+    if _stop_words is None:
+        from nltk.corpus import stopwords
+        _stop_words = set(stopwords.words('english'))
+    
     word_tokens = word_tokenize(text)
-    filtered_text = [word for word in word_tokens if word.lower() not in stop_words]
+    filtered_text = [word for word in word_tokens if word.lower() not in _stop_words]
     return ' '.join(filtered_text)
 
 def lemmatize_text(text):
@@ -91,8 +163,8 @@ def lemmatize_text(text):
     Returns:
         str: Lemmatized text
     """
-    word_tokens = word_tokenize(text)
-    lemmatized_text = [lemmatizer.lemmatize(word) for word in word_tokens]
+    word_tokens = _load_nltk()(text)
+    lemmatized_text = [_lemmatizer.lemmatize(word) for word in word_tokens]
     return ' '.join(lemmatized_text)
 
 def extract_entities(text):
@@ -105,11 +177,13 @@ def extract_entities(text):
     Returns:
         dict: Dictionary of entities by type
     """
+    nlp = load_nlp()
     if not nlp:
         logger.error("spaCy model not loaded. Cannot extract entities.")
         return {}
         
-    doc = nlp(text)
+    with NLP_LOCK:
+        doc = nlp(text)
     entities = {}
     
     for ent in doc.ents:
@@ -131,17 +205,163 @@ def calculate_similarity(text1, text2):
     Returns:
         float: Similarity score between 0 and 1
     """
+    nlp = load_nlp()
     if not nlp:
         logger.error("spaCy model not loaded. Cannot calculate similarity.")
         return 0.0
         
-    doc1 = nlp(text1)
-    doc2 = nlp(text2)
+    with NLP_LOCK:
+        doc1 = nlp(text1)
+        doc2 = nlp(text2)
     
+    return calculate_doc_similarity(doc1, doc2)
+
+def calculate_doc_similarity(doc1, doc2):
+    """
+    Calculate semantic similarity between two already processed texts.
+    
+    Accepts spaCy Docs or cached TextVectors; the result matches Doc.similarity.
+    
+    Args:
+        doc1 (spacy.tokens.Doc or TextVector): First document
+        doc2 (spacy.tokens.Doc or TextVector): Second document
+        
+    Returns:
+        float: Similarity score between 0 and 1
+    """
     if not doc1.vector_norm or not doc2.vector_norm:
         return 0.0
         
-    return doc1.similarity(doc2)
+    return (np.dot(doc1.vector, doc2.vector) / (doc1.vector_norm * doc2.vector_norm)).item()
+
+class TextVector:
+    """Cached document vector that can stand in for a spaCy Doc in similarity calculations."""
+    
+    __slots__ = ('vector', 'vector_norm')
+    
+    def __init__(self, vector, vector_norm):
+        """
+        Initialize TextVector.
+        
+        Args:
+            vector (numpy.ndarray): Document vector
+            vector_norm (float): L2 norm of the vector
+        """
+        self.vector = vector
+        self.vector_norm = vector_norm
+    
+    @classmethod
+    def from_doc(cls, doc):
+        """
+        Detach the vector of a processed Doc so the Doc itself can be released.
+        
+        Args:
+            doc (spacy.tokens.Doc): Processed document
+            
+        Returns:
+            TextVector: Cached vector
+        """
+        return cls(np.array(doc.vector), doc.vector_norm)
+
+def tokenize_for_matching(text):
+    """
+    Split text into lowercase tokens for word-boundary keyword matching.
+    
+    Args:
+        text (str): Text to tokenize
+        
+    Returns:
+        list: List of tokens
+    """
+    return MATCH_TOKEN_PATTERN.findall(text.lower()) if text else []
+
+class KeywordMatcher:
+    """Multi-keyword matcher compiled once and applied in a single pass over the text tokens."""
+    
+    def __init__(self, keywords):
+        """
+        Initialize KeywordMatcher.
+        
+        Keywords match on whole tokens only, so "ai" does not match inside "maintain".
+        
+        Args:
+            keywords (list): List of keywords to look for
+        """
+        self.keywords = list(keywords) if keywords else []
+        self.max_tokens = 0
+        
+        # Index keyword token sequences by their first token
+        self._index = {}
+        for i, keyword in enumerate(self.keywords):
+            tokens = tokenize_for_matching(keyword)
+            if tokens:
+                self._index.setdefault(tokens[0], []).append((tokens, i))
+                self.max_tokens = max(self.max_tokens, len(tokens))
+    
+    def __len__(self):
+        return len(self.keywords)
+    
+    def find_matches(self, text):
+        """
+        Find the keywords present in a text.
+        
+        Args:
+            text (str): Text to search
+            
+        Returns:
+            list: Keywords found in the text, in keyword list order
+        """
+        return self.match_tokens(tokenize_for_matching(text))
+    
+    def match_tokens(self, tokens):
+        """
+        Find the keywords present in an already tokenized text.
+        
+        Args:
+            tokens (list): Tokens from tokenize_for_matching
+            
+        Returns:
+            list: Keywords found in the tokens, in keyword list order
+        """
+        found = self.match_indices(tokens)
+        return [self.keywords[i] for i in sorted(found)]
+    
+    def match_indices(self, tokens):
+        """
+        Find the indices of keywords present in an already tokenized text.
+        
+        Args:
+            tokens (list): Tokens from tokenize_for_matching
+            
+        Returns:
+            set: Indices into self.keywords of the keywords found
+        """
+        found = set()
+        for position, token in enumerate(tokens):
+            for keyword_tokens, i in self._index.get(token, ()):
+                if tokens[position:position + len(keyword_tokens)] == keyword_tokens:
+                    found.add(i)
+        return found
+
+def process_texts(texts, batch_size=64):
+    """
+    Process many texts with a single batched spaCy nlp.pipe call.
+    
+    Args:
+        texts (iterable): Texts to process; duplicates are processed once
+        batch_size (int, optional): Number of texts per spaCy batch. Defaults to 64.
+        
+    Returns:
+        dict: Dictionary mapping each distinct text to its Doc
+    """
+    nlp = load_nlp()
+    if not nlp:
+        logger.error("spaCy model not loaded. Cannot process texts.")
+        return {}
+    
+    unique_texts = list(dict.fromkeys(text for text in texts if text))
+    with NLP_LOCK:
+        return dict(zip(unique_texts, nlp.pipe(unique_texts, batch_size=batch_size)))
 
 def extract_skills(text, skills_list):
     """
@@ -1,13 +1,11 @@
 import re
+import csv
 import logging
-import spacy
 import os
-from pathlib import Path
 from datetime import datetime
-import pandas as pd
 
-from utils.file_utils import extract_text_from_file
-from utils.nlp_utils import preprocess_text, extract_entities, nlp
+from utils.file_utils import extract_text_from_file, extract_text_from_bytes
+from utils.nlp_utils import extract_entities, load_nlp, NLP_LOCK
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -16,20 +14,35 @@ logger = logging.getLogger(__name__)
 class ResumeParser:
     """Class to parse resume data from various file formats."""
     
-    def __init__(self, skills_file=None):
+    def __init__(self, skills_file=None, taxonomy_file=None):
         """
         Initialize ResumeParser.
         
         Args:
             skills_file (str, optional): Path to CSV file containing skills. Defaults to None.
+            taxonomy_file (str, optional): Path to a skill taxonomy compiled with skill_taxonomy.py.
+                Takes precedence over skills_file and also matches aliases. Defaults to None.
         """
         self.skills = []
+        self.taxonomy = None
+        self.skill_patterns = []
+        
+        # A compiled taxonomy is memory-mapped and needs no per-skill patterns
+        if taxonomy_file:
+            try:
+                from utils.skill_taxonomy import SkillTaxonomy
+                self.taxonomy = SkillTaxonomy.load(taxonomy_file)
+                self.skills = self.taxonomy.skill_names
+                return
+            except Exception as e:
+                logger.error(f"Error loading skill taxonomy: {str(e)}")
         
         # Load skills from file if provided
         if skills_file and os.path.exists(skills_file):
             try:
-                skills_df = pd.read_csv(skills_file)
-                self.skills = skills_df['skill'].str.lower().tolist()
+                # One-column CSV with a 'skill' header; read without pandas to keep imports light
+                with open(skills_file, newline='', encoding='utf-8') as f:
+                    self.skills = [row['skill'].lower() for row in csv.DictReader(f)]
             except Exception as e:
                 logger.error(f"Error loading skills file: {str(e)}")
         
@@ -48,6 +61,12 @@ class ResumeParser:
                 'agile', 'scrum', 'kanban', 'waterfall', 'sdlc',
                 'devops', 'ci/cd', 'test automation', 'unit testing'
             ]
+        
+        # Compile the word-boundary pattern of every skill once per parser
+        self.skill_patterns = [
+            (skill, re.compile(r'\b' + re.escape(skill.lower()) + r'\b'))
+            for skill in self.skills
+        ]
     
     def extract_contact_info(self, text):
         """
@@ -100,7 +119,8 @@ class ResumeParser:
             'degree', 'university', 'college', 'institute', 'school'
         ]
         
-        doc = nlp(text)
+        with NLP_LOCK:
+            doc = load_nlp()(text)
         education = []
         
         # Split text into sentences and look for education-related sentences
@@ -127,7 +147,8 @@ class ResumeParser:
             'worked', 'working', 'responsible', 'responsibilities'
         ]
         
-        doc = nlp(text)
+        with NLP_LOCK:
+            doc = load_nlp()(text)
         experience = []
         
         # Split text into sentences and look for experience-related sentences
@@ -148,22 +169,27 @@ class ResumeParser:
         Returns:
             list: List of extracted skills
         """
+        if self.taxonomy is not None:
+            return self.taxonomy.find_skills(text)
+        
         text = text.lower()
         extracted_skills = []
         
-        for skill in self.skills:
-            skill_pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(skill_pattern, text):
+        for skill, skill_pattern in self.skill_patterns:
+            if skill_pattern.search(text):
                 extracted_skills.append(skill)
         
         return extracted_skills
     
-    def parse_resume(self, file_path):
+    def parse_resume(self, file_path, knockout_check=None):
         """
         Parse resume from file.
         
         Args:
             file_path (str): Path to resume file
+            knockout_check (callable, optional): Function taking the extracted skills and returning a
+                knock-out reason or None, e.g. SkillsAnalyzer.check_knockout_rules. Knocked-out
+                resumes skip the spaCy entity, education and experience passes. Defaults to None.
             
         Returns:
             dict: Dictionary containing extracted resume information
@@ -176,23 +202,74 @@ class ResumeParser:
         logger.info(f"Parsing resume: {file_path}")
         resume_text = extract_text_from_file(file_path)
         
+        return self._parse_resume_text(resume_text, os.path.basename(file_path), file_path, knockout_check)
+    
+    def parse_resume_bytes(self, data, filename, knockout_check=None):
+        """
+        Parse a resume held in memory, e.g. an uploaded file, without writing it to disk.
+        
+        Args:
+            data (bytes or memoryview): Raw file contents
+            filename (str): Original file name; its extension selects the text extractor
+            knockout_check (callable, optional): Function taking the extracted skills and returning a
+                knock-out reason or None, as for parse_resume. Defaults to None.
+            
+        Returns:
+            dict: Dictionary containing extracted resume information
+        """
+        logger.info(f"Parsing resume: {filename}")
+        resume_text = extract_text_from_bytes(data, filename)
+        
+        return self._parse_resume_text(resume_text, os.path.basename(filename), filename, knockout_check)
+    
+    def _parse_resume_text(self, resume_text, filename, source, knockout_check=None):
+        """
+        Parse extracted resume text.
+        
+        Args:
+            resume_text (str): Text extracted from the resume
+            filename (str): File name stored in the result
+            source (str): Path or name used in log messages
+            knockout_check (callable, optional): Knock-out check as for parse_resume. Defaults to None.
+            
+        Returns:
+            dict: Dictionary containing extracted resume information
+        """
         if not resume_text:
-            logger.error(f"Could not extract text from file: {file_path}")
+            logger.error(f"Could not extract text from file: {source}")
             return None
         
         # Create result dictionary
         result = {
-            'filename': os.path.basename(file_path),
+            'filename': filename,
             'full_text': resume_text,
             'parsed_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        # Extract entities
-        entities = extract_entities(resume_text)
-        
         # Extract contact information
         result.update(self.extract_contact_info(resume_text))
         
+        # Extract skills
+        result['skills'] = self.extract_skills_from_text(resume_text)
+        
+        # Skip the spaCy passes for candidates failing hard requirements
+        if knockout_check:
+            knockout_reason = knockout_check(result['skills'])
+            if knockout_reason:
+                # No 'name' key: the name needs the spaCy pass, and consumers default a missing name to 'Unknown'
+                result.update({
+                    'education': [],
+                    'experience': [],
+                    'organizations': [],
+                    'locations': [],
+                    'knockout_reason': knockout_reason
+                })
+                logger.info(f"Resume knocked out before NLP parsing: {source} ({knockout_reason})")
+                return result
+        
+        # Extract entities
+        entities = extract_entities(resume_text)
+        
         # Extract person name if available
         if 'PERSON' in entities and entities['PERSON']:
             result['name'] = entities['PERSON'][0]
@@ -205,9 +282,6 @@ class ResumeParser:
         # Extract experience
         result['experience'] = self.extract_experience(resume_text)
         
-        # Extract skills
-        result['skills'] = self.extract_skills_from_text(resume_text)
-        
         # Extract organizations
         if 'ORG' in entities and entities['ORG']:
             result['organizations'] = entities['ORG']
@@ -220,5 +294,5 @@ class ResumeParser:
         else:
             result['locations'] = []
         
-        logger.info(f"Successfully parsed resume: {file_path}")
+        logger.info(f"Successfully parsed resume: {source}")
         return result 
\ No newline at end of file
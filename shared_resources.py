@@ -0,0 +1,202 @@
+import os
+import sys
+import hashlib
+import logging
+import threading
+
+from utils.cache_utils import LRUCache
+from utils.nlp_utils import load_nlp, is_nlp_loaded, NLP_LOCK
+from resume_parser.parser import ResumeParser
+from skills_analyzer.analyzer import SkillsAnalyzer
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Bounds for the per-job-description analyzers shared by all sessions of this process
+ANALYZER_CACHE_MAX_ENTRIES = 256
+ANALYZER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_lock = threading.Lock()
+_nlp_warm = False
+_parsers = {}
+_job_indexes = {}
+_taxonomies = {}
+
+def _estimate_analyzer_bytes(analyzer):
+    """
+    Estimate the memory held by a cached SkillsAnalyzer.
+    
+    Args:
+        analyzer (SkillsAnalyzer): Analyzer to measure
+    
+    Returns:
+        int: Approximate size in bytes
+    """
+    size = sys.getsizeof(analyzer) + sys.getsizeof(analyzer.job_description or '')
+    size += sum(sys.getsizeof(skill) for skill in analyzer.required_skills + analyzer.preferred_skills)
+    
+    job_vector = analyzer._job_vector
+    if job_vector is not None:
+        size += job_vector.vector.nbytes
+    
+    # The taxonomy itself is memory-mapped and shared; only the gathered credit rows are per analyzer
+    for matrix in analyzer._requirement_matrices.values():
+        size += matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    
+    return size
+
+_analyzers = LRUCache(
+    max_entries=ANALYZER_CACHE_MAX_ENTRIES,
+    max_bytes=ANALYZER_CACHE_MAX_BYTES,
+    sizeof=_estimate_analyzer_bytes
+)
+
+def get_nlp():
+    """
+    Get the process-wide spaCy pipeline, loaded and warmed up on first use.
+    
+    Returns:
+        spacy.Language: The loaded pipeline, or None if no model is installed
+    """
+    global _nlp_warm
+    
+    nlp = load_nlp()
+    with _lock:
+        if not _nlp_warm and nlp is not None:
+            # The first call initializes lazily loaded pipeline components
+            with NLP_LOCK:
+                nlp("Warm up the pipeline.")
+            _nlp_warm = True
+    
+    return nlp
+
+def get_resume_parser(skills_file=None, taxonomy_file=None):
+    """
+    Get the ResumeParser shared by all sessions, with its skill patterns compiled once.
+    
+    Args:
+        skills_file (str, optional): Path to CSV file containing skills. Defaults to None.
+        taxonomy_file (str, optional): Path to a compiled skill taxonomy. Defaults to None.
+    
+    Returns:
+        ResumeParser: Shared parser
+    """
+    get_nlp()
+    
+    with _lock:
+        parser = _parsers.get((skills_file, taxonomy_file))
+        if parser is None:
+            parser = _parsers[(skills_file, taxonomy_file)] = ResumeParser(skills_file, taxonomy_file)
+            logger.info(f"Created shared resume parser ({len(parser.skills)} skills)")
+    
+    return parser
+
+def get_skill_taxonomy(path):
+    """
+    Get the compiled skill taxonomy at path, memory-mapped once per process.
+    
+    Args:
+        path (str): Path of an artifact written by build_taxonomy
+    
+    Returns:
+        SkillTaxonomy: Shared taxonomy
+    """
+    with _lock:
+        taxonomy = _taxonomies.get(path)
+        if taxonomy is None:
+            from utils.skill_taxonomy import SkillTaxonomy
+            taxonomy = _taxonomies[path] = SkillTaxonomy.load(path)
+            logger.info(f"Loaded shared skill taxonomy with {len(taxonomy)} skills from {path}")
+    
+    return taxonomy
+
+def get_skills_analyzer(job_description, required_skills=None, preferred_skills=None, similarity_backend='spacy',
+                        taxonomy_file=None):
+    """
+    Get a shared SkillsAnalyzer for a job description and skill lists.
+    
+    Analyzers are keyed by their configuration, carry the precomputed job description
+    vector and taxonomy credit rows, and are evicted least recently used first once
+    the memory budget is exceeded. Nothing is added to them after they are cached:
+    lexical scoring fits a model per call. Shared analyzers must be treated as
+    read-only; use a private SkillsAnalyzer when adding knock-out rules or calling
+    fit_lexical_model.
+    
+    Args:
+        job_description (str): Job description text
+        required_skills (list, optional): List of required skills. Defaults to None.
+        preferred_skills (list, optional): List of preferred skills. Defaults to None.
+        similarity_backend (str, optional): 'spacy' or 'lexical'. Defaults to 'spacy'.
+        taxonomy_file (str, optional): Path to a compiled skill taxonomy giving partial skill
+            credit. Defaults to None (exact matches only).
+    
+    Returns:
+        SkillsAnalyzer: Shared analyzer
+    """
+    required_skills = tuple(required_skills or [])
+    preferred_skills = tuple(preferred_skills or [])
+    key = (
+        hashlib.sha1((job_description or '').encode('utf-8')).hexdigest(),
+        required_skills,
+        preferred_skills,
+        similarity_backend,
+        taxonomy_file
+    )
+    
+    def build():
+        get_nlp()
+        analyzer = SkillsAnalyzer(
+            job_description=job_description,
+            required_skills=list(required_skills),
+            preferred_skills=list(preferred_skills),
+            similarity_backend=similarity_backend,
+            skill_taxonomy=get_skill_taxonomy(taxonomy_file) if taxonomy_file else None
+        )
+        # Precompute per-job state now, so the memory estimate taken when caching covers it
+        analyzer.get_job_vector()
+        analyzer.prepare_skill_credits()
+        logger.info("Created shared skills analyzer for a new job description")
+        return analyzer
+    
+    return _analyzers.get_or_create(key, build)
+
+def get_job_index(path):
+    """
+    Get the job index saved at path, loading it once per process and again only when the file changes.
+    
+    Args:
+        path (str): Path of an index written by JobIndex.save
+    
+    Returns:
+        JobIndex: Shared index, or None if the file does not exist
+    """
+    if not os.path.exists(path):
+        return None
+    
+    # scipy and joblib come with the job index, so apps that never open one do not import them
+    from utils.job_matrix import JobIndex
+    
+    modified = os.path.getmtime(path)
+    with _lock:
+        cached = _job_indexes.get(path)
+        if cached is None or cached[0] != modified:
+            cached = _job_indexes[path] = (modified, JobIndex.load(path))
+    
+    return cached[1]
+
+def resource_stats():
+    """
+    Report what the shared resource layer currently holds.
+    
+    Returns:
+        dict: Dictionary with the parser count, pipeline state and analyzer cache metrics
+    """
+    return {
+        'nlp_loaded': is_nlp_loaded(),
+        'nlp_warm': _nlp_warm,
+        'parsers': len(_parsers),
+        'job_indexes': len(_job_indexes),
+        'skill_taxonomies': len(_taxonomies),
+        'analyzers': _analyzers.stats()
+    }
\ No newline at end of file
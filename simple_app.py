@@ -1,10 +1,9 @@
 import streamlit as st
 import pandas as pd
-import os
-import tempfile
-import json
 import re
 
+from utils.file_utils import decode_text_bytes
+
 # Set page config
 st.set_page_config(
     page_title="AI Resume & Interview Analyzer",
@@ -54,8 +53,6 @@ if 'required_skills' not in st.session_state:
     st.session_state.required_skills = []
 if 'preferred_skills' not in st.session_state:
     st.session_state.preferred_skills = []
-if 'temp_dir' not in st.session_state:
-    st.session_state.temp_dir = tempfile.mkdtemp()
 if 'interview_responses' not in st.session_state:
     st.session_state.interview_responses = []
 if 'interview_questions' not in st.session_state:
@@ -104,13 +101,8 @@ def parse_job_description(uploaded_file):
     if not uploaded_file:
         return None
     
-    file_path = os.path.join(st.session_state.temp_dir, uploaded_file.name)
-    with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
-    
-    # Read file content
-    with open(file_path, "r") as f:
-        job_description = f.read()
+    # Read file content from memory
+    job_description = decode_text_bytes(uploaded_file.getbuffer())
     
     job_title, extracted_skills = extract_from_job_description(job_description)
     
@@ -128,11 +120,6 @@ def process_resume_files(uploaded_files):
         return
     
     for file in uploaded_files:
-        # Save uploaded file to temp directory
-        file_path = os.path.join(st.session_state.temp_dir, file.name)
-        with open(file_path, "wb") as f:
-            f.write(file.getbuffer())
-        
         # Create dummy resume data
         resume_data = {
             'filename': file.name,
@@ -0,0 +1,556 @@
+"""
+Compile a skill taxonomy into a memory-mapped artifact and match skills against it.
+
+Build the artifact from the project root with:
+    python -m utils.skill_taxonomy skills.csv skills.taxonomy
+
+Matching uses a table of 64-bit phrase hashes instead of a matcher automaton: each
+skill name and alias is hashed over its tokens, and every token window of a text is
+looked up with searchsorted. Two different phrases of the same length that share a
+hash would be reported as a match; with 64-bit hashes this is very unlikely but not
+impossible, so the matcher can in principle return a false positive.
+
+Skill names are stored lowercased, as ResumeParser does for the skills CSV, so
+find_skills returns lowercase canonical names whatever the casing in the CSV.
+"""
+import os
+import csv
+import json
+import mmap
+import hashlib
+import logging
+import argparse
+import numpy as np
+
+from utils.nlp_utils import tokenize_for_matching
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Artifact layout: magic, header length (uint32), JSON header, then 64-byte aligned arrays
+TAXONOMY_MAGIC = b'SKTAXNMY'
+TAXONOMY_FORMAT_VERSION = 2
+_ALIGNMENT = 64
+
+# Partial credit toward a required skill from a held descendant (per level) or related skill
+DEFAULT_DESCENDANT_CREDIT = 0.8
+DEFAULT_RELATED_CREDIT = 0.5
+DEFAULT_MIN_CREDIT = 0.25
+
+# Base of the polynomial hash combining token hashes into a phrase hash (wraps modulo 2**64)
+_PHRASE_MULTIPLIER = np.uint64(0x100000001B3)
+
+def _token_hash(token):
+    """Stable 64-bit hash of one token, identical across processes and builds."""
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def hash_tokens(tokens):
+    """
+    Hash a token sequence, hashing each distinct token once.
+    
+    Args:
+        tokens (list): Tokens from tokenize_for_matching
+    
+    Returns:
+        numpy.ndarray: uint64 token hashes
+    """
+    hashes = {}
+    for token in tokens:
+        if token not in hashes:
+            hashes[token] = _token_hash(token)
+    return np.fromiter((hashes[token] for token in tokens), dtype=np.uint64, count=len(tokens))
+
+def phrase_hash(tokens):
+    """
+    Hash a token sequence the way SkillTaxonomy hashes text windows.
+    
+    Args:
+        tokens (list): Tokens of one skill name or alias
+    
+    Returns:
+        int: 64-bit phrase hash
+    """
+    value = np.uint64(0)
+    with np.errstate(over='ignore'):
+        for token_hash in hash_tokens(tokens):
+            value = value * _PHRASE_MULTIPLIER + token_hash
+    return int(value)
+
+def _split_list(value):
+    """Split a '|' separated CSV cell into its stripped, non-empty entries."""
+    return [item.strip() for item in (value or '').split('|') if item.strip()]
+
+def read_taxonomy_csv(csv_path):
+    """
+    Read skills, aliases, categories and relations from a CSV file.
+    
+    The file needs a 'skill' column; optional 'aliases', 'category', 'parents' and
+    'related' columns are used when present ('|' separated lists), so the plain
+    one-column skills.csv also works. Parents and related skills are referenced by
+    name or alias.
+    
+    Args:
+        csv_path (str): Path to the taxonomy CSV
+    
+    Returns:
+        list: List of (skill, aliases, category, parents, related) tuples, first occurrence of each skill kept
+    """
+    entries = []
+    seen = set()
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            skill = (row.get('skill') or '').strip().lower()
+            if not skill or skill in seen:
+                continue
+            seen.add(skill)
+            aliases = [alias.lower() for alias in _split_list(row.get('aliases'))]
+            parents = [parent.lower() for parent in _split_list(row.get('parents'))]
+            related = [other.lower() for other in _split_list(row.get('related'))]
+            entries.append((skill, aliases, (row.get('category') or '').strip() or None, parents, related))
+    return entries
+
+def _credit_closure(parents, related, descendant_credit, related_credit, min_credit):
+    """
+    Precompute the partial credit every held skill earns toward every other skill.
+    
+    A skill earns descendant_credit ** d toward its ancestor d levels up, so "pytorch"
+    counts toward "deep learning" and, less, toward "machine learning"; ancestors
+    below min_credit are dropped to keep the matrix sparse. Related skills earn
+    related_credit toward each other. Each skill earns full credit toward itself.
+    
+    Args:
+        parents (list): Parent skill ids of each skill
+        related (list): (skill id, skill id) pairs of related skills
+        descendant_credit (float): Credit per hierarchy level
+        related_credit (float): Credit between related skills
+        min_credit (float): Smallest credit kept
+    
+    Returns:
+        tuple: (indptr, indices, data) of the CSR matrix with one row per required skill
+            and one column per held skill
+    """
+    credits = {}
+    for child in range(len(parents)):
+        # Breadth-first up the hierarchy, so each ancestor gets its shortest-path credit
+        credits[child, child] = 1.0
+        seen = {child}
+        frontier = [child]
+        credit = descendant_credit
+        while frontier and credit >= min_credit:
+            next_frontier = []
+            for node in frontier:
+                for parent in parents[node]:
+                    if parent not in seen:
+                        seen.add(parent)
+                        credits[parent, child] = credit
+                        next_frontier.append(parent)
+            frontier = next_frontier
+            credit *= descendant_credit
+    
+    if related_credit >= min_credit:
+        for skill_id, other_id in related:
+            for pair in ((skill_id, other_id), (other_id, skill_id)):
+                credits[pair] = max(credits.get(pair, 0.0), related_credit)
+    
+    ordered = sorted(credits.items())
+    rows = np.array([row for (row, _), _ in ordered], dtype=np.int32)
+    indptr = np.searchsorted(rows, np.arange(len(parents) + 1)).astype(np.int32)
+    indices = np.array([column for (_, column), _ in ordered], dtype=np.int32)
+    data = np.array([credit for _, credit in ordered], dtype=np.float32)
+    return indptr, indices, data
+
+def build_taxonomy(entries, output_path, descendant_credit=DEFAULT_DESCENDANT_CREDIT,
+                   related_credit=DEFAULT_RELATED_CREDIT, min_credit=DEFAULT_MIN_CREDIT):
+    """
+    Compile taxonomy entries into a memory-mappable artifact.
+    
+    Every skill name and alias is tokenized like KeywordMatcher and reduced to a
+    phrase hash. Hashes are grouped by token count and sorted, so matching a text
+    becomes one searchsorted lookup per phrase length. The transitive closure of the
+    skill hierarchy is stored as a sparse credit matrix (see _credit_closure).
+    
+    Args:
+        entries (list): List of (skill, aliases, category, parents, related) tuples, e.g. from read_taxonomy_csv
+        output_path (str): Path of the artifact to write
+        descendant_credit (float, optional): Credit per hierarchy level. Defaults to DEFAULT_DESCENDANT_CREDIT.
+        related_credit (float, optional): Credit between related skills. Defaults to DEFAULT_RELATED_CREDIT.
+        min_credit (float, optional): Smallest credit kept. Defaults to DEFAULT_MIN_CREDIT.
+    
+    Returns:
+        dict: The artifact header
+    """
+    # Only a skill itself (or one of its aliases) may earn full credit toward a requirement
+    if not 0 < descendant_credit < 1 or not 0 <= related_credit < 1:
+        raise ValueError("descendant_credit must be in (0, 1) and related_credit in [0, 1)")
+    
+    category_ids = {}
+    skill_categories = []
+    terms = {}
+    for skill_id, (skill, aliases, category, _, _) in enumerate(entries):
+        skill_categories.append(category_ids.setdefault(category, len(category_ids)) if category else -1)
+        for term in [skill] + aliases:
+            tokens = tokenize_for_matching(term)
+            if tokens:
+                # A term shared by several skills keeps the first one
+                terms.setdefault((len(tokens), phrase_hash(tokens)), skill_id)
+    
+    # Relations may name a skill by any of its terms; unknown names are skipped
+    def resolve(names):
+        ids = []
+        for name in names:
+            tokens = tokenize_for_matching(name)
+            skill_id = terms.get((len(tokens), phrase_hash(tokens))) if tokens else None
+            if skill_id is None:
+                logger.warning(f"Skipping unknown skill '{name}' in taxonomy relations")
+            else:
+                ids.append(skill_id)
+        return ids
+    
+    parents = [resolve(entry[3]) for entry in entries]
+    related = [(skill_id, other_id) for skill_id, entry in enumerate(entries) for other_id in resolve(entry[4])]
+    credit_indptr, credit_indices, credit_data = _credit_closure(
+        parents, related, descendant_credit, related_credit, min_credit)
+    
+    max_length = max((length for length, _ in terms), default=0)
+    ordered = sorted(terms.items())
+    term_hashes = np.array([term_hash for (_, term_hash), _ in ordered], dtype=np.uint64)
+    term_skill_ids = np.array([skill_id for _, skill_id in ordered], dtype=np.uint32)
+    
+    # length_offsets[n]:length_offsets[n + 1] is the slice of terms with n tokens
+    term_lengths = np.array([length for (length, _), _ in ordered], dtype=np.int64)
+    length_offsets = np.searchsorted(term_lengths, np.arange(max_length + 2)).astype(np.int64)
+    
+    arrays = {
+        'term_hashes': term_hashes,
+        'term_skill_ids': term_skill_ids,
+        'length_offsets': length_offsets,
+        'skill_categories': np.array(skill_categories, dtype=np.int32),
+        'credit_indptr': credit_indptr,
+        'credit_indices': credit_indices,
+        'credit_data': credit_data,
+        'skill_names': np.frombuffer('\n'.join(entry[0] for entry in entries).encode('utf-8'), dtype=np.uint8),
+        'category_names': np.frombuffer('\n'.join(category_ids).encode('utf-8'), dtype=np.uint8)
+    }
+    
+    header = {
+        'version': TAXONOMY_FORMAT_VERSION,
+        'skills': len(entries),
+        'terms': len(ordered),
+        'max_length': max_length,
+        'relations': sum(len(ids) for ids in parents) + len(related),
+        'credits': {'descendant': descendant_credit, 'related': related_credit, 'min': min_credit},
+        'arrays': {}
+    }
+    
+    # Array offsets depend on the header size, so lay out against a generous fixed header block
+    offset = _ALIGNMENT * (1 + (len(json.dumps({**header, 'arrays': {name: {
+        'dtype': array.dtype.str, 'count': int(array.size), 'offset': 10 ** 12} for name, array in arrays.items()}}))
+        + len(TAXONOMY_MAGIC) + 4) // _ALIGNMENT)
+    for name, array in arrays.items():
+        header['arrays'][name] = {'dtype': array.dtype.str, 'count': int(array.size), 'offset': offset}
+        offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+    
+    header_bytes = json.dumps(header).encode('utf-8')
+    with open(output_path, 'wb') as f:
+        f.write(TAXONOMY_MAGIC)
+        f.write(len(header_bytes).to_bytes(4, 'little'))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.write(b'\0' * (header['arrays'][name]['offset'] - f.tell()))
+            f.write(array.tobytes())
+    
+    logger.info(f"Compiled {len(entries)} skills ({len(ordered)} terms, {len(credit_data)} credit entries) "
+                f"into {output_path}")
+    return header
+
+class SkillTaxonomy:
+    """Skill taxonomy loaded from a compiled artifact, matched with vectorized hash lookups."""
+    
+    def __init__(self, header, arrays, buffer=None, path=None):
+        """
+        Initialize SkillTaxonomy. Use SkillTaxonomy.load to open an artifact.
+        
+        Args:
+            header (dict): Artifact header
+            arrays (dict): Arrays of the artifact, usually views into the memory map
+            buffer (mmap.mmap, optional): Memory map backing the arrays. Defaults to None.
+            path (str, optional): Artifact path, used to reopen the taxonomy after pickling. Defaults to None.
+        """
+        self.header = header
+        self.path = path
+        self.max_length = header['max_length']
+        self.term_hashes = arrays['term_hashes']
+        self.term_skill_ids = arrays['term_skill_ids']
+        self.length_offsets = arrays['length_offsets']
+        self.skill_categories = arrays['skill_categories']
+        self._skill_names_blob = arrays['skill_names']
+        self._category_names_blob = arrays['category_names']
+        self._credit_arrays = (arrays['credit_data'], arrays['credit_indices'], arrays['credit_indptr'])
+        self._skill_names = None
+        self._name_ids = None
+        self._category_names = None
+        self._credit_matrix = None
+        self._buffer = buffer
+    
+    def __len__(self):
+        return self.header['skills']
+    
+    def __reduce__(self):
+        # Memory maps cannot be pickled; reopen the artifact instead (e.g. inside a saved JobIndex)
+        if self.path is None:
+            raise TypeError("Only taxonomies opened with SkillTaxonomy.load can be pickled")
+        return (SkillTaxonomy.load, (self.path,))
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Memory-map a compiled taxonomy artifact.
+        
+        Args:
+            path (str): Path of an artifact written by build_taxonomy
+        
+        Returns:
+            SkillTaxonomy: The loaded taxonomy
+        """
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if buffer[:len(TAXONOMY_MAGIC)] != TAXONOMY_MAGIC:
+            raise ValueError(f"{path} is not a compiled skill taxonomy")
+        
+        header_start = len(TAXONOMY_MAGIC) + 4
+        header_length = int.from_bytes(buffer[len(TAXONOMY_MAGIC):header_start], 'little')
+        header = json.loads(buffer[header_start:header_start + header_length].decode('utf-8'))
+        if header.get('version') != TAXONOMY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported skill taxonomy version {header.get('version')}; rebuild the artifact")
+        
+        arrays = {
+            name: np.frombuffer(buffer, dtype=np.dtype(spec['dtype']), count=spec['count'], offset=spec['offset'])
+            for name, spec in header['arrays'].items()
+        }
+        return cls(header, arrays, buffer, path)
+    
+    @property
+    def skill_names(self):
+        """list: Canonical skill names, indexed by skill id."""
+        if self._skill_names is None:
+            text = self._skill_names_blob.tobytes().decode('utf-8')
+            self._skill_names = text.split('\n') if text else []
+        return self._skill_names
+    
+    @property
+    def category_names(self):
+        """list: Category names, indexed by category id."""
+        if self._category_names is None:
+            text = self._category_names_blob.tobytes().decode('utf-8')
+            self._category_names = text.split('\n') if text else []
+        return self._category_names
+    
+    def category_of(self, skill_id):
+        """
+        Get the category of a skill.
+        
+        Args:
+            skill_id (int): Skill id
+        
+        Returns:
+            str: Category name, or None if the skill has none
+        """
+        category_id = int(self.skill_categories[skill_id])
+        return self.category_names[category_id] if category_id >= 0 else None
+    
+    @property
+    def credit_matrix(self):
+        """scipy.sparse.csr_matrix: Credit of each held skill (column) toward each required skill (row)."""
+        if self._credit_matrix is None:
+            from scipy import sparse
+            self._credit_matrix = sparse.csr_matrix(self._credit_arrays, shape=(len(self), len(self)), copy=False)
+        return self._credit_matrix
+    
+    def skill_id(self, term):
+        """
+        Look up the skill a name or alias refers to.
+        
+        Args:
+            term (str): Skill name or alias
+        
+        Returns:
+            int: Skill id, or None if the term is not in the taxonomy
+        """
+        # Canonical names, as returned by find_skills, skip the hashing
+        if self._name_ids is None:
+            self._name_ids = {name: skill_id for skill_id, name in enumerate(self.skill_names)}
+        skill_id = self._name_ids.get(term)
+        if skill_id is not None:
+            return skill_id
+        
+        tokens = tokenize_for_matching(term)
+        if not tokens or len(tokens) > self.max_length:
+            return None
+        
+        start, end = self.length_offsets[len(tokens)], self.length_offsets[len(tokens) + 1]
+        table = self.term_hashes[start:end]
+        target = np.uint64(phrase_hash(tokens))
+        position = int(np.searchsorted(table, target))
+        if position < len(table) and table[position] == target:
+            return int(self.term_skill_ids[start + position])
+        return None
+    
+    def bitsets(self, skill_lists):
+        """
+        Encode skill lists as binary rows over the taxonomy, ignoring unknown skills.
+        
+        Args:
+            skill_lists (list): One list of skill names or aliases per candidate
+        
+        Returns:
+            scipy.sparse.csr_matrix: Candidate-by-skill matrix of ones
+        """
+        from scipy import sparse
+        
+        rows, cols = [], []
+        for row, skills in enumerate(skill_lists):
+            skill_ids = {self.skill_id(skill) for skill in skills or []}
+            skill_ids.discard(None)
+            rows.extend([row] * len(skill_ids))
+            cols.extend(skill_ids)
+        
+        return sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)),
+                                 shape=(len(skill_lists), len(self)))
+    
+    def requirement_matrix(self, skills):
+        """
+        Gather the credit rows of a list of required skills, for use with max_credits.
+        
+        Args:
+            skills (list): Required skill names or aliases
+        
+        Returns:
+            scipy.sparse.csr_matrix: Requirement-by-skill credit matrix; unknown skills get empty rows
+        """
+        from scipy import sparse
+        
+        rows, cols = [], []
+        for row, skill in enumerate(skills):
+            skill_id = self.skill_id(skill)
+            if skill_id is not None:
+                rows.append(row)
+                cols.append(skill_id)
+        
+        selector = sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)),
+                                     shape=(len(skills), len(self)))
+        return (selector @ self.credit_matrix).tocsr()
+    
+    def max_credits(self, skill_lists, requirement_matrix):
+        """
+        Credit of each candidate toward each requirement: the best credit of any held skill.
+        
+        A max-aggregating sparse product of the candidates' skill bitsets with the
+        requirement credit matrix. Credits from different held skills are not added, so
+        two related skills never add up to an exact match. Runs vectorized over the
+        whole pool: every (candidate, held skill) pair expands to the nonzero entries of
+        that skill's column in the requirement matrix, then each (candidate, requirement) keeps
+        its maximum.
+        
+        Args:
+            skill_lists (list): One list of skill names or aliases per candidate
+            requirement_matrix (scipy.sparse.spmatrix): Matrix from requirement_matrix; pass it
+                in CSC form when reused, to skip the conversion
+        
+        Returns:
+            scipy.sparse.csr_matrix: Candidate-by-requirement credits between 0 and 1
+        """
+        from scipy import sparse
+        
+        columns = requirement_matrix.tocsc()
+        held = self.bitsets(skill_lists)
+        shape = (held.shape[0], columns.shape[0])
+        
+        # Requirement entries reachable from each held skill
+        candidates = np.repeat(np.arange(held.shape[0]), np.diff(held.indptr))
+        starts = columns.indptr[held.indices]
+        lengths = columns.indptr[held.indices + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return sparse.csr_matrix(shape, dtype=np.float32)
+        
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(total)
+        keys = np.repeat(candidates, lengths).astype(np.int64) * shape[1] + columns.indices[offsets]
+        values = columns.data[offsets]
+        
+        # Sort by (candidate, requirement), highest credit first, and keep the first of each run
+        order = np.lexsort((-values, keys))
+        keys, values = keys[order], values[order]
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = keys[1:] != keys[:-1]
+        keys, values = keys[first], values[first]
+        
+        return sparse.csr_matrix((values, (keys // shape[1], keys % shape[1])), shape=shape)
+    
+    def match_ids(self, text):
+        """
+        Find the skills mentioned in a text by name or alias.
+        
+        Args:
+            text (str): Text to search
+        
+        Returns:
+            numpy.ndarray: Sorted ids of the skills found
+        """
+        token_hashes = hash_tokens(tokenize_for_matching(text))
+        found = []
+        
+        # Hashes of all windows of n tokens, extended by one token per pass
+        windows = token_hashes
+        with np.errstate(over='ignore'):
+            for length in range(1, min(self.max_length, len(token_hashes)) + 1):
+                if length > 1:
+                    windows = windows[:-1] * _PHRASE_MULTIPLIER + token_hashes[length - 1:]
+                
+                start, end = self.length_offsets[length], self.length_offsets[length + 1]
+                if start == end:
+                    continue
+                
+                table = self.term_hashes[start:end]
+                positions = np.minimum(np.searchsorted(table, windows), len(table) - 1)
+                hits = positions[table[positions] == windows]
+                found.append(self.term_skill_ids[start:end][hits])
+        
+        if not found:
+            return np.zeros(0, dtype=np.uint32)
+        return np.unique(np.concatenate(found))
+    
+    def find_skills(self, text):
+        """
+        Find the canonical names of the skills mentioned in a text.
+        
+        Args:
+            text (str): Text to search
+        
+        Returns:
+            list: Skill names in taxonomy order
+        """
+        names = self.skill_names
+        return [names[skill_id] for skill_id in self.match_ids(text)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a skills taxonomy CSV into a binary matcher artifact.")
+    parser.add_argument('csv_path', help="CSV with a 'skill' column and optional 'aliases', 'category', "
+                                         "'parents' and 'related' columns")
+    parser.add_argument('output_path', help="Path of the compiled artifact")
+    parser.add_argument('--descendant-credit', type=float, default=DEFAULT_DESCENDANT_CREDIT,
+                        help="Credit a skill earns toward its parent, compounded per level")
+    parser.add_argument('--related-credit', type=float, default=DEFAULT_RELATED_CREDIT,
+                        help="Credit related skills earn toward each other")
+    parser.add_argument('--min-credit', type=float, default=DEFAULT_MIN_CREDIT,
+                        help="Smallest partial credit stored")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.csv_path):
+        parser.error(f"{args.csv_path} does not exist")
+    build_taxonomy(read_taxonomy_csv(args.csv_path), args.output_path, descendant_credit=args.descendant_credit,
+                   related_credit=args.related_credit, min_credit=args.min_credit)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,124 @@
+import math
+from collections import Counter
+
+class RunningStats:
+    """Streaming count, mean, variance and quantiles for one metric, mergeable across processes."""
+    
+    def __init__(self, resolution=0.1):
+        """
+        Initialize RunningStats.
+        
+        Args:
+            resolution (float, optional): Bin width of the quantile histogram. Quantiles are exact
+                up to this resolution and memory is bounded by the value range divided by it.
+                Defaults to 0.1.
+        """
+        self.resolution = resolution
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.histogram = Counter()
+    
+    def add(self, value):
+        """
+        Add one observation (Welford's online update).
+        
+        Args:
+            value (float): Observed value
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.histogram[round(value / self.resolution)] += 1
+    
+    def merge(self, other):
+        """
+        Merge statistics collected elsewhere, e.g. in another worker process.
+        
+        Args:
+            other (RunningStats): Statistics to fold into this instance
+        
+        Returns:
+            RunningStats: This instance
+        """
+        if other.resolution != self.resolution:
+            raise ValueError("Cannot merge RunningStats with different resolutions")
+        
+        if not other.count:
+            return self
+        
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            self.histogram = Counter(other.histogram)
+            return self
+        
+        # Chan et al. parallel combination of mean and squared deviations
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.histogram.update(other.histogram)
+        return self
+    
+    @property
+    def variance(self):
+        """float: Population variance of the observations."""
+        return self.m2 / self.count if self.count else 0.0
+    
+    @property
+    def std(self):
+        """float: Population standard deviation of the observations."""
+        return math.sqrt(self.variance)
+    
+    def quantile(self, q):
+        """
+        Estimate a quantile from the histogram.
+        
+        Args:
+            q (float): Quantile between 0 and 1
+        
+        Returns:
+            float: Value at the quantile, or None without observations
+        """
+        if not self.count:
+            return None
+        
+        target = q * (self.count - 1)
+        seen = 0
+        for bin_index in sorted(self.histogram):
+            seen += self.histogram[bin_index]
+            if seen > target:
+                return round(bin_index * self.resolution, 6)
+        return self.max
+    
+    def to_dict(self, quantiles=(0.25, 0.5, 0.75, 0.9)):
+        """
+        Summarize the statistics.
+        
+        Args:
+            quantiles (tuple, optional): Quantiles to report. Defaults to (0.25, 0.5, 0.75, 0.9).
+        
+        Returns:
+            dict: Dictionary with count, mean, std, min, max and the requested quantiles
+        """
+        summary = {
+            'count': self.count,
+            'mean': round(self.mean, 2) if self.count else None,
+            'std': round(self.std, 2) if self.count else None,
+            'min': self.min,
+            'max': self.max
+        }
+        for q in quantiles:
+            summary[f'p{int(round(q * 100))}'] = self.quantile(q)
+        return summary
\ No newline at end of file
@@ -0,0 +1,33 @@
+import io
+
+import pytest
+
+from utils.file_utils import iter_json_array
+
+def read_array(text, chunk_size=65536):
+    return list(iter_json_array(io.StringIO(text), chunk_size=chunk_size))
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 65536])
+def test_iter_json_array_across_chunk_boundaries(chunk_size):
+    text = ' [ {"a": [1, 2]}, -35.0 , "x,]", true,null ] \n'
+    
+    assert read_array(text, chunk_size) == [{'a': [1, 2]}, -35.0, 'x,]', True, None]
+
+def test_iter_json_array_empty_arrays():
+    assert read_array('[]') == []
+    assert read_array(' [ ] ') == []
+    assert read_array('') == []
+
+@pytest.mark.parametrize('text', ['[1 2]', '[1,]', '[,1]', '[1]]', '[1,,2]', '[1] 2', '[]]', '[1', '{"a": 1}'])
+@pytest.mark.parametrize('chunk_size', [1, 65536])
+def test_iter_json_array_rejects_malformed_arrays(text, chunk_size):
+    with pytest.raises(ValueError):
+        read_array(text, chunk_size)
+
+def test_iter_json_array_rejects_truncated_scalar():
+    with pytest.raises(ValueError):
+        read_array('[1, -35.', chunk_size=3)
+
+def test_iter_json_array_bounds_the_element_buffer():
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('["' + 'x' * 100), chunk_size=10, max_element_size=50))
\ No newline at end of file
@@ -0,0 +1,22 @@
+from interview_analyzer.interview_analyzer import InterviewAnalyzer
+
+def test_batch_clarity_matches_single_answer_clarity():
+    analyzer = InterviewAnalyzer()
+    answers = ['Hello world. Fine!', '...', '', '!? .', '  ', 'a.b', 'One sentence without a terminator']
+    
+    assert analyzer.calculate_clarity_scores(answers) == [analyzer.calculate_clarity_score(answer) for answer in answers]
+
+def test_batch_clarity_without_any_word():
+    analyzer = InterviewAnalyzer()
+    
+    assert analyzer.calculate_clarity_scores(['...']) == [analyzer.calculate_clarity_score('...')]
+    assert analyzer.calculate_clarity_scores(['', '']) == [0, 0]
+    assert analyzer.calculate_clarity_scores(['?!', '   ', '']) == [analyzer.calculate_clarity_score('?!'),
+                                                                    analyzer.calculate_clarity_score('   '), 0]
+
+def test_interview_with_punctuation_only_answer():
+    analyzer = InterviewAnalyzer()
+    result = analyzer.analyze_interview([{'question': 'q', 'answer': '...'}])
+    
+    assert result['question_count'] == 1
+    assert result['detailed_results'][0]['clarity_score'] == analyzer.calculate_clarity_score('...')
\ No newline at end of file
@@ -0,0 +1,43 @@
+import numpy as np
+
+from utils.job_matrix import MultiJobScorer
+
+JOBS = [
+    {'id': 'backend', 'job_description': 'Python developer building data pipelines and web services',
+     'required_skills': ['python', 'sql'], 'preferred_skills': ['aws']},
+    {'id': 'frontend', 'job_description': 'Java web developer building user interfaces',
+     'required_skills': ['java'], 'preferred_skills': []}
+]
+
+FIRST_POOL = [
+    {'name': 'A', 'skills': ['java'], 'experience': ['Java web developer'], 'education': []}
+]
+
+SECOND_POOL = [
+    {'name': 'B', 'skills': ['python'], 'experience': ['Python developer building data pipelines'],
+     'education': ['BSc Computer Science']},
+    {'name': 'C', 'skills': ['java', 'sql'], 'experience': ['Built web services and user interfaces in Java'],
+     'education': ['MSc Software Engineering']}
+]
+
+def test_lexical_relevance_is_fitted_per_pool():
+    scorer = MultiJobScorer(JOBS, similarity_backend='lexical')
+    scorer.score_relevance(FIRST_POOL)
+    experience, education = scorer.score_relevance(SECOND_POOL)
+    
+    fresh_experience, fresh_education = MultiJobScorer(JOBS, similarity_backend='lexical').score_relevance(SECOND_POOL)
+    
+    assert scorer.lexical_scorer is None
+    np.testing.assert_array_equal(experience, fresh_experience)
+    np.testing.assert_array_equal(education, fresh_education)
+
+def test_fitted_lexical_model_is_reused():
+    scorer = MultiJobScorer(JOBS, similarity_backend='lexical')
+    scorer.fit_lexical_model(FIRST_POOL + SECOND_POOL)
+    experience, _ = scorer.score_relevance(SECOND_POOL)
+    
+    fresh = MultiJobScorer(JOBS, similarity_backend='lexical')
+    fresh_experience, _ = fresh.score_relevance(SECOND_POOL)
+    
+    assert scorer.lexical_scorer is not None
+    assert not np.array_equal(experience, fresh_experience)
@@ -1,10 +1,14 @@
 import streamlit as st
 import pandas as pd
-import os
-import tempfile
-import json
 import re
 
+from utils.file_utils import decode_text_bytes, extract_text_from_bytes
+from utils.shared_resources import get_job_index, get_resume_parser
+
+# Open positions ranked for candidates when present; build it from the project root with
+#   python -m utils.job_matrix build jobs.json job_index.joblib
+JOB_INDEX_PATH = "job_index.joblib"
+
 # Set page config
 st.set_page_config(
     page_title="AI Resume & Interview Analyzer",
@@ -117,12 +121,31 @@ if 'required_skills' not in st.session_state:
     st.session_state.required_skills = []
 if 'preferred_skills' not in st.session_state:
     st.session_state.preferred_skills = []
-if 'temp_dir' not in st.session_state:
-    st.session_state.temp_dir = tempfile.mkdtemp()
 if 'interview_responses' not in st.session_state:
     st.session_state.interview_responses = []
 if 'interview_questions' not in st.session_state:
     st.session_state.interview_questions = []
+if 'candidate_resume' not in st.session_state:
+    st.session_state.candidate_resume = None
+if 'results_version' not in st.session_state:
+    st.session_state.results_version = 0
+if 'view_cache' not in st.session_state:
+    st.session_state.view_cache = {}
+    st.session_state.view_cache_version = 0
+
+def bump_results_version():
+    """Mark the resume results as changed so cached tables are rebuilt."""
+    st.session_state.results_version += 1
+
+def cached_view(name, build):
+    """Return a table built for the current results version, building it only when missing."""
+    if st.session_state.view_cache_version != st.session_state.results_version:
+        st.session_state.view_cache = {}
+        st.session_state.view_cache_version = st.session_state.results_version
+    
+    if name not in st.session_state.view_cache:
+        st.session_state.view_cache[name] = build()
+    return st.session_state.view_cache[name]
 
 def extract_from_job_description(job_description):
     """Extract job title and skills from job description."""
@@ -213,13 +236,21 @@ def show_candidate_interface():
         
         if uploaded_file:
             if st.button("Analyze My Resume", type="primary"):
-                if not st.session_state.job_description:
+                if not st.session_state.job_description and get_job_index(JOB_INDEX_PATH) is None:
                     st.error("Please upload a job description first to analyze your resume against.")
                 else:
                     try:
-                        # Process resume and show results
+                        # Process resume and show results; without a job description only open positions are ranked
                         process_resume_files([uploaded_file])
-                        analyze_resumes()
+                        
+                        # Open positions are ranked on the actual parse of the candidate's resume
+                        if get_job_index(JOB_INDEX_PATH) is not None:
+                            st.session_state.candidate_resume = get_resume_parser().parse_resume_bytes(
+                                uploaded_file.getvalue(), uploaded_file.name
+                            )
+                        
+                        if st.session_state.job_description:
+                            analyze_resumes()
                         st.success("Your resume has been analyzed successfully!")
                         st.rerun()
                     except Exception as e:
@@ -249,6 +280,19 @@ def show_candidate_interface():
                 # Display details for the first resume
                 if st.session_state.parsed_resumes:
                     display_resume_details(st.session_state.parsed_resumes[0])
+        
+        # Rank all open positions for the candidate against the precomputed job index
+        job_index = get_job_index(JOB_INDEX_PATH)
+        if job_index is not None and st.session_state.candidate_resume:
+            st.markdown("<h3>Open Positions That Fit You</h3>", unsafe_allow_html=True)
+            matches = job_index.rank_jobs(st.session_state.candidate_resume, top_k=10)
+            st.dataframe(pd.DataFrame([{
+                'Position': match['title'] or match['job_id'],
+                'Overall Score': match['overall_score'],
+                'Skills Match': match['skills_score'],
+                'Experience Match': match['experience_score'],
+                'Education Match': match['education_score']
+            } for match in matches]), use_container_width=True)
     
     with tab2:
         st.markdown("<h2 class='sub-header'>Interview Practice</h2>", unsafe_allow_html=True)
@@ -396,25 +440,8 @@ def parse_job_description(uploaded_file):
         return None
     
     try:
-        file_path = os.path.join(st.session_state.temp_dir, uploaded_file.name)
-        with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
-        # Try different encodings
-        encodings = ['utf-8', 'latin-1', 'iso-8859-1']
-        job_description = None
-        
-        for encoding in encodings:
-            try:
-                with open(file_path, "r", encoding=encoding) as f:
-                    job_description = f.read()
-                break
-            except UnicodeDecodeError:
-                continue
-        
-        if job_description is None:
-            st.error("Error: Could not read the file with any supported encoding. Please save the file as UTF-8 and try again.")
-            return None
+        # Decode the upload in memory; UTF-8 with a Latin-1 fallback
+        job_description = decode_text_bytes(uploaded_file.getbuffer())
         
         job_title, extracted_skills = extract_from_job_description(job_description)
         
@@ -436,25 +463,11 @@ def process_resume_files(uploaded_files):
     
     for file in uploaded_files:
         try:
-            # Save uploaded file to temp directory
-            file_path = os.path.join(st.session_state.temp_dir, file.name)
-            with open(file_path, "wb") as f:
-                f.write(file.getbuffer())
+            # Extract the resume text in memory, without a temp file
+            resume_content = extract_text_from_bytes(file.getbuffer(), file.name)
             
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'iso-8859-1']
-            resume_content = None
-            
-            for encoding in encodings:
-                try:
-                    with open(file_path, "r", encoding=encoding) as f:
-                        resume_content = f.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if resume_content is None:
-                st.error(f"Error: Could not read the resume file {file.name} with any supported encoding. Please save the file as UTF-8 and try again.")
+            if not resume_content:
+                st.error(f"Error: Could not read the resume file {file.name}. Please upload a PDF, DOCX or UTF-8 text file.")
                 continue
             
             # Create resume data
@@ -487,6 +500,7 @@ def process_resume_files(uploaded_files):
                 # Add new resume
                 st.session_state.parsed_resumes.append(resume_data)
             
+            bump_results_version()
             st.success(f"Successfully parsed resume: {file.name}")
         except Exception as e:
             st.error(f"Error processing resume {file.name}: {str(e)}")
@@ -521,11 +535,29 @@ def analyze_resumes():
             resume['education_score'] = 90
             resume['missing_required_skills'] = required_skills[3:]  # Set missing required skills
         
+        bump_results_version()
         st.success(f"Successfully analyzed {len(st.session_state.parsed_resumes)} resumes.")
         st.rerun()  # Force a rerun to show the results
     except Exception as e:
         st.error(f"Error during resume analysis: {str(e)}")
 
+def build_ranking_table():
+    """Build the candidate rankings table from the parsed resumes, sorted by overall score."""
+    df = pd.DataFrame([{
+        'Name': r.get('name', 'Unknown'),
+        'Overall Score': r.get('overall_score', 0),
+        'Skills Match': r.get('skills_match', {}).get('score', 0),
+        'Experience Match': r.get('experience_score', 0),
+        'Education Match': r.get('education_score', 0),
+        'Missing Required Skills': len(r.get('missing_required_skills', []))
+    } for r in st.session_state.parsed_resumes])
+    
+    if not df.empty:
+        # Sort by overall score
+        df = df.sort_values(by='Overall Score', ascending=False)
+    
+    return df
+
 def show_resume_analysis_tab():
     """Display resume analysis content with error handling."""
     st.markdown("<h2 class='sub-header'>Resume Analysis</h2>", unsafe_allow_html=True)
@@ -571,27 +603,21 @@ def show_resume_analysis_tab():
     if st.session_state.parsed_resumes:
         st.markdown("<h3>Analysis Results</h3>", unsafe_allow_html=True)
         
-        # Create dataframe from analyzed resumes
-        df = pd.DataFrame([{
-            'Name': r.get('name', 'Unknown'),
-            'Overall Score': r.get('overall_score', 0),
-            'Skills Match': r.get('skills_match', {}).get('score', 0),
-            'Experience Match': r.get('experience_score', 0),
-            'Education Match': r.get('education_score', 0),
-            'Missing Required Skills': len(r.get('missing_required_skills', []))
-        } for r in st.session_state.parsed_resumes])
+        # Rankings table and candidate list are rebuilt only when the results change
+        df = cached_view('ranking_table', build_ranking_table)
+        candidate_names = cached_view(
+            'candidate_names',
+            lambda: [r.get('name', 'Unknown') for r in st.session_state.parsed_resumes]
+        )
         
         if not df.empty:
-            # Sort by overall score
-            df = df.sort_values(by='Overall Score', ascending=False)
-            
             # Table of candidates
             st.dataframe(df, use_container_width=True)
             
             # Detailed view for selected candidate
             selected_candidate = st.selectbox(
                 "Select a candidate to view details",
-                options=[r.get('name', 'Unknown') for r in st.session_state.parsed_resumes],
+                options=candidate_names,
                 index=0
             )
             
@@ -948,6 +974,7 @@ def main():
             if st.button("Change Role", help="Switch between candidate and HR views"):
                 # Clear all session state data when changing roles
                 st.session_state.parsed_resumes = []
+                bump_results_version()
                 st.session_state.job_description = ""
                 st.session_state.job_title = ""
                 st.session_state.required_skills = []
@@ -959,6 +986,7 @@ def main():
             
             if st.button("Reset All", help="Clear all data and start fresh"):
                 st.session_state.parsed_resumes = []
+                bump_results_version()
                 st.session_state.job_description = ""
                 st.session_state.job_title = ""
                 st.session_state.required_skills = []
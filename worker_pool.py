@@ -0,0 +1,258 @@
+import gc
+import os
+import json
+import logging
+import argparse
+import multiprocessing
+
+from utils.nlp_utils import remove_stopwords, lemmatize_text
+from utils.shared_resources import get_nlp, get_resume_parser
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Parser loaded in the parent and inherited by forked workers
+_parser = None
+
+def preload_shared_resources(skills_file=None, taxonomy_file=None):
+    """
+    Load everything workers share before forking, then freeze it out of the garbage collector.
+    
+    The spaCy pipeline, the compiled skill matchers and the NLTK corpora are warmed
+    with the collector disabled. gc.freeze then moves every live object to the
+    permanent generation, so collections in the workers do not write to those
+    objects. It does not stop reference-count updates: any object a worker touches
+    still gets its page copied. Large numpy buffers such as the spaCy vector table
+    stay shared because their data is never refcounted, but the Python objects of
+    the pipeline are copied as workers use them. How much remains shared with a
+    real model (e.g. en_core_web_lg) has not been measured; use
+    PreforkWorkerPool.memory_report to check it in a deployment.
+    
+    A compiled skill taxonomy avoids the problem for skill matching: its arrays are
+    memory-mapped from the artifact, so every worker reads the same page-cache pages
+    and no per-skill Python objects exist to be refcounted.
+    
+    Args:
+        skills_file (str, optional): Path to CSV file containing skills. Defaults to None.
+        taxonomy_file (str, optional): Path to a compiled skill taxonomy used instead of the
+            skills CSV for matching. Defaults to None.
+    
+    Returns:
+        ResumeParser: The shared parser
+    """
+    global _parser
+    
+    gc.disable()
+    try:
+        get_nlp()
+        _parser = get_resume_parser(skills_file, taxonomy_file)
+        
+        # NLTK corpora load lazily on first use; load them here instead of once per worker
+        try:
+            lemmatize_text(remove_stopwords("Warm up the corpora."))
+        except LookupError as e:
+            logger.warning(f"NLTK resources unavailable before fork: {str(e)}")
+    finally:
+        gc.freeze()
+        gc.enable()
+    
+    logger.info(f"Froze {gc.get_freeze_count()} objects shared with forked workers")
+    return _parser
+
+def memory_usage(pid=None):
+    """
+    Read how much of a process's memory is shared, from /proc/<pid>/smaps_rollup (Linux).
+    
+    Args:
+        pid (int, optional): Process id. Defaults to None (this process).
+    
+    Returns:
+        dict: Dictionary with 'rss', 'pss', 'shared' and 'private' in bytes, or None if unavailable
+    """
+    path = f"/proc/{pid or os.getpid()}/smaps_rollup"
+    try:
+        with open(path) as f:
+            fields = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == 'kB':
+                    fields[parts[0].rstrip(':')] = int(parts[1]) * 1024
+    except OSError:
+        return None
+    
+    return {
+        'rss': fields.get('Rss', 0),
+        'pss': fields.get('Pss', 0),
+        'shared': fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0),
+        'private': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    }
+
+def _init_worker(worker_pids):
+    """
+    Start a forked worker; the inherited resources are already loaded and frozen.
+    
+    Args:
+        worker_pids (multiprocessing.SimpleQueue): Queue receiving this worker's pid for memory_report
+    """
+    worker_pids.put(os.getpid())
+    logger.info(f"Worker {os.getpid()} ready")
+
+def _parse_task(item):
+    """
+    Parse one resume in a worker with the inherited parser.
+    
+    Args:
+        item (tuple): (data, filename) of an uploaded file
+    
+    Returns:
+        tuple: (filename, resume data or None, error message or None)
+    """
+    data, filename = item
+    try:
+        return filename, _parser.parse_resume_bytes(data, filename), None
+    except Exception as e:
+        logger.error(f"Error parsing resume {filename}: {str(e)}")
+        return filename, None, str(e)
+
+class PreforkWorkerPool:
+    """Process pool whose workers are forked after the model and skill matchers are loaded once."""
+    
+    def __init__(self, processes=None, skills_file=None, taxonomy_file=None, maxtasksperchild=None):
+        """
+        Initialize PreforkWorkerPool.
+        
+        Create the pool early in the service, before starting other threads: forking a
+        process while other threads hold locks can leave the workers deadlocked.
+        
+        Args:
+            processes (int, optional): Number of workers. Defaults to None (CPU count).
+            skills_file (str, optional): Path to CSV file containing skills. Defaults to None.
+            taxonomy_file (str, optional): Path to a compiled skill taxonomy, memory-mapped and
+                shared by all workers. Defaults to None.
+            maxtasksperchild (int, optional): Tasks after which a worker is replaced by a fresh
+                fork of the parent. Defaults to None (workers live as long as the pool).
+        """
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Pre-fork worker pools need the 'fork' start method, which this platform lacks")
+        
+        preload_shared_resources(skills_file, taxonomy_file)
+        self.processes = processes or os.cpu_count()
+        
+        # Every worker, including replacements, reports its pid here when it starts
+        context = multiprocessing.get_context('fork')
+        self._worker_pid_queue = context.SimpleQueue()
+        self._worker_pids = set()
+        self._pool = context.Pool(
+            self.processes,
+            initializer=_init_worker,
+            initargs=(self._worker_pid_queue,),
+            maxtasksperchild=maxtasksperchild
+        )
+        logger.info(f"Started pre-fork pool with {self.processes} workers")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def parse_resumes(self, files, chunksize=1):
+        """
+        Parse resumes on the workers, yielding each result as soon as it is ready.
+        
+        Args:
+            files (iterable): (data, filename) pairs of in-memory resume files; data may be
+                bytes or any buffer such as a memoryview, which is copied to bytes for the worker
+            chunksize (int, optional): Files sent to a worker at a time. Defaults to 1.
+        
+        Returns:
+            iterator: (filename, resume data or None, error message or None) tuples in completion order
+        """
+        # memoryview (e.g. Streamlit's getbuffer) cannot be pickled to the workers
+        tasks = ((data if isinstance(data, bytes) else bytes(data), filename) for data, filename in files)
+        return self._pool.imap_unordered(_parse_task, tasks, chunksize=chunksize)
+    
+    def map(self, func, iterable, chunksize=None):
+        """
+        Apply a module-level function to every item on the workers.
+        
+        Args:
+            func (callable): Picklable function; it can use the resources loaded in the parent
+            iterable (iterable): Items to process
+            chunksize (int, optional): Items sent to a worker at a time. Defaults to None.
+        
+        Returns:
+            list: Results in input order
+        """
+        return self._pool.map(func, iterable, chunksize)
+    
+    def memory_report(self):
+        """
+        Report the memory of each worker, to check how much stays shared with the parent.
+        
+        Workers are the processes that registered their pid from the pool initializer;
+        workers that have exited are dropped.
+        
+        Returns:
+            list: List of dictionaries with the worker pid and its memory_usage fields
+        """
+        while not self._worker_pid_queue.empty():
+            self._worker_pids.add(self._worker_pid_queue.get())
+        
+        report = []
+        for pid in sorted(self._worker_pids):
+            usage = memory_usage(pid)
+            if usage is None:
+                self._worker_pids.discard(pid)
+            else:
+                report.append(dict(pid=pid, **usage))
+        return report
+    
+    def close(self):
+        """Finish outstanding tasks and stop the workers."""
+        self._pool.close()
+        self._pool.join()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Parse a directory of resumes on a pre-fork worker pool.",
+        epilog="Run from the project root as: python -m utils.worker_pool RESUME_DIR OUTPUT_PATH"
+    )
+    parser.add_argument('resume_dir', help="Directory with PDF, DOCX and TXT resumes")
+    parser.add_argument('output_path', help="JSON Lines file receiving one parsed resume per line")
+    parser.add_argument('--processes', type=int, default=None, help="Number of workers (default: CPU count)")
+    parser.add_argument('--skills-file', default=None, help="CSV file with a 'skill' column")
+    parser.add_argument('--taxonomy-file', default=None,
+                        help="Compiled skill taxonomy (python -m utils.skill_taxonomy), shared by all workers")
+    parser.add_argument('--memory-report', action='store_true', help="Log the shared and private memory of each worker")
+    args = parser.parse_args()
+    
+    paths = sorted(
+        os.path.join(args.resume_dir, name) for name in os.listdir(args.resume_dir)
+        if os.path.splitext(name)[1].lower() in ('.pdf', '.docx', '.txt')
+    )
+    
+    def read_files():
+        for path in paths:
+            with open(path, 'rb') as f:
+                yield f.read(), os.path.basename(path)
+    
+    failed = 0
+    with PreforkWorkerPool(args.processes, args.skills_file, args.taxonomy_file) as pool, open(args.output_path, 'w', encoding='utf-8') as out:
+        for filename, resume_data, error in pool.parse_resumes(read_files()):
+            if resume_data is None:
+                failed += 1
+                logger.error(f"Failed to parse {filename}: {error}")
+                continue
+            out.write(json.dumps(resume_data, default=str) + '\n')
+        
+        if args.memory_report:
+            for usage in pool.memory_report():
+                logger.info(f"Worker {usage['pid']}: {usage['shared'] // 2 ** 20} MB shared, "
+                            f"{usage['private'] // 2 ** 20} MB private")
+    
+    logger.info(f"Parsed {len(paths) - failed} of {len(paths)} resumes into {args.output_path}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file